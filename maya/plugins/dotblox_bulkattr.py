@@ -0,0 +1,47 @@
+"""Undoable command applying the attribute writes of :mod:`dotblox.core.bulkattr`
+
+The command is not meant to be called directly, use
+:class:`dotblox.core.bulkattr.AttributeWriter`.
+"""
+import maya.api.OpenMaya as om
+
+from dotblox.core import bulkattr
+
+
+def maya_useNewAPI():
+    pass
+
+
+class BulkAttrCommand(om.MPxCommand):
+    def __init__(self):
+        om.MPxCommand.__init__(self)
+        self.modifier = None
+
+    @staticmethod
+    def creator():
+        return BulkAttrCommand()
+
+    def doIt(self, args):
+        self.modifier = bulkattr.pop_pending()
+        if self.modifier is None:
+            raise RuntimeError("Nothing to write, use dotblox.core.bulkattr.AttributeWriter")
+        self.redoIt()
+
+    def redoIt(self):
+        self.modifier.doIt()
+
+    def undoIt(self):
+        self.modifier.undoIt()
+
+    def isUndoable(self):
+        return True
+
+
+def initializePlugin(plugin):
+    fn_plugin = om.MFnPlugin(plugin, "Ryan Robinson", "1.0")
+    fn_plugin.registerCommand(bulkattr.COMMAND, BulkAttrCommand.creator)
+
+
+def uninitializePlugin(plugin):
+    fn_plugin = om.MFnPlugin(plugin)
+    fn_plugin.deregisterCommand(bulkattr.COMMAND)
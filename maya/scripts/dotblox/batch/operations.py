@@ -0,0 +1,169 @@
+"""Operations that can be declared in a batch job
+
+Each operation is given the nodes matched by the job entry along with the
+remaining keys of the entry as keyword arguments.
+
+    {"op": "pivot", "nodes": "*_GEO", "axis": "y", "direction": 1}
+
+"""
+import fnmatch
+
+from maya import cmds
+
+from dotblox.core import color as colorm
+from dotblox.core import displaylayer, general, modeling, nodepath
+from dotblox.core.constant import AXIS, DIRECTION
+from dotblox.core.modeling import MIRROR_AXIS, BevelEditor
+from dotbloxlib import color as colorlib
+from dotbloxlib.color import mdc
+
+OPERATIONS = {}
+
+
+def register(name):
+    """Register the decorated function as a batch operation
+
+    Args:
+        name (str): the name used by the "op" key of a job entry
+    """
+    def wrap(func):
+        OPERATIONS[name] = func
+        return func
+    return wrap
+
+
+def get_operation(name):
+    """Get a registered operation
+
+    Raises:
+        RuntimeError: operation is not registered
+    """
+    operation = OPERATIONS.get(name)
+    if operation is None:
+        raise RuntimeError("Operation \"%s\" is not registered" % name)
+    return operation
+
+
+def match_nodes(patterns, node_type="transform"):
+    """Get the nodes in the current scene matching the given patterns
+
+    Args:
+        patterns (str|list[str]): `ls` style patterns
+        node_type (str): type of node to match
+
+    Returns:
+        list[str]: full paths of the matched nodes
+    """
+    return cmds.ls(patterns, long=True, type=node_type) or []
+
+
+@register("mirror")
+def mirror(nodes, axis=AXIS.X, direction=DIRECTION.NEGATIVE, mirror_axis=MIRROR_AXIS.OBJECT):
+    """See :func:`dotblox.core.modeling.poly_mirror`"""
+    if nodes:
+        modeling.poly_mirror(nodes,
+                             axis=axis,
+                             direction=direction,
+                             mirror_axis=mirror_axis)
+
+
+@register("pivot")
+def pivot(nodes, axis=AXIS.Y, direction=DIRECTION.NEGATIVE, center=False):
+    """See :func:`dotblox.core.general.pivot_to_bb`"""
+    if nodes:
+        general.pivot_to_bb(nodes,
+                            axis=axis,
+                            direction=direction,
+                            center=center)
+
+
+@register("bevel")
+def bevel(nodes, add=None, remove=None, bevel="*"):
+    """Edit the edges of the bevels found on the given nodes
+
+    Args:
+        add (list[str]): edges to add to the bevel `["e[0:4]", "e[8]"]`
+        remove (list[str]): edges to remove from the bevel
+        bevel (str): pattern the bevel node names must match
+    """
+    for node in nodes:
+        for bevel_node in BevelEditor.get_bevel_nodes(node):
+            if not fnmatch.fnmatch(nodepath.name(bevel_node), bevel):
+                continue
+
+            vis_node = BevelEditor.show_bevel(bevel_node)
+            try:
+                if add:
+                    BevelEditor.add_to_bevel(*[vis_node + "." + edge for edge in add])
+                if remove:
+                    BevelEditor.remove_from_bevel(*[vis_node + "." + edge for edge in remove])
+            finally:
+                BevelEditor.remove_vis_bevel(node)
+
+
+@register("colorize")
+def colorize(nodes, color, weight=mdc.Weight500, is_object=True, is_outliner=False):
+    """See :func:`dotblox.core.color.colorize`
+
+    Args:
+        color (str): a hex value `#ff0000` or a material design color name
+        weight (str): material design weight used with a color name
+    """
+    if not color.startswith("#"):
+        color = mdc.get_color(color, weight)
+
+    colorm.colorize(nodes,
+                    colorlib.color_hex_to_rgbf(color),
+                    is_object=is_object,
+                    is_outliner=is_outliner)
+
+
+@register("distinct_color")
+def distinct_color(nodes, group_by=colorm.GROUP_BY.NODE, weights=None,
+                   is_object=True, is_outliner=False):
+    """See :func:`dotblox.core.color.colorize_distinct`"""
+    colorm.colorize_distinct(nodes,
+                             group_by=group_by,
+                             weights=weights,
+                             is_object=is_object,
+                             is_outliner=is_outliner)
+
+
+@register("clear_color")
+def clear_color(nodes, is_object=True, is_outliner=False):
+    """See :func:`dotblox.core.color.clear_color`"""
+    colorm.clear_color(nodes,
+                       is_object=is_object,
+                       is_outliner=is_outliner)
+
+
+def _layers(nodes):
+    return [node for node in nodes if node != displaylayer.DEFAULT_LAYER]
+
+
+@register("colorize_layers")
+def colorize_layers(nodes, color, weight=mdc.Weight500):
+    """See :func:`dotblox.core.displaylayer.colorize`
+
+    The entry has to match display layers: `"type": "displayLayer"`.
+    The default layer is never colored.
+
+    Args:
+        color (str): a hex value `#ff0000` or a material design color name
+        weight (str): material design weight used with a color name
+    """
+    if not color.startswith("#"):
+        color = mdc.get_color(color, weight)
+    displaylayer.colorize(_layers(nodes), colorlib.color_hex_to_rgbf(color))
+
+
+@register("distinct_layer_color")
+def distinct_layer_color(nodes, weights=None):
+    """See :func:`dotblox.core.displaylayer.colorize_distinct`"""
+    displaylayer.colorize_distinct(_layers(nodes), weights=weights)
+
+
+@register("clear_layer_color")
+def clear_layer_color(nodes):
+    """See :func:`dotblox.core.displaylayer.clear_color`"""
+    displaylayer.clear_color(_layers(nodes))
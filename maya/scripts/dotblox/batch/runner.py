@@ -0,0 +1,240 @@
+"""Run a batch job over many scene files
+
+A job is a json file describing the operations to apply to every scene.
+
+    {
+        "operations": [
+            {"op": "pivot", "nodes": "*_GEO", "axis": "y", "direction": 1},
+            {"op": "colorize", "nodes": "*_GEO", "color": "red", "weight": "500"}
+        ],
+        "save": true,
+        "output": "{dirname}/{name}_batch{ext}"
+    }
+
+Every entry in "operations" requires "op". "nodes" (default "*") and
+"type" (default "transform") are used to match the nodes the operation is
+applied to. All other keys are passed to the operation.
+
+"output" is optional and is formatted with `dirname`, `name` and `ext` of
+the scene. When it is not given the scene is saved in place.
+
+Scenes are processed across a pool of processes. Each worker initializes
+its own maya session once and reuses it for every scene it is given.
+"""
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import sys
+import timeit
+import traceback
+
+FILE_TYPES = {
+    ".ma": "mayaAscii",
+    ".mb": "mayaBinary",
+}
+
+
+def initialize_session(setup=None):
+    """Initialize maya for the current process
+
+    Args:
+        setup (str): `module` or `module:function` to import/call before
+                     maya is initialized. This is how a stand-in `maya`
+                     module is provided.
+    """
+    if setup:
+        module_name, _, func_name = setup.partition(":")
+        module = importlib.import_module(module_name)
+        if func_name:
+            getattr(module, func_name)()
+
+    try:
+        import maya.standalone
+    except ImportError:
+        # A stand-in maya has been provided
+        return
+    maya.standalone.initialize(name="python")
+
+
+def output_path(path, job):
+    """Get the path the given scene is saved to
+
+    Args:
+        path (str): scene path
+        job (dict): the batch job
+
+    Returns:
+        str: save path or None if the scene is not saved
+    """
+    if not job.get("save", True):
+        return None
+    output = job.get("output")
+    if not output:
+        return path
+    dirname, basename = os.path.split(path)
+    name, ext = os.path.splitext(basename)
+    return output.format(dirname=dirname, name=name, ext=ext)
+
+
+def process_file(path, job):
+    """Open the scene, apply the operations of the job and save
+
+    Args:
+        path (str): scene path
+        job (dict): the batch job
+
+    Returns:
+        dict: the result of the file
+            path (str): scene path
+            output (str): path the scene was saved to
+            success (bool): whether all the operations succeeded
+            seconds (float): total time for the file
+            operations (list[list]): [op name, node count, seconds]
+            error (str): traceback of the failure
+    """
+    start = timeit.default_timer()
+    result = {
+        "path": path,
+        "output": None,
+        "success": False,
+        "seconds": 0.0,
+        "operations": [],
+        "error": None,
+    }
+    try:
+        # Maya is only importable once the session is initialized
+        from maya import cmds
+        from dotblox.batch import operations
+
+        cmds.file(path, open=True, force=True)
+
+        for entry in job.get("operations", []):
+            entry = dict(entry)
+            name = entry.pop("op")
+            patterns = entry.pop("nodes", "*")
+            node_type = entry.pop("type", "transform")
+
+            operation = operations.get_operation(name)
+            op_start = timeit.default_timer()
+            nodes = operations.match_nodes(patterns, node_type)
+            operation(nodes, **entry)
+            result["operations"].append(
+                    [name, len(nodes), timeit.default_timer() - op_start])
+
+        save_path = output_path(path, job)
+        if save_path:
+            ext = os.path.splitext(save_path)[-1].lower()
+            cmds.file(rename=save_path)
+            cmds.file(save=True, force=True, type=FILE_TYPES.get(ext, "mayaAscii"))
+            result["output"] = save_path
+
+        result["success"] = True
+    except Exception:
+        result["error"] = traceback.format_exc()
+
+    result["seconds"] = timeit.default_timer() - start
+    return result
+
+
+def _process_file_args(args):
+    # Pool.imap only passes a single argument
+    return process_file(*args)
+
+
+def run(paths, job, workers=None, setup=None, callback=None):
+    """Process the given scenes with the given job
+
+    Args:
+        paths (list[str]): scenes to process
+        job (dict): the batch job
+        workers (int): number of processes. Defaults to the cpu count.
+                       When 1 the scenes are processed in this process
+        setup (str): see :func:`initialize_session`
+        callback (func): called with the result of each file as it finishes
+
+    Returns:
+        list[dict]: results in the order they finished
+    """
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    workers = max(1, min(workers, len(paths)))
+
+    results = []
+    args = [(path, job) for path in paths]
+
+    if workers == 1:
+        initialize_session(setup)
+        iterator = map(_process_file_args, args)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers,
+                                    initializer=initialize_session,
+                                    initargs=(setup,))
+        iterator = pool.imap_unordered(_process_file_args, args)
+
+    try:
+        for result in iterator:
+            results.append(result)
+            if callback is not None:
+                callback(result)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    return results
+
+
+def format_result(result):
+    """Format a result as a single line for reporting"""
+    return "[{status}] {seconds:8.3f}s {path}".format(
+            status=" OK " if result["success"] else "FAIL",
+            seconds=result["seconds"],
+            path=result["path"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+            prog="dotblox.batch",
+            description="Apply dotblox operations to many scene files")
+    parser.add_argument("job", help="json file describing the operations")
+    parser.add_argument("scenes", nargs="+", help="scene files to process")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="number of processes (default: cpu count)")
+    parser.add_argument("--setup", default=None,
+                        help="module[:function] run in each worker before "
+                             "maya is initialized")
+    parser.add_argument("--report", default=None,
+                        help="write the results to the given json file")
+    args = parser.parse_args(argv)
+
+    with open(args.job, "r") as f:
+        job = json.load(f)
+
+    def report(result):
+        print(format_result(result))
+        if result["error"]:
+            print(result["error"])
+        sys.stdout.flush()
+
+    start = timeit.default_timer()
+    results = run(args.scenes,
+                  job,
+                  workers=args.workers,
+                  setup=args.setup,
+                  callback=report)
+    total = timeit.default_timer() - start
+
+    failed = [result for result in results if not result["success"]]
+    print("{count} files in {seconds:.3f}s, {failed} failed".format(
+            count=len(results),
+            seconds=total,
+            failed=len(failed)))
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump({"seconds": total, "results": results}, f, indent=4)
+
+    return 1 if failed else 0
@@ -0,0 +1,220 @@
+"""Bevel editor sessions of the meshes
+
+Every mesh shown in the bevel editor gets a session holding its bevels,
+the vis node, the bevel shown and the edges of each bevel as
+`dotbloxlib.intervals`. The sessions are kept in memory until another
+scene is opened.
+
+Switching bevels through a session skips the history lookup of
+`BevelEditor.show_bevel`. A session is only trusted while the node
+feeding the mesh and its bevels are unchanged, otherwise the bevels are
+listed from the history again. The edges are compared with the
+`inputComponents` of the bevel each time they are used, so edits made
+outside of the bevel editor, through `BevelEditor.add_to_bevel`, a batch
+or the Attribute Editor, are always seen.
+
+Usage:
+    session = get("|grid")
+    for bevel_node in session["bevels"]:
+        intervals.count(session_edges(session, bevel_node))
+    switch("|grid", session["bevels"][3])
+    hide("|grid")
+"""
+from maya import cmds
+import maya.api.OpenMaya as om
+
+from dotblox.core import mapi, nodepath
+from dotblox.core.modeling import BevelEditor
+from dotblox.core.profiling import profiled
+from dotbloxlib import intervals
+
+# Events after which the sessions no longer match the scene
+SESSION_EVENTS = [
+    "SceneOpened",
+    "NewSceneOpened",
+]
+
+# Cached sessions of the scene. See `get`
+_STATE = {}
+_CALLBACK_IDS = []
+
+
+def invalidate(*args):
+    """Forget the cached sessions, they are recorded again when next needed"""
+    _STATE.clear()
+
+
+def _register_callbacks():
+    if _CALLBACK_IDS:
+        return
+    for event in SESSION_EVENTS:
+        _CALLBACK_IDS.append(om.MEventMessage.addEventCallback(event, invalidate))
+
+
+def remove_callbacks():
+    """Remove the callbacks keeping the cache up to date and clear it"""
+    if _CALLBACK_IDS:
+        om.MMessage.removeCallbacks(_CALLBACK_IDS)
+        del _CALLBACK_IDS[:]
+    invalidate()
+
+
+def _sessions():
+    _register_callbacks()
+    return _STATE.setdefault("sessions", {})
+
+
+def _head(shape):
+    """Get the node feeding the mesh, a new modifier changes it"""
+    connections = cmds.listConnections(shape + ".inMesh", source=True, destination=False) or []
+    return nodepath.full_path(connections[0]) if connections else None
+
+
+def get_session(src_node):
+    """Get the session of the mesh if it still matches the scene
+
+    Args:
+        src_node (str): mesh transform
+
+    Returns:
+        dict: None if there is no session or it is stale
+    """
+    session = _sessions().get(nodepath.full_path(src_node))
+    if session is None:
+        return None
+    try:
+        head = _head(session["shape"])
+    except ValueError:
+        # The mesh was deleted
+        return None
+    bevels = session["bevels"]
+    if head != session["head"] or len(cmds.ls(bevels) or []) != len(bevels):
+        return None
+    if session["vis"] and not cmds.objExists(session["vis"]):
+        session["vis"] = None
+        session["active"] = None
+    return session
+
+
+def _read_edges(session, bevel_node):
+    """Get the edge components of the bevel, updating the session when they changed
+
+    Returns:
+        list[str]: components like e[3:6]
+    """
+    components = cmds.getAttr(bevel_node + ".inputComponents") or []
+    recorded = session["edges"].get(bevel_node)
+    if recorded is None or recorded[0] != components:
+        session["edges"][bevel_node] = (components, intervals.from_components(components))
+    return components
+
+
+@profiled("bevelsession.record")
+def record(src_node):
+    """Make the session of the mesh from its history
+
+    Args:
+        src_node (str): mesh transform
+
+    Returns:
+        dict: the session with the keys shape, head, vis, bevels, active
+              and edges, bevel node: (components, intervals)
+    """
+    src_node = nodepath.full_path(src_node)
+    shape = mapi.get_shape(src_node)
+    vis_node = BevelEditor.get_vis_node(src_node)
+    session = {
+        "shape": shape,
+        "head": _head(shape),
+        "vis": vis_node,
+        "bevels": BevelEditor.get_bevel_nodes(src_node),
+        "active": BevelEditor.get_vis_bevel(vis_node) if vis_node else None,
+        "edges": {},
+    }
+    for bevel_node in session["bevels"]:
+        _read_edges(session, bevel_node)
+    _sessions()[src_node] = session
+    return session
+
+
+def get(src_node):
+    """Get the session of the mesh, recording one if needed
+
+    The session is checked against the scene once, get it once when
+    using it for many bevels.
+
+    Returns:
+        dict: see `record`
+    """
+    return get_session(src_node) or record(src_node)
+
+
+def session_edges(session, bevel_node):
+    """Get the current edges of a bevel of the session
+
+    Returns:
+        list[int]: intervals of the edge indices
+    """
+    _read_edges(session, bevel_node)
+    return list(session["edges"][bevel_node][1])
+
+
+def get_bevels(src_node):
+    """Get the bevels of the mesh from its session
+
+    Returns:
+        list[str]: bevel nodes in order of last created
+    """
+    return list(get(src_node)["bevels"])
+
+
+def get_active(src_node):
+    """Get the bevel shown on the vis node of the mesh
+
+    Returns:
+        str: None when no bevel is shown
+    """
+    return get(src_node)["active"]
+
+
+def get_edges(src_node, bevel_node):
+    """Get the current edges of the bevel
+
+    Returns:
+        list[int]: intervals of the edge indices
+    """
+    session = get(src_node)
+    if bevel_node not in session["bevels"]:
+        return []
+    return session_edges(session, bevel_node)
+
+
+@profiled("bevelsession.switch")
+def switch(src_node, bevel_node):
+    """Show the bevel on the vis node of the mesh without going through the history
+
+    Args:
+        src_node (str): mesh transform
+        bevel_node (str): one of `get_bevels`
+
+    Returns:
+        str: the vis node
+    """
+    session = get(src_node)
+    if bevel_node not in session["bevels"]:
+        raise RuntimeError("Bevel %s is not on %s" % (bevel_node, src_node))
+    vis_node = BevelEditor.show_bevel(bevel_node,
+                                      src_node=nodepath.full_path(src_node),
+                                      edges=_read_edges(session, bevel_node))
+    session["vis"] = nodepath.full_path(vis_node)
+    session["active"] = bevel_node
+    return vis_node
+
+
+def hide(src_node):
+    """Remove the vis node of the mesh and keep its session"""
+    BevelEditor.remove_vis_bevel(src_node)
+    session = _sessions().get(nodepath.full_path(src_node))
+    if session is not None:
+        session["vis"] = None
+        session["active"] = None
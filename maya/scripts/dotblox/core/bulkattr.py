@@ -0,0 +1,170 @@
+"""Write the attributes of many nodes in a single undoable step
+
+The values are queued on one `MDGModifier` and applied by the
+`dotbloxBulkAttr` command of the `dotblox_bulkattr` plugin so maya records
+a single undo for the whole write instead of one per `setAttr`.
+
+Usage:
+    writer = AttributeWriter(filter_nodes(cmds.ls(selection=True)))
+    writer.set("overrideEnabled", True)
+    writer.set("overrideColorRGB", (1.0, 0.0, 0.0))
+    writer.apply()
+    print(writer.format_stats())
+"""
+import timeit
+
+from maya import cmds
+import maya.api.OpenMaya as om
+
+PLUGIN = "dotblox_bulkattr"
+COMMAND = "dotbloxBulkAttr"
+
+# Modifiers waiting to be picked up by the plugin command
+_PENDING = []
+
+
+def pop_pending():
+    """Get the modifier queued by :meth:`AttributeWriter.apply`
+
+    Returns:
+        om.MDGModifier: or None if nothing is queued
+    """
+    if _PENDING:
+        return _PENDING.pop()
+    return None
+
+
+def load_plugin():
+    """Load the plugin providing the undoable command
+
+    Returns:
+        bool: True if the command is available
+    """
+    if cmds.pluginInfo(PLUGIN, query=True, loaded=True):
+        return True
+    try:
+        cmds.loadPlugin(PLUGIN, quiet=True)
+    except RuntimeError:
+        return False
+    return True
+
+
+def filter_nodes(nodes, node_type="dagNode"):
+    """Filter the nodes that can be written with a single query
+
+    Args:
+        nodes (list[str]): nodes to filter
+        node_type (str): type the nodes have to inherit from
+
+    Returns:
+        list[str]: long names of the nodes of the given type
+    """
+    # An empty list would return every node of the scene
+    if not nodes:
+        return []
+    return cmds.ls(nodes, type=node_type, long=True) or []
+
+
+class AttributeWriter(object):
+    def __init__(self, nodes):
+        """Queue attribute values for the given nodes
+
+        Args:
+            nodes (list[str]): nodes which all have the attributes written.
+                               See :func:`filter_nodes`
+        """
+        self.nodes = []
+        selection = om.MSelectionList()
+        for node in nodes:
+            selection.add(node)
+        for index in range(selection.length()):
+            self.nodes.append(om.MFnDependencyNode(selection.getDependNode(index)))
+
+        self.modifier = om.MDGModifier()
+        self.plug_count = 0
+        self.seconds = 0.0
+
+    def set(self, attr, value):
+        """Queue the value of the attribute for every node
+
+        Args:
+            attr (str): attribute name
+            value (bool|int|float|list[float]): compound attributes take
+                                                a value per child
+        """
+        start = timeit.default_timer()
+        for fn_node in self.nodes:
+            plug = fn_node.findPlug(attr, False)
+            if isinstance(value, (list, tuple)):
+                for index, child_value in enumerate(value):
+                    self._queue(plug.child(index), child_value)
+            else:
+                self._queue(plug, value)
+        self.seconds += timeit.default_timer() - start
+
+    def set_many(self, attr, values):
+        """Queue a value per node
+
+        Args:
+            attr (str): attribute name
+            values (list): value of each node in the order of `nodes`
+        """
+        if len(values) != len(self.nodes):
+            raise ValueError("Expected {expected} values for {attr}, got {count}".format(
+                    expected=len(self.nodes), attr=attr, count=len(values)))
+
+        start = timeit.default_timer()
+        for fn_node, value in zip(self.nodes, values):
+            plug = fn_node.findPlug(attr, False)
+            if isinstance(value, (list, tuple)):
+                for index, child_value in enumerate(value):
+                    self._queue(plug.child(index), child_value)
+            else:
+                self._queue(plug, value)
+        self.seconds += timeit.default_timer() - start
+
+    def _queue(self, plug, value):
+        if isinstance(value, bool):
+            self.modifier.newPlugValueBool(plug, value)
+        elif isinstance(value, int):
+            self.modifier.newPlugValueInt(plug, value)
+        else:
+            self.modifier.newPlugValueDouble(plug, float(value))
+        self.plug_count += 1
+
+    def apply(self):
+        """Write the queued values
+
+        Returns:
+            int: number of plugs written
+        """
+        if not self.plug_count:
+            return 0
+
+        start = timeit.default_timer()
+        if load_plugin():
+            _PENDING.append(self.modifier)
+            try:
+                getattr(cmds, COMMAND)()
+            finally:
+                # Never leave a modifier for the next command
+                del _PENDING[:]
+        else:
+            cmds.warning("Unable to load {plugin}, the change can not be undone".format(
+                    plugin=PLUGIN))
+            self.modifier.doIt()
+        self.seconds += timeit.default_timer() - start
+        return self.plug_count
+
+    def throughput(self):
+        """Plugs written per second"""
+        if not self.seconds:
+            return 0.0
+        return self.plug_count / self.seconds
+
+    def format_stats(self):
+        return "{nodes} nodes, {plugs} plugs in {seconds:.3f}s ({rate:.0f} plugs/s)".format(
+                nodes=len(self.nodes),
+                plugs=self.plug_count,
+                seconds=self.seconds,
+                rate=self.throughput())
@@ -1,18 +1,308 @@
+import os
+
 from maya import cmds
+import maya.api.OpenMaya as om
+
+from dotblox.core import bulkattr, nodepath
+from dotblox.core.mutil import OptionVar
+from dotblox.core.profiling import profiled
+from dotbloxlib import color as colorlib
+from dotbloxlib.color import distinct, mdc, ocio, transfer
+
+
+# Cached color management preferences. See `get_color_management`
+_STATE = {}
+_CALLBACK_ID = []
+
+option_var = OptionVar("dotblox")
+
+
+def invalidate_color_management(*args):
+    """Forget the cached color management preferences"""
+    _STATE.clear()
+
+
+def remove_callbacks():
+    """Remove the callback keeping the cache up to date and clear it
+
+    Call before reloading the module, the callback is otherwise kept.
+    """
+    if _CALLBACK_ID:
+        om.MMessage.removeCallbacks(_CALLBACK_ID)
+        del _CALLBACK_ID[:]
+    invalidate_color_management()
+
+
+def get_color_management():
+    """Get the color management preferences of the scene
+
+    The preferences are cached until maya reports they changed.
+
+    Returns:
+        dict: enabled, ocio_enabled, lut
+    """
+    if not _CALLBACK_ID:
+        _CALLBACK_ID.append(om.MEventMessage.addEventCallback(
+                "colorMgtPrefsChanged", invalidate_color_management))
+
+    if not _STATE:
+        _STATE["enabled"] = bool(cmds.colorManagementPrefs(query=True, cmEnabled=True))
+        _STATE["ocio_enabled"] = bool(
+                _STATE["enabled"]
+                and cmds.colorManagementPrefs(query=True, cmConfigFileEnabled=True))
+        _STATE["lut"] = None
+
+        if _STATE["ocio_enabled"]:
+            config_path = cmds.colorManagementPrefs(query=True, configFilePath=True) or ""
+            rendering_space = cmds.colorManagementPrefs(query=True, renderingSpaceName=True)
+            # The palette colors are display referred sRGB, the name of that
+            # color space differs between configs
+            input_space = option_var.get("ocio_input_space", "sRGB")
+            try:
+                # A missing table is baked in a thread, the colors use the
+                # gamma until it is done
+                _STATE["lut"] = ocio.get_lut(os.path.expandvars(config_path),
+                                             input_space,
+                                             rendering_space,
+                                             background=True,
+                                             callback=invalidate_color_management)
+            except Exception as e:
+                cmds.warning("Unable to get the OCIO transform: {0}".format(e))
+
+            if _STATE["lut"] is None:
+                if ocio.PyOpenColorIO is not None:
+                    cmds.warning("OCIO transform is being baked. "
+                                 "2.2 Gamma is being used for color conversion until done")
+                else:
+                    cmds.warning("OCIO config enabled but its transform is not baked. "
+                                 "2.2 Gamma is being used for color conversion")
+    return _STATE
 
 
 def color_managed_convert(rgbf):
     """Convert the given color to the current workspace"""
-    cm_enabled = cmds.colorManagementPrefs(query=True, cmEnabled=True)
-    if not cm_enabled:
+    state = get_color_management()
+    if not state["enabled"]:
         return rgbf
+    if state["lut"] is not None:
+        return state["lut"].apply(rgbf)
+    return transfer.srgb_to_linear_rgb(rgbf)
+
+
+def color_managed_convert_many(colors):
+    """Convert many colors to the current workspace in one call
+
+    Args:
+        colors (list[list[float]]): raw 0-1 colors
+
+    Returns:
+        list[list[float]]:
+    """
+    state = get_color_management()
+    if not state["enabled"]:
+        return [list(color) for color in colors]
+    if state["lut"] is not None:
+        return state["lut"].apply_many(colors)
+    return transfer.srgb_to_linear_many(colors)
+
+
+@profiled("color.colorize")
+def colorize(nodes, rgbf, is_object=True, is_outliner=False):
+    """Apply the given color to the drawing override and/or outliner color
+
+    Args:
+        nodes (list[str]): nodes to color
+        rgbf (list[float]): raw 0-1 color. The drawing override
+                            receives the color managed value
+        is_object (bool): set the drawing override color
+        is_outliner (bool): set the outliner color
+
+    Returns:
+        bulkattr.AttributeWriter: the writer used
+    """
+    writer = bulkattr.AttributeWriter(bulkattr.filter_nodes(nodes))
+    if is_object:
+        writer.set("overrideEnabled", True)
+        writer.set("overrideRGBColors", True)
+        writer.set("overrideColorRGB", color_managed_convert(rgbf))
+
+    if is_outliner:
+        writer.set("useOutlinerColor", True)
+        writer.set("outlinerColor", list(rgbf))
+
+    writer.apply()
+    return writer
+
+
+def _long_names(nodes):
+    """Get the long name of each node
+
+    Only the names which are not long already are looked up.
+
+    Returns:
+        list[str]: None for a node which does not exist or is not unique
+    """
+    names = []
+    for node in nodes:
+        if node.startswith("|"):
+            names.append(node)
+            continue
+        found = cmds.ls(node, long=True) or []
+        names.append(found[0] if len(found) == 1 else None)
+    return names
+
+
+@profiled("color.colorize_many")
+def colorize_many(nodes, colors, is_object=True, is_outliner=False):
+    """Apply a color per node
+
+    Args:
+        nodes (list[str]): nodes to color
+        colors (list[list[float]]): raw 0-1 color of each node
+        is_object (bool): set the drawing override color
+        is_outliner (bool): set the outliner color
+
+    Returns:
+        bulkattr.AttributeWriter: the writer used
+    """
+    nodes = _long_names(nodes)
+    eligible = set(bulkattr.filter_nodes([node for node in nodes if node]))
+    # The writer selects a node given twice once, the last color wins
+    node_colors = {}
+    unique = []
+    for node, color in zip(nodes, colors):
+        if node not in eligible:
+            continue
+        if node not in node_colors:
+            unique.append(node)
+        node_colors[node] = tuple(color)
+    nodes = unique
+    colors = [node_colors[node] for node in nodes]
+
+    writer = bulkattr.AttributeWriter(nodes)
+    if is_object:
+        # Nodes mostly share a few colors, each is only converted once
+        distinct_colors = list(set(colors))
+        managed = dict(zip(distinct_colors, color_managed_convert_many(distinct_colors)))
+        writer.set("overrideEnabled", True)
+        writer.set("overrideRGBColors", True)
+        writer.set_many("overrideColorRGB", [managed[color] for color in colors])
+
+    if is_outliner:
+        writer.set("useOutlinerColor", True)
+        writer.set_many("outlinerColor", colors)
+
+    writer.apply()
+    return writer
+
+
+class GROUP_BY():
+    NODE = "node"
+    HIERARCHY = "hierarchy"
+    NAMESPACE = "namespace"
+    LAYER = "layer"
+
+
+def group_nodes(nodes, group_by=GROUP_BY.NODE):
+    """Group the nodes which should share a color
+
+    Args:
+        nodes (list[str]): long names of the nodes
+        group_by (str): GROUP_BY
+            node: every node is its own group
+            hierarchy: nodes are grouped under their top most ancestor in `nodes`
+            namespace: nodes are grouped by their namespace
+            layer: nodes are grouped by their display layer
+
+    Returns:
+        list[list[str]]: the groups in the order they are first found
+    """
+    if group_by == GROUP_BY.NODE:
+        return [[node] for node in nodes]
+
+    if group_by == GROUP_BY.HIERARCHY:
+        selected = set(nodes)
+
+        def get_key(node):
+            for ancestor in reversed(nodepath.ancestors(node)):
+                if ancestor in selected:
+                    return ancestor
+            return node
+    elif group_by == GROUP_BY.NAMESPACE:
+        def get_key(node):
+            if ":" not in nodepath.name(node):
+                return ""
+            return nodepath.namespace(node)
+    elif group_by == GROUP_BY.LAYER:
+        # displaylayer depends on this module
+        from dotblox.core import displaylayer
+        get_key = displaylayer.get_members().get
+    else:
+        raise ValueError("Unknown group: {0}".format(group_by))
+
+    groups = {}
+    order = []
+    for node in nodes:
+        key = get_key(node)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = []
+            order.append(group)
+        group.append(node)
+    return order
+
+
+@profiled("color.colorize_distinct")
+def colorize_distinct(nodes, group_by=GROUP_BY.NODE, weights=None,
+                      is_object=True, is_outliner=False):
+    """Give each group of nodes a palette color distinct from the other groups
+
+    Args:
+        nodes (list[str]): long names of the nodes to color
+        group_by (str): see :func:`group_nodes`
+        weights (list[str]): palette weights to pick from, all by default
+        is_object (bool): set the drawing override color
+        is_outliner (bool): set the outliner color
+
+    Returns:
+        bulkattr.AttributeWriter: the writer used
+    """
+    groups = group_nodes(nodes, group_by)
+    colors = distinct.distinct_colors(len(groups), weights)
+
+    grouped_nodes = []
+    grouped_colors = []
+    for group, (color, weight) in zip(groups, colors):
+        rgbf = colorlib.color_hex_to_rgbf(mdc.get_color(color, weight))
+        grouped_nodes.extend(group)
+        grouped_colors.extend([rgbf] * len(group))
+
+    return colorize_many(grouped_nodes, grouped_colors,
+                         is_object=is_object,
+                         is_outliner=is_outliner)
+
+
+@profiled("color.clear_color")
+def clear_color(nodes, is_object=True, is_outliner=False):
+    """Remove the color set by `colorize`
+
+    Args:
+        nodes (list[str]): nodes to clear
+        is_object (bool): clear the drawing override color
+        is_outliner (bool): clear the outliner color
 
-    # Note: maybe one day autodesk will provide us with the builtin libraries
-    #       currently this requires third party libraries
-    cm_ocio_enabled = cmds.colorManagementPrefs(query=True, cmConfigFileEnabled=True)
-    if cm_ocio_enabled:
-        cmds.warning("OCIO config enabled. 2.2 Gamma is being used for color conversion")
+    Returns:
+        bulkattr.AttributeWriter: the writer used
+    """
+    writer = bulkattr.AttributeWriter(bulkattr.filter_nodes(nodes))
+    if is_object:
+        # TODO: do we turn overrideEnabled off?
+        #       how do we know the only change was made to the color
+        #       would be really helful to add a custom attribute
+        writer.set("overrideRGBColors", False)
 
-    srgb_to_linear = lambda x: x / 12.92 if x < 0.04045 else ((x + 0.055) / 1.055) ** 2.4
+    if is_outliner:
+        writer.set("useOutlinerColor", False)
 
-    return [srgb_to_linear(i) for i in rgbf]
+    writer.apply()
+    return writer
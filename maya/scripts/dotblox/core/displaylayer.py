@@ -0,0 +1,222 @@
+"""Display layers found through the api instead of the layer editor
+
+The layers are listed once with `MItDependencyNodes` and cached until maya
+reports a layer was added, deleted or renamed or another scene was opened.
+The selected layers are the ones selected in the layer editor, queried
+once and cached until the selection or the layers change. Without a
+layer editor, in batch, they are the display layers in the selection.
+
+Usage:
+    select(["layer1", "layer2"])
+    colorize(get_selected(), [1.0, 0.0, 0.0])
+"""
+from maya import cmds
+import maya.api.OpenMaya as om
+
+from dotblox.core import bulkattr
+from dotblox.core import color as colorm
+from dotblox.core.profiling import profiled
+from dotbloxlib import color as colorlib
+from dotbloxlib.color import distinct, mdc
+
+DEFAULT_LAYER = "defaultLayer"
+LAYER_EDITOR = "LayerEditorDisplayLayerLayout"
+
+# Events after which the cached layers are stale
+LAYER_EVENTS = [
+    "displayLayerAdded",
+    "displayLayerDeleted",
+    "NameChanged",
+    "SceneOpened",
+    "NewSceneOpened",
+]
+
+# Events after which the cached selected layers are stale
+SELECTION_EVENTS = [
+    "SelectionChanged",
+    "displayLayerChange",
+    "displayLayerManagerChange",
+]
+
+# Cached layers and selected layers. See `get_layers` and `get_selected`
+_STATE = {}
+_CALLBACK_IDS = []
+
+
+def invalidate(*args):
+    """Forget the cached layers and selected layers"""
+    _STATE.clear()
+
+
+def invalidate_selection(*args):
+    """Forget the cached selected layers"""
+    _STATE.pop("selected", None)
+
+
+def _register_callbacks():
+    if _CALLBACK_IDS:
+        return
+    for event in LAYER_EVENTS:
+        _CALLBACK_IDS.append(om.MEventMessage.addEventCallback(event, invalidate))
+    for event in SELECTION_EVENTS:
+        _CALLBACK_IDS.append(om.MEventMessage.addEventCallback(event, invalidate_selection))
+
+
+def remove_callbacks():
+    """Remove the callbacks keeping the cache up to date and clear it"""
+    if _CALLBACK_IDS:
+        om.MMessage.removeCallbacks(_CALLBACK_IDS)
+        del _CALLBACK_IDS[:]
+    invalidate()
+
+
+def get_layers():
+    """Get the display layers of the scene, without the default layer
+
+    Returns:
+        list[str]:
+    """
+    _register_callbacks()
+    layers = _STATE.get("layers")
+    if layers is None:
+        layers = []
+        iterator = om.MItDependencyNodes(om.MFn.kDisplayLayer)
+        fn_node = om.MFnDependencyNode()
+        while not iterator.isDone():
+            fn_node.setObject(iterator.thisNode())
+            name = fn_node.name()
+            if name != DEFAULT_LAYER:
+                layers.append(name)
+            iterator.next()
+        _STATE["layers"] = layers
+    return list(layers)
+
+
+def _editor_selected():
+    """Get the display layers selected in the layer editor
+
+    Layers selected in the editor are not part of the maya selection.
+
+    Returns:
+        list[str]: None when there is no layer editor, in batch
+    """
+    if cmds.about(batch=True) or not cmds.layout(LAYER_EDITOR, exists=True):
+        return None
+    buttons = cmds.layout(LAYER_EDITOR, query=True, childArray=True) or []
+    return [button for button in buttons
+            if cmds.layerButton(button, query=True, select=True)]
+
+
+def get_selected():
+    """Get the selected display layers
+
+    These are the layers selected in the layer editor, or in batch the
+    display layers in the selection.
+
+    Returns:
+        list[str]:
+    """
+    _register_callbacks()
+    selected = _STATE.get("selected")
+    if selected is None:
+        selected = _editor_selected()
+        if selected is None:
+            selected = cmds.ls(selection=True, type="displayLayer") or []
+        selected = [layer for layer in selected if layer != DEFAULT_LAYER]
+        _STATE["selected"] = selected
+    return list(selected)
+
+
+def select(layers, add=False):
+    """Select the display layers
+
+    Args:
+        layers (list[str]): display layers
+        add (bool): add to the selection instead of replacing it
+    """
+    if add:
+        cmds.select(layers, add=True, noExpand=True)
+    else:
+        cmds.select(layers, replace=True, noExpand=True)
+
+
+def get_members(layers=None):
+    """Get the display layer of every node in a display layer
+
+    Args:
+        layers (list[str]): only these layers, all by default
+
+    Returns:
+        dict: long node name: display layer
+    """
+    members = {}
+    for layer in get_layers() if layers is None else layers:
+        for node in cmds.editDisplayLayerMembers(layer, query=True, fullNames=True) or []:
+            members[node] = layer
+    return members
+
+
+@profiled("displaylayer.colorize")
+def colorize(layers, rgbf):
+    """Apply the given raw 0-1 color to the display layers
+
+    Returns:
+        bulkattr.AttributeWriter: the writer used
+    """
+    writer = bulkattr.AttributeWriter(bulkattr.filter_nodes(layers, "displayLayer"))
+    # This is on by default but just in case
+    writer.set("enabled", True)
+    writer.set("overrideColorRGB", colorm.color_managed_convert(rgbf))
+    writer.set("color", 0)
+    writer.set("overrideRGBColors", True)
+    writer.apply()
+    return writer
+
+
+@profiled("displaylayer.colorize_many")
+def colorize_many(layers, colors):
+    """Apply a raw 0-1 color per display layer
+
+    Returns:
+        bulkattr.AttributeWriter: the writer used
+    """
+    eligible = set(bulkattr.filter_nodes(layers, "displayLayer"))
+    pairs = [(layer, color) for layer, color in zip(layers, colors) if layer in eligible]
+
+    writer = bulkattr.AttributeWriter([layer for layer, _ in pairs])
+    writer.set("enabled", True)
+    writer.set_many("overrideColorRGB",
+                    colorm.color_managed_convert_many([color for _, color in pairs]))
+    writer.set("color", 0)
+    writer.set("overrideRGBColors", True)
+    writer.apply()
+    return writer
+
+
+def colorize_distinct(layers, weights=None):
+    """Give every display layer a palette color distinct from the others
+
+    Args:
+        layers (list[str]): display layers
+        weights (list[str]): material design weights to pick from, all by default
+
+    Returns:
+        bulkattr.AttributeWriter: the writer used
+    """
+    colors = [colorlib.color_hex_to_rgbf(mdc.get_color(color, weight))
+              for color, weight in distinct.distinct_colors(len(layers), weights)]
+    return colorize_many(layers, colors)
+
+
+@profiled("displaylayer.clear_color")
+def clear_color(layers):
+    """Remove the color set by `colorize`
+
+    Returns:
+        bulkattr.AttributeWriter: the writer used
+    """
+    writer = bulkattr.AttributeWriter(bulkattr.filter_nodes(layers, "displayLayer"))
+    writer.set("color", 1)
+    writer.set("overrideRGBColors", False)
+    writer.apply()
+    return writer
@@ -5,8 +5,15 @@ import maya.api.OpenMaya as om
 
 from dotblox.core import mapi, nodepath
 from dotblox.core.constant import AXIS, DIRECTION
+from dotblox.core.profiling import profiled
 
+try:
+    string_types = basestring
+except NameError:
+    string_types = str
 
+
+@profiled("pivot_to_bb")
 def pivot_to_bb(nodes=None, axis=AXIS.Y, direction=DIRECTION.NEGATIVE, center=False):
     """Move the pivot of the given objects to the given direction
 
@@ -20,7 +27,7 @@ def pivot_to_bb(nodes=None, axis=AXIS.Y, direction=DIRECTION.NEGATIVE, center=Fa
         Operates on the given nodes individually not as a group
 
     """
-    if isinstance(nodes, (str, unicode)):
+    if isinstance(nodes, string_types):
         nodes = [nodes]
 
     if nodes is None:
@@ -155,6 +162,7 @@ def get_face_rotation(mesh_face, up_axis=AXIS.Y, direction=DIRECTION.POSITIVE):
     return [math.degrees(angle) for angle in transform_matrix.rotation()]
 
 
+@profiled("snap_to_mesh_face")
 def snap_to_mesh_face(mesh, driven , point, up_axis=AXIS.Y, direction=DIRECTION.POSITIVE, translate=True, rotate=True):
     """Find the closest point on the given mesh and snap and rotate the given object
     to it
@@ -6,6 +6,7 @@ import maya.api.OpenMaya as om
 from dotblox.core import nodepath, mapi
 from dotblox.core.constant import AXIS, DIRECTION
 from dotblox.core.mutil import PreserveSelection, Undoable
+from dotblox.core.profiling import profiled
 
 
 class MIRROR_AXIS():
@@ -15,6 +16,7 @@ class MIRROR_AXIS():
      ] = [x for x in range(3)]
 
 
+@profiled("poly_mirror")
 def poly_mirror(nodes=None,
                 axis=AXIS.X,
                 direction=DIRECTION.NEGATIVE,
@@ -98,32 +100,38 @@ class BevelEditor():
         if src_node:
             node = src_node
 
-        history = map(nodepath.full_path, cmds.listHistory(node) or [])
+        history = [nodepath.full_path(item) for item in cmds.listHistory(node) or []]
 
-        return filter(lambda node: cmds.nodeType(node).startswith("polyBevel"), history)
+        return [item for item in history if cmds.nodeType(item).startswith("polyBevel")]
 
     @classmethod
-    def show_bevel(cls, bevel_node):
+    @profiled("BevelEditor.show_bevel")
+    def show_bevel(cls, bevel_node, src_node=None, edges=None):
         """
         Show the given bevel
         Args:
             bevel_node: the bevel node to show
+            src_node: mesh transform of the bevel when already known,
+                skips looking it up in the history
+            edges: edges of the bevel like e[3:6] when already known,
+                skips reading them from the bevel
 
         Returns: vis_node
 
         """
-        # Make sure the bevel node is hooked up to something
-        history = cmds.listHistory(bevel_node)
-        if not history:
-            raise RuntimeError("Bevel node has no history")
+        if src_node is None:
+            # Make sure the bevel node is hooked up to something
+            history = cmds.listHistory(bevel_node)
+            if not history:
+                raise RuntimeError("Bevel node has no history")
 
-        # Last item in the history seems to be the active mesh
-        last_item = history[-1]
-        if cmds.nodeType(last_item) != "mesh":
-            raise RuntimeError("Unable to determine endpoint of bevel")
+            # Last item in the history seems to be the active mesh
+            last_item = history[-1]
+            if cmds.nodeType(last_item) != "mesh":
+                raise RuntimeError("Unable to determine endpoint of bevel")
 
-        # Always operate on the transform
-        src_node = nodepath.parent(nodepath.full_path(last_item))
+            # Always operate on the transform
+            src_node = nodepath.parent(nodepath.full_path(last_item))
 
         # Find the input mesh of the bevel node. This is the mesh we want
         #   to display
@@ -184,7 +192,7 @@ class BevelEditor():
         # Select the new node.
         cmds.select(vis_node)
 
-        cls._colorize(vis_node)
+        cls._colorize(vis_node, bevel_node, edges)
         return vis_node
 
     @classmethod
@@ -227,7 +235,7 @@ class BevelEditor():
         if not components:
             components = cmds.ls(selection=True, flatten=True, long=True)
         else:
-            components = cmds.ls(components, flatten=True)
+            components = cmds.ls(components, flatten=True, long=True)
 
         face_map = defaultdict(set)
         edge_map = defaultdict(set)
@@ -250,7 +258,7 @@ class BevelEditor():
                 cmds.warning("Component not supported %s" % component)
 
         # Get the edge perimeter of all the faces at once
-        for node, face_map in face_map.iteritems():
+        for node, face_map in face_map.items():
             edge_perimeter = cmds.polyListComponentConversion(face_map,
                                                               toEdge=True,
                                                               border=True)
@@ -260,6 +268,7 @@ class BevelEditor():
         return edge_map
 
     @classmethod
+    @profiled("BevelEditor.add_to_bevel")
     @Undoable()
     def add_to_bevel(cls, *components):
         """Add the selected/given components to the vis bevel
@@ -271,7 +280,7 @@ class BevelEditor():
         """
         edge_map = cls._eval_components(*components)
 
-        for vis_node, selected_edges in edge_map.iteritems():
+        for vis_node, selected_edges in edge_map.items():
             # Make sure the node is a vis node
             if vis_node != cls.get_vis_node(vis_node):
                 cmds.warning("Node %s is not a vis node" % vis_node)
@@ -288,6 +297,7 @@ class BevelEditor():
             cls._colorize(vis_node)
 
     @classmethod
+    @profiled("BevelEditor.remove_from_bevel")
     @Undoable()
     def remove_from_bevel(cls, *components):
         """Remove the selected/given components to the vis bevel
@@ -300,7 +310,7 @@ class BevelEditor():
         """
         edge_map = cls._eval_components(*components)
 
-        for vis_node, selected_edges in edge_map.iteritems():
+        for vis_node, selected_edges in edge_map.items():
             # Make sure the node is a vis node
             if vis_node != cls.get_vis_node(vis_node):
                 cmds.warning("Node %s is not a vis node" % vis_node)
@@ -343,19 +353,25 @@ class BevelEditor():
                      type="componentList")
 
     @classmethod
-    def _colorize(cls, node):
+    def _colorize(cls, node, bevel_node=None, edges=None):
         """"Colorize the mesh by using the crease functionality
 
         Args:
             node: can be the vis_node, bevel_node or src_node
+            bevel_node: bevel shown on the node when already known
+            edges: edges of the bevel like e[3:6] when already known
 
         """
-        bevel_node = cls.get_vis_bevel(node)
+        if bevel_node is None:
+            bevel_node = cls.get_vis_bevel(node)
         if bevel_node is None:
             raise RuntimeError("Bevel not found on %s" % node)
 
-        edges = cls.get_bevel_edges(bevel_node)
         vis_node = cls.get_vis_node(node)
+        if edges is None:
+            edges = cls.get_bevel_edges(bevel_node)
+        else:
+            edges = [vis_node + "." + edge for edge in edges]
         # Remove the crease from all the edges
         cmds.polyCrease(vis_node + ".e[:]", createHistory=False, value=0)
         # Set the crease of all the edges
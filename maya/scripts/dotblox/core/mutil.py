@@ -1,16 +1,25 @@
 import maya.cmds as cmds
 import hashlib
 
-from PySide2 import QtWidgets
-from maya import OpenMayaUI as omui1
-from shiboken2 import getCppPointer, wrapInstance
+try:
+    string_types = basestring
+except NameError:
+    string_types = str
 
 
+# Note: Qt is imported when needed so the utilities here can be used from a
+#       batch session
+
 def get_qt_fullname(widget):
+    from maya import OpenMayaUI as omui1
+    from shiboken2 import getCppPointer
     return omui1.MQtUtil.fullName(getCppPointer(widget)[0])
 
 
 def maya_main_window():
+    from PySide2 import QtWidgets
+    from maya import OpenMayaUI as omui1
+    from shiboken2 import wrapInstance
     maya_main_window = omui1.MQtUtil.mainWindow()
     return wrapInstance(long(maya_main_window), QtWidgets.QMainWindow)
 
@@ -95,7 +104,7 @@ class OptionVar(object):
         self.prefix = prefix
 
     def set(self, key, value):
-        if isinstance(value, (str, unicode)):
+        if isinstance(value, string_types):
             kwarg = "stringValue"
         elif isinstance(value, float):
             kwarg = "floatValue"
@@ -0,0 +1,242 @@
+"""Opt-in profiling of the dotblox tool entry points
+
+Decorated functions record their wall time, the number of `maya.cmds`
+calls made, the selection size and the size of the selected meshes. The
+events are written to a rolling Chrome trace file which can be opened in
+chrome://tracing or speedscope.
+
+Profiling is enabled by any of:
+    - the environment variable `DOTBLOX_PROFILE=1`
+    - the optionVar `dotblox_profile` set to 1
+    - calling :func:`enable`
+
+The trace is written to `DOTBLOX_PROFILE_PATH`, the optionVar
+`dotblox_profile_path` or `<tempdir>/dotblox_trace.json`.
+
+When disabled the decorator only adds a single flag check to each call.
+The `maya.cmds` functions are only replaced by counting ones for the
+duration of the outer most profiled call, so other tools are not
+affected. The trace is written at most every `FLUSH_INTERVAL` seconds,
+on :func:`disable` and when python exits.
+
+Usage:
+    @profiled("poly_mirror")
+    def poly_mirror():
+        pass
+"""
+import atexit
+import functools
+import os
+import tempfile
+import timeit
+import traceback
+
+from maya import cmds
+
+from dotblox.core.mutil import OptionVar
+from dotbloxlib.trace import TraceRecorder
+
+# Number of selected meshes inspected for the mesh size
+MAX_MESHES = 50
+# Seconds between writes of the trace file
+FLUSH_INTERVAL = 2.0
+
+option_var = OptionVar("dotblox")
+
+
+class _State(object):
+    enabled = False
+    recorder = None
+    depth = 0
+    counts = {}
+    # name: original cmds function
+    originals = {}
+    # name: counting cmds function
+    wrappers = {}
+    last_flush = 0.0
+    exit_registered = False
+
+
+_STATE = _State()
+
+
+def default_path():
+    """Get the trace file path from the environment or optionVar"""
+    path = os.environ.get("DOTBLOX_PROFILE_PATH") or option_var.get("profile_path")
+    if not path:
+        path = os.path.join(tempfile.gettempdir(), "dotblox_trace.json")
+    return path
+
+
+def is_enabled():
+    return _STATE.enabled
+
+
+def enable(path=None, max_events=10000):
+    """Start recording the decorated functions
+
+    Args:
+        path (str): trace file path. See :func:`default_path`
+        max_events (int): number of events kept in the trace file
+    """
+    if _STATE.enabled:
+        disable()
+    _STATE.recorder = TraceRecorder(path or default_path(), max_events=max_events)
+    _STATE.counts = {}
+    _make_wrappers()
+    if not _STATE.exit_registered:
+        atexit.register(disable)
+        _STATE.exit_registered = True
+    _STATE.enabled = True
+
+
+def disable():
+    """Stop recording and write what is left to disk"""
+    if not _STATE.enabled:
+        return
+    _STATE.enabled = False
+    _unwrap_cmds()
+    _STATE.wrappers = {}
+    _flush(force=True)
+
+
+def trace_path():
+    """Path of the current trace file or None when disabled"""
+    if _STATE.recorder is None:
+        return None
+    return _STATE.recorder.path
+
+
+def _counted(name, func):
+    def wrap(*args, **kwargs):
+        _STATE.counts[name] = _STATE.counts.get(name, 0) + 1
+        return func(*args, **kwargs)
+    wrap.__name__ = name
+    wrap.__doc__ = func.__doc__
+    return wrap
+
+
+def _make_wrappers():
+    """Make the counting functions of every cmds function, once per enable"""
+    _STATE.wrappers = {}
+    for name in dir(cmds):
+        func = getattr(cmds, name)
+        if name.startswith("_") or not callable(func) or isinstance(func, type):
+            continue
+        _STATE.wrappers[name] = _counted(name, func)
+
+
+def _wrap_cmds():
+    """Replace the cmds functions with ones that count their calls"""
+    for name, wrapper in _STATE.wrappers.items():
+        _STATE.originals[name] = getattr(cmds, name)
+        setattr(cmds, name, wrapper)
+
+
+def _unwrap_cmds():
+    for name, func in _STATE.originals.items():
+        setattr(cmds, name, func)
+    _STATE.originals = {}
+
+
+def _flush(force=False):
+    """Write the trace if it was not written within the `FLUSH_INTERVAL`"""
+    now = timeit.default_timer()
+    if not force and now - _STATE.last_flush < FLUSH_INTERVAL:
+        return
+    _STATE.last_flush = now
+    try:
+        _STATE.recorder.flush()
+    except (IOError, OSError):
+        cmds.warning("Unable to write the dotblox trace to " + _STATE.recorder.path)
+
+
+def _original(name):
+    """Get the cmds function without the counting"""
+    return _STATE.originals.get(name) or getattr(cmds, name)
+
+
+def _scene_stats():
+    """Get the selection size and the size of the selected meshes"""
+    ls = _original("ls")
+    poly_evaluate = _original("polyEvaluate")
+
+    selection = ls(selection=True) or []
+    meshes = ls(selection, objectsOnly=True, dagObjects=True,
+                type="mesh", noIntermediate=True, long=True) or []
+    vertices = faces = 0
+    for mesh in meshes[:MAX_MESHES]:
+        try:
+            vertices += poly_evaluate(mesh, vertex=True)
+            faces += poly_evaluate(mesh, face=True)
+        except Exception:
+            pass
+    return {
+        "selection": len(selection),
+        "meshes": len(meshes),
+        "mesh_vertices": vertices,
+        "mesh_faces": faces,
+    }
+
+
+def _profile_call(name, func, args, kwargs):
+    recorder = _STATE.recorder
+    try:
+        stats = _scene_stats()
+    except Exception:
+        stats = {}
+    counts = dict(_STATE.counts)
+
+    if not _STATE.depth:
+        _wrap_cmds()
+    _STATE.depth += 1
+    start = recorder.now()
+    error = None
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        raise
+    finally:
+        duration = recorder.now() - start
+        _STATE.depth -= 1
+        if not _STATE.depth:
+            _unwrap_cmds()
+
+        calls = {}
+        for cmd, count in _STATE.counts.items():
+            count -= counts.get(cmd, 0)
+            if count:
+                calls[cmd] = count
+        stats["cmds_calls"] = sum(calls.values())
+        stats["cmds"] = calls
+        if error:
+            stats["error"] = error
+        recorder.add_event(name, start, duration, args=stats)
+
+        # Only write once the outer most call is done
+        if not _STATE.depth:
+            _flush()
+
+
+def profiled(name=None):
+    """Decorator to record the function while profiling is enabled
+
+    Args:
+        name (str): name of the event. Defaults to `module.function`
+    """
+    def decorator(func):
+        label = name or func.__module__ + "." + func.__name__
+
+        @functools.wraps(func)
+        def wrap(*args, **kwargs):
+            if not _STATE.enabled:
+                return func(*args, **kwargs)
+            return _profile_call(label, func, args, kwargs)
+        return wrap
+    return decorator
+
+
+if os.environ.get("DOTBLOX_PROFILE", "0").lower() not in ("", "0", "false") \
+        or option_var.get("profile", 0):
+    enable()
@@ -1,10 +1,118 @@
+import importlib
 import sys
+import timeit
 
 from maya.app.general.mayaMixin import MayaQWidgetDockableMixin
 from PySide2 import QtWidgets, QtCore
 from maya import cmds
 import maya.OpenMayaUI as omui
 
+from dotblox.core.mutil import OptionVar
+from dotblox.core.profiling import profiled
+
+try:
+    long
+except NameError:
+    long = int
+
+option_var = OptionVar("dotblox")
+
+# (module name, attr): _DockPlaceholder not built yet
+_PLACEHOLDERS = {}
+
+
+def lazy_restore_enabled():
+    """Get whether restored docks wait to be visible before being built
+
+    On by default, turned off with the optionVar `dotblox_lazy_restore` set to 0
+    """
+    return bool(option_var.get("lazy_restore", 1))
+
+
+def _report(name, action, start):
+    print("dotblox: {0} {1} in {2:.1f}ms".format(
+            name, action, (timeit.default_timer() - start) * 1000))
+
+
+def restore(module_name, attr="dock"):
+    """Restore a dock from the uiScript of its workspace control
+
+    The workspace control only gets a placeholder and the tool module
+    is not imported until the control is first visible, see
+    `lazy_restore_enabled`.
+
+    Args:
+        module_name (str): module holding the DockWindowManager
+        attr (str): the attribute of the DockWindowManager in the module
+    """
+    start = timeit.default_timer()
+    if not lazy_restore_enabled():
+        manager = getattr(importlib.import_module(module_name), attr)
+        manager.show(restore=True)
+        _report(module_name, "restored", start)
+        return
+    _DockPlaceholder.create(module_name, attr, omui.MQtUtil.getCurrentParent())
+    _report(module_name, "restored placeholder", start)
+
+
+class _DockPlaceholder(QtWidgets.QWidget):
+    """Empty widget standing in a restored workspace control until it is visible
+
+    Args:
+        module_name (str): module holding the DockWindowManager
+        attr (str): the attribute of the DockWindowManager in the module
+        parent_ptr (long): pointer of the workspace control layout
+    """
+
+    def __init__(self, module_name, attr, parent_ptr):
+        QtWidgets.QWidget.__init__(self)
+        self.module_name = module_name
+        self.attr = attr
+        self.parent_ptr = parent_ptr
+        self._build_scheduled = False
+        self.setObjectName("{0}_{1}_placeholder".format(module_name.replace(".", "_"), attr))
+
+    @classmethod
+    def create(cls, module_name, attr, parent_ptr):
+        """Create the placeholder in the maya layout
+
+        Returns:
+            _DockPlaceholder:
+        """
+        placeholder = cls(module_name, attr, parent_ptr)
+        _PLACEHOLDERS[(module_name, attr)] = placeholder
+        placeholder_ptr = omui.MQtUtil.findControl(placeholder.objectName())
+        omui.MQtUtil.addWidgetToMayaLayout(long(placeholder_ptr), long(parent_ptr))
+        return placeholder
+
+    def showEvent(self, event):
+        QtWidgets.QWidget.showEvent(self, event)
+        # Build once the control is done showing
+        if not self._build_scheduled:
+            self._build_scheduled = True
+            QtCore.QTimer.singleShot(0, self.build)
+
+    def build(self):
+        """Build the real dock window in place of the placeholder
+
+        Returns:
+            DockWindowManager: the manager of the dock
+        """
+        if _PLACEHOLDERS.get((self.module_name, self.attr)) is not self:
+            return getattr(sys.modules[self.module_name], self.attr)
+        del _PLACEHOLDERS[(self.module_name, self.attr)]
+
+        start = timeit.default_timer()
+        manager = getattr(importlib.import_module(self.module_name), self.attr)
+        manager.show(restore=True, parent=self.parent_ptr)
+        # Maya only shows the widgets restored during the uiScript,
+        # skip the mixin which would make a new workspace control
+        QtWidgets.QWidget.show(manager.win)
+        self.hide()
+        self.deleteLater()
+        _report(self.module_name, "built", start)
+        return manager
+
 
 class DockWindow(MayaQWidgetDockableMixin, QtWidgets.QWidget):
     """This class is not meant to be instanced outside of `DockWindowManager`
@@ -74,16 +182,12 @@ class DockWindow(MayaQWidgetDockableMixin, QtWidgets.QWidget):
     def create_workspace_control(self, source_module, attr="dock"):
         """Creates the workspace control and its defaults"""
 
+        # Only imports the tool module once the control is visible
         ui_script = """
 import {module}
-import {source_module}
-if hasattr({source_module}, "{attr}"):
-    if isinstance({source_module}.{attr}, {module}.{orig_control}):
-        {source_module}.{attr}.show(restore=True)
-        """.format(widget_module=self.widget.__module__,
-                   module=__name__,
+{module}.restore("{source_module}", "{attr}")
+        """.format(module=__name__,
                    attr=attr,
-                   orig_control=DockWindowManager.__name__,
                    source_module=source_module)
 
         close_script = """
@@ -144,13 +248,17 @@ if hasattr({source_module}, "{attr}"):
             cmds.deleteUI(self.workspace_control_name, control=True)
 
     @classmethod
-    def create(cls, widget_cls, module_name, restore=False, window_options=None, attr="dock"):
+    @profiled("DockWindow.create")
+    def create(cls, widget_cls, module_name, restore=False, window_options=None, attr="dock",
+               parent=None):
         """Create and setup the window with the given options.
 
         Args:
             widget_cls (QtWidgets.QWidget): the widget class to use as the central widget
             module_name (str): the module from where the creation was initialized
             restore (bool): should only be used on startup from maya
+            parent (long): pointer of the workspace control layout to restore
+                into, the current parent by default
             window_options (dict): a combined way of passing in options into the window
                             width_sizing: preferred, fixed, None
                             height_sizing: preferred, fixed, None
@@ -165,7 +273,8 @@ if hasattr({source_module}, "{attr}"):
 
         if restore:
             # The current parent is the workspace control created by maya
-            parent = omui.MQtUtil.getCurrentParent()
+            if parent is None:
+                parent = omui.MQtUtil.getCurrentParent()
             win_ptr = omui.MQtUtil.findControl(win.objectName())
             omui.MQtUtil.addWidgetToMayaLayout(long(win_ptr), long(parent))
         else:
@@ -222,18 +331,39 @@ class DockWindowManager(object):
         """A way to inject code at first runtime and the workspace does not exist"""
         pass
 
-    def show(self, restore=False):
+    def show(self, restore=False, parent=None):
+        """Show the window, creating it the first time
+
+        Args:
+            restore (bool): should only be used on startup from maya
+            parent (long): pointer of the workspace control layout to restore into
+        """
         # If there is a window just show it
         if self.win:
             self.win.show()
             return
 
+        placeholder = _PLACEHOLDERS.get((self.module, self.attr))
+        if placeholder is not None and not restore:
+            # Restored at startup but not visible yet, build it now
+            placeholder.build()
+            self.win.show()
+            return
+
+        if restore and parent is None and lazy_restore_enabled():
+            # uiScript of a workspace control saved before `restore` existed
+            start = timeit.default_timer()
+            _DockPlaceholder.create(self.module, self.attr, omui.MQtUtil.getCurrentParent())
+            _report(self.module, "restored placeholder", start)
+            return
+
         self.win = DockWindow.create(
                 self._widget_cls,
                 restore=restore,
                 window_options=self.window_options,
                 attr=self.attr,
-                module_name=self.module
+                module_name=self.module,
+                parent=parent
         )
         # Maya handles the visibility at startup so only show if were not restoring
         if not restore:
@@ -251,9 +381,16 @@ class DockWindowManager(object):
 
         This can also be used while debugging.
         """
+        placeholder = _PLACEHOLDERS.pop((self.module, self.attr), None)
+        if placeholder is not None:
+            # Closed before it was ever visible
+            placeholder.deleteLater()
+            return
+
         if not self.win:
             cmds.warning("Window instance has already been "
                        "deleted for %s" % self._widget_cls.__name__)
+            return
 
         # Workspace is already handled if its not retained
         if self.win.retain:
@@ -2,7 +2,7 @@
 """
 
 from maya import cmds
-from PySide2 import QtWidgets, QtCore, QtGui
+from PySide2 import QtWidgets, QtCore
 from dotblox.core.mutil import OptionVar
 
 from dotblox.core.mutil import OptionVar
@@ -10,7 +10,10 @@ from dotblox.core.ui import dockwindow
 
 from dotbloxlib import color as colorlib
 from dotblox.core import color as colorm
+from dotblox.core import displaylayer
+from dotblox.core.profiling import profiled
 from dotbloxlib.color import mdc
+from dotbloxlib.qt.swatchgrid import SwatchGrid
 
 
 class PALETTE_MODES():
@@ -42,13 +45,9 @@ class PALETTE_MODES():
 
     @classmethod
     def get_weights(cls, color, mode):
-        weights = mdc.get_weights(color).keys()
         if mode == cls.EXTREME:
-            return sorted(
-                    weights,
-                    key=lambda key: (
-                        float("inf") if "a" in key else int(key),
-                        int(key.replace("a", ""))))
+            return mdc.get_sorted_weights(color)
+        weights = mdc.get_weights(color)
         return [weight if weight in weights else None for weight in cls.WEIGHTS[mode]]
 
 
@@ -80,9 +79,13 @@ class ColorizerWidget(QtWidgets.QWidget):
         self.ui.layer_chkbx.changed.connect(lambda *x: self.on_apply_option_changed(APPLY_MODES.LAYER))
         self.ui.outliner_chkbx.changed.connect(lambda *x: self.on_apply_option_changed(APPLY_MODES.OUTLINER))
         self.ui.object_chkbx.changed.connect(lambda *x: self.on_apply_option_changed(APPLY_MODES.OBJECT))
-        self.ui.clear_menu.triggered.connect(self.clear_selection)
+        self.ui.clear_menu.triggered.connect(lambda *x: self.clear_selection())
+        self.ui.palette_grid.swatchPressed.connect(self.on_color_btn_presss)
+        self.ui.distinct_grp.triggered.connect(self.on_distinct_triggered)
 
         self.startup_settings()
+        # Starts baking a missing OCIO transform before the first color is applied
+        colorm.get_color_management()
 
     @property
     def is_layer(self):
@@ -161,9 +164,10 @@ class ColorizerWidget(QtWidgets.QWidget):
         self.ui.clear_menu.setText("Clear: " + mode)
         self.ui.apply_menu.setTitle("Apply to: " + mode)
 
+    @profiled("colorizer.clear_selection")
     def clear_selection(self):
         if self.is_layer:
-            display_layers = self.get_selected_display_layers()
+            display_layers = displaylayer.get_selected()
 
             if not len(display_layers):
                 cmds.inViewMessage(
@@ -174,61 +178,27 @@ class ColorizerWidget(QtWidgets.QWidget):
                         fontSize=12,
                         fadeStayTime=1250)
 
-            for display_layer in display_layers:
-                cmds.setAttr(display_layer + ".color", True)
-                cmds.setAttr(display_layer + ".overrideRGBColors", False)
+            displaylayer.clear_color(display_layers)
             return
 
         selection = cmds.ls(selection=True, long=True)
-
-        for item in selection:
-            if self.is_object and cmds.objExists(item + ".overrideEnabled"):
-                # TODO: do we turn this off?
-                #       how do we know the only change was made to the color
-                #       would be really helful to add a custom attribute
-                # cmds.setAttr(item + ".overrideEnabled", True)
-                cmds.setAttr(item + ".overrideRGBColors", False)
-
-            if self.is_outliner and cmds.objExists(item + ".useOutlinerColor"):
-                cmds.setAttr(item + ".useOutlinerColor", False)
-
-    def get_selected_display_layers(self):
-        # Note: we could get all displayLayer nodes but there is no way
-        #       to select them without going through the UI so we do it this way
-        display_layers = cmds.layout("LayerEditorDisplayLayerLayout",
-                                   query=True,
-                                   childArray=True) or []
-        return [display_layer
-                for display_layer in display_layers
-                if cmds.layerButton(display_layer, query=True, select=True)]
+        colorm.clear_color(selection,
+                           is_object=self.is_object,
+                           is_outliner=self.is_outliner)
 
     def build_palette(self, mode):
-        columns = self.ui.palette_grid.columnCount()
-        rows = self.ui.palette_grid.rowCount()
-        for column in range(columns):
-            for row in range(rows):
-                widget_item = self.ui.palette_grid.itemAtPosition(row, column)
-                if not widget_item:
-                    continue
-                w = widget_item.widget()
-                self.ui.palette_grid.removeWidget(w)
-                w.deleteLater()
-
-        column = 0
+        columns = []
         for color in mdc.get_colors():
-            row = -1
-
+            column = []
             for weight in PALETTE_MODES.get_weights(color, mode):
-                row += 1
                 if not weight:
+                    column.append(None)
                     continue
+                column.append((mdc.get_color(color, weight),
+                               "{color} {weight}".format(color=color, weight=weight)))
+            columns.append(column)
 
-                btn = ColorButton(color, weight)
-                btn.pressed.connect(lambda btn=btn: self.on_color_btn_presss(btn))
-
-                self.ui.palette_grid.addWidget(btn, row, column)
-
-            column += 1
+        self.ui.palette_grid.setSwatches(columns)
 
         def resize():
             self.adjustSize()
@@ -240,36 +210,41 @@ class ColorizerWidget(QtWidgets.QWidget):
 
         QtCore.QTimer.singleShot(100, resize)
 
-    def on_color_btn_presss(self, btn):
-        raw_color = colorlib.color_hex_to_rgbf(btn.hex_value)
-        color = colorm.color_managed_convert(raw_color)
+    @profiled("colorizer.apply_color")
+    def on_color_btn_presss(self, hex_value):
+        raw_color = colorlib.color_hex_to_rgbf(hex_value)
 
         is_layer = self.ui.layer_chkbx.isChecked()
         is_object = self.ui.object_chkbx.isChecked()
         is_outliner = self.ui.outliner_chkbx.isChecked()
 
         if is_layer:
-
-            for display_layer in self.get_selected_display_layers():
-                # This is on by default but just in case
-                cmds.setAttr(display_layer + ".enabled", True)
-                cmds.setAttr(display_layer + ".overrideColorRGB", *color)
-                cmds.setAttr(display_layer + ".color", False)
-                cmds.setAttr(display_layer + ".overrideRGBColors", True)
+            displaylayer.colorize(displaylayer.get_selected(), raw_color)
 
         if is_object or is_outliner:
-
             selection = cmds.ls(selection=True, long=True)
+            colorm.colorize(selection,
+                            raw_color,
+                            is_object=is_object,
+                            is_outliner=is_outliner)
+
+    @profiled("colorizer.apply_distinct")
+    def on_distinct_triggered(self, action):
+        group_by = action.data()
+        palette_mode = self.option_var.get(self._palette_mode_option_key, PALETTE_MODES.BASIC)
+        # The colors of the palette shown, extreme uses them all
+        weights = PALETTE_MODES.WEIGHTS.get(palette_mode)
 
-            for item in selection:
-                if is_object and cmds.objExists(item + ".overrideEnabled"):
-                    cmds.setAttr(item + ".overrideEnabled", True)
-                    cmds.setAttr(item + ".overrideRGBColors", True)
-                    cmds.setAttr(item + ".overrideColorRGB", *color)
+        if self.is_layer:
+            displaylayer.colorize_distinct(displaylayer.get_selected(), weights)
+            return
 
-                if is_outliner and cmds.objExists(item + ".useOutlinerColor"):
-                    cmds.setAttr(item + ".useOutlinerColor", True)
-                    cmds.setAttr(item + ".outlinerColor", *raw_color)
+        selection = cmds.ls(selection=True, long=True)
+        colorm.colorize_distinct(selection,
+                                 group_by=group_by,
+                                 weights=weights,
+                                 is_object=self.is_object,
+                                 is_outliner=self.is_outliner)
 
 
 class ColorizeUI(object):
@@ -285,9 +260,8 @@ class ColorizeUI(object):
         content_layout.setContentsMargins(4, 4, 4, 4)
         content_layout.setAlignment(QtCore.Qt.AlignTop)
 
-        self.palette_grid = QtWidgets.QGridLayout()
-        self.palette_grid.setSpacing(0)
-        content_layout.addLayout(self.palette_grid)
+        self.palette_grid = SwatchGrid()
+        content_layout.addWidget(self.palette_grid)
 
         main_layout.addLayout(content_layout)
 
@@ -337,51 +311,23 @@ class ColorizeUI(object):
         self.clear_menu = QtWidgets.QAction("Clear", None)  # type: QtWidgets.QAction
         self.util_menu.addAction(self.clear_menu)
 
-        layout.addWidget(self.menu_bar)
-
-
-class ColorButton(QtWidgets.QPushButton):
-    def __init__(self, color, weight, parent=None):
-        QtWidgets.QPushButton.__init__(self, parent=parent)
-
-        self.color = color
-        self.weight = weight
-
-        # self.setFixedHeight(20)
-
-        self.hex_value = mdc.get_color(color, weight)
-        self.setToolTip("{color} {weight}".format(color=self.color,
-                                                  weight=self.weight))
-
-        self.set_style()
-
-    def sizeHint(self, *args, **kwargs):
-        return QtCore.QSize(0, 20)
-
-    def set_style(self):
-        i = QtGui.QColor(self.hex_value)
-        darker = i.darker(125)
-        darker = darker.name()
-
-        lighter = i.lighter(110)
-        lighter = lighter.name()
+        # Distinct colors
+        self.distinct_menu = self.util_menu.addMenu("Distinct Colors")  # type: QtWidgets.QMenu
+        self.distinct_grp = QtWidgets.QActionGroup(self.distinct_menu)
+        self.distinct_grp.setExclusive(False)
+        distinct_groups = [
+            ("Per Node", colorm.GROUP_BY.NODE),
+            ("Per Hierarchy", colorm.GROUP_BY.HIERARCHY),
+            ("Per Namespace", colorm.GROUP_BY.NAMESPACE),
+            ("Per Display Layer", colorm.GROUP_BY.LAYER),
+        ]
+        for label, group_by in distinct_groups:
+            action = QtWidgets.QAction(label, None)
+            action.setData(group_by)
+            self.distinct_menu.addAction(action)
+            self.distinct_grp.addAction(action)
 
-        self.setStyleSheet("""
-            QPushButton{{
-                background-color:{base};
-                                border: 1px solid black;
+        layout.addWidget(self.menu_bar)
 
-            }}
-            
-            QPushButton:hover{{
-                background-color:{lighter};
-            }}
-            
-            
-            QPushButton:pressed{{
-                background-color:{darker};
-                border: 1px solid black;
-            }}
-        """.format(base=self.hex_value, lighter=lighter, darker=darker))
 
 dock = dockwindow.DockWindowManager(ColorizerWidget)
\ No newline at end of file
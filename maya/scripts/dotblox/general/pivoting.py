@@ -1,9 +1,10 @@
 from maya import cmds
-from PySide2 import QtWidgets, QtCore, QtGui
+from PySide2 import QtWidgets, QtCore
 
 from dotblox.core.ui import dockwindow
 from dotblox.core.general import pivot_to_bb
 from dotblox.core.constant import AXIS, DIRECTION
+from dotbloxlib.qt import theme
 
 
 class COLORS():
@@ -104,6 +105,7 @@ class PivotingWidgetUI(object):
 
         main_layout.addLayout(content_layout)
         parent.setLayout(main_layout)
+        parent.setStyleSheet(theme.color_stylesheet(PivotPushButton.COLORS))
 
 
 class PivotPushButton(QtWidgets.QPushButton):
@@ -111,14 +113,14 @@ class PivotPushButton(QtWidgets.QPushButton):
 
     COLORS = {
         "+X": COLORS.RED,
-        "=X": QtGui.QColor(COLORS.RED).darker(dark_factor).name(),
-        "-X": QtGui.QColor(COLORS.RED).darker(dark_factor + 15).name(),
+        "=X": theme.darker(COLORS.RED, dark_factor),
+        "-X": theme.darker(COLORS.RED, dark_factor + 15),
         "+Y": COLORS.GREEN,
-        "=Y": QtGui.QColor(COLORS.GREEN).darker(dark_factor).name(),
-        "-Y": QtGui.QColor(COLORS.GREEN).darker(dark_factor + 15).name(),
+        "=Y": theme.darker(COLORS.GREEN, dark_factor),
+        "-Y": theme.darker(COLORS.GREEN, dark_factor + 15),
         "+Z": COLORS.BLUE,
-        "=Z": QtGui.QColor(COLORS.BLUE).darker(dark_factor).name(),
-        "-Z": QtGui.QColor(COLORS.BLUE).darker(dark_factor + 15).name(),
+        "=Z": theme.darker(COLORS.BLUE, dark_factor),
+        "-Z": theme.darker(COLORS.BLUE, dark_factor + 15),
         "Center": COLORS.LIGHT_GREEN,
         "Bake": COLORS.LIGHT_BLUE
     }
@@ -126,9 +128,9 @@ class PivotPushButton(QtWidgets.QPushButton):
     def __init__(self, label, parent=None):
         QtWidgets.QPushButton.__init__(self, label, parent=parent)
 
+        # Styled by the stylesheet of PivotingWidgetUI
         if label in self.COLORS:
-            self.setStyleSheet("""background-color:{color};""".format(
-                    color=self.COLORS[label]))
+            theme.set_color(self, label)
         if "=" in label:
             self.setText("=")
 
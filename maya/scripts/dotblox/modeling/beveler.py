@@ -1,12 +1,13 @@
 import random
 from PySide2 import QtCore, QtWidgets
 
-from dotblox.core import nodepath
+from dotblox.core import bevelsession, nodepath
 from dotblox.core.modeling import BevelEditor
 from dotblox.core.ui import dockwindow
 from maya import cmds
 
 from dotblox.core.mutil import Repeatable
+from dotbloxlib import intervals
 
 
 class BevelEditorWidget(QtWidgets.QWidget):
@@ -65,7 +66,10 @@ class BevelEditorWidget(QtWidgets.QWidget):
         if src_node:
             node = src_node
 
-        bevel_nodes = BevelEditor.get_bevel_nodes(node)
+        # The session lists the bevels without going through the history,
+        # it is checked against the scene once for every bevel
+        session = bevelsession.get(node)
+        bevel_nodes = session["bevels"]
 
         if not bevel_nodes:
             self.ui.bevel_combo.addItem("No bevels found on " + nodepath.leafname(node))
@@ -73,32 +77,37 @@ class BevelEditorWidget(QtWidgets.QWidget):
             return
 
         current_bevel_index = 0
-        self.ui.bevel_combo.addItem("None", self.ui.ComboData(src_node, None))
+        self.ui.bevel_combo.addItem("None", self.ui.ComboData(node, None))
 
-        current_vis_bevel = BevelEditor.get_vis_bevel(node)
+        current_vis_bevel = session["active"]
 
         for index, bevel_node in enumerate(bevel_nodes, 1):
             if current_vis_bevel == bevel_node:
                 current_bevel_index = index
-            self.ui.bevel_combo.addItem(nodepath.name(bevel_node),
-                                        self.ui.ComboData(src_node, bevel_node))
+            edge_count = intervals.count(bevelsession.session_edges(session, bevel_node))
+            self.ui.bevel_combo.addItem("{0} ({1} edges)".format(nodepath.name(bevel_node), edge_count),
+                                        self.ui.ComboData(node, bevel_node))
         self.ui.bevel_combo.setCurrentIndex(current_bevel_index)
         self.ui.bevel_combo.blockSignals(False)
 
     def on_bevel_changed(self, index):
         data = self.ui.bevel_combo.currentData()
         if data.bevel_node:
-            BevelEditor.show_bevel(data.bevel_node)
+            bevelsession.switch(data.node, data.bevel_node)
         else:
-            BevelEditor.remove_vis_bevel(data.node)
+            bevelsession.hide(data.node)
 
     @Repeatable()
     def on_add_clicked(self):
         BevelEditor.add_to_bevel()
+        # Update the edge counts
+        self.on_selection_changed()
 
     @Repeatable()
     def on_remove_click(self):
         BevelEditor.remove_from_bevel()
+        # Update the edge counts
+        self.on_selection_changed()
 
     @Repeatable()
     def on_select_edges_click(self):
@@ -121,14 +130,14 @@ class BevelEditorWidget(QtWidgets.QWidget):
         for node in selection:
             src_node = BevelEditor.get_src_node(node)
             if src_node:
-                BevelEditor.remove_vis_bevel(src_node)
+                bevelsession.hide(src_node)
 
     def remove_from_all(self):
         nodes = cmds.ls("*." + BevelEditor.BEVEL_ATTR, objectsOnly=True, type="transform")
         for node in nodes:
             src_node = BevelEditor.get_src_node(node)
             if src_node:
-                BevelEditor.remove_vis_bevel(src_node)
+                bevelsession.hide(src_node)
 
 
 class BevelEditorUI(object):
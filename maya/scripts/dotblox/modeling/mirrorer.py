@@ -1,10 +1,11 @@
 from dotblox.core.constant import AXIS, DIRECTION
 from dotblox.core.ui import dockwindow
-from PySide2 import QtWidgets, QtCore, QtGui
+from PySide2 import QtWidgets, QtCore
 
 
 from dotblox.core.mutil import Repeatable, Undoable, OptionVar
 from dotblox.core.modeling import poly_mirror
+from dotbloxlib.qt import theme
 
 __author__ = "Ryan Robinson"
 
@@ -117,28 +118,27 @@ class MirrorerWidgetUI(object):
 
         main_layout.addLayout(content_layout)
         parent.setLayout(main_layout)
+        parent.setStyleSheet(theme.color_stylesheet(MirrorPushButton.COLORS,
+                                                    extra="font-size: 12px;"))
 
 
 class MirrorPushButton(QtWidgets.QPushButton):
     dark_factor = 110
     COLORS = {
         "+X": COLORS.RED,
-        "-X": QtGui.QColor(COLORS.RED).darker(dark_factor).name(),
+        "-X": theme.darker(COLORS.RED, dark_factor),
         "+Y": COLORS.GREEN,
-        "-Y": QtGui.QColor(COLORS.GREEN).darker(dark_factor).name(),
+        "-Y": theme.darker(COLORS.GREEN, dark_factor),
         "+Z": COLORS.BLUE,
-        "-Z": QtGui.QColor(COLORS.BLUE).darker(dark_factor).name(),
+        "-Z": theme.darker(COLORS.BLUE, dark_factor),
     }
 
     def __init__(self, label, parent=None):
         QtWidgets.QPushButton.__init__(self, label, parent=parent)
 
+        # Styled by the stylesheet of MirrorerWidgetUI
         if label in self.COLORS:
-            self.setStyleSheet("""
-            font-size: 12px;
-            background-color:{color};""".format(
-                    color=self.COLORS[label]
-            ))
+            theme.set_color(self, label)
 
 
 dock = dockwindow.DockWindowManager(MirrorerWidget)
\ No newline at end of file
@@ -1,7 +1,7 @@
 from dotblox.core.constant import AXIS, DIRECTION
-from dotbloxlib.icon import get_icon
+from dotbloxlib.icon import get_qicon
 from maya import cmds
-from PySide2 import QtWidgets, QtCore, QtGui
+from PySide2 import QtWidgets, QtCore
 
 from dotblox.core import general
 from dotblox.core.mutil import OptionVar, Undoable
@@ -119,27 +119,27 @@ class PrimitivesWidgetUI(object):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setAlignment(QtCore.Qt.AlignLeft)
 
-        self.sphere_btn = ToolButton(PRIMITIVE.SPHERE , get_icon("dblx_polySphere"))
+        self.sphere_btn = ToolButton(PRIMITIVE.SPHERE , get_qicon("dblx_polySphere"))
         self.sphere_btn.setOptions([8, 16, 24, 32, 64],
                                    default=16,
                                    label="Divisions")
         main_layout.addWidget(self.sphere_btn)
 
-        self.cube_btn = ToolButton(PRIMITIVE.CUBE , get_icon("dblx_polyCube"))
+        self.cube_btn = ToolButton(PRIMITIVE.CUBE , get_qicon("dblx_polyCube"))
         self.cube_btn.setOptions([1, 2, 3, 4], label="Divisions")
         main_layout.addWidget(self.cube_btn)
 
-        self.cylinder_btn = ToolButton(PRIMITIVE.CYLINDER , get_icon("dblx_polyCylinder"))
+        self.cylinder_btn = ToolButton(PRIMITIVE.CYLINDER , get_qicon("dblx_polyCylinder"))
         self.cylinder_btn.setOptions([8, 16, 24, 32, 64],
                                      default=16,
                                      label="Divisions")
         main_layout.addWidget(self.cylinder_btn)
 
-        self.plane_btn = ToolButton(PRIMITIVE.PLANE, get_icon("dblx_polyMesh"))
+        self.plane_btn = ToolButton(PRIMITIVE.PLANE, get_qicon("dblx_polyMesh"))
         self.plane_btn.setOptions([1, 2, 3, 4], label="Divisions")
         main_layout.addWidget(self.plane_btn)
 
-        self.snap_btn = ToolButton("Snap", get_icon("dblx_snap"))
+        self.snap_btn = ToolButton("Snap", get_qicon("dblx_snap"))
         self.snap_btn.setOptions(["x", "y", "z", "-x", "-y", "-z"],
                                  default="y",
                                  label="Direction")
@@ -186,7 +186,7 @@ class ToolButton(FlatToolButton):
     def setActiveOption(self, option):
         self._active_option = option
         option_var.set(self._label, option)
-        self.repaint()
+        self.update()
 
     def activeOption(self):
         return self._active_option
@@ -201,11 +201,8 @@ class ToolButton(FlatToolButton):
         else:
             FlatToolButton.mousePressEvent(self, event)
 
-    def paintEvent(self, event):
-        FlatToolButton.paintEvent(self, event)
-
-        rect = event.rect()
-        painter = QtGui.QPainter(self)
+    def drawButton(self, painter, rect):
+        FlatToolButton.drawButton(self, painter, rect)
         painter.drawText(rect.adjusted(0, 0, -4, -4), QtCore.Qt.AlignRight | QtCore.Qt.AlignBottom,
                          str(self._active_option) or "")
 
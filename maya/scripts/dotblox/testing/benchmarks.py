@@ -0,0 +1,647 @@
+"""Benchmarks of the dotblox operations against the fake maya
+
+Records wall time and `maya.cmds` call counts of each operation at
+different scales and fails when a budget in `budgets.json` regresses.
+
+Usage:
+    python -m dotblox.testing.benchmarks --budgets dotblox/testing/budgets.json
+    python -m dotblox.testing.benchmarks -k "BevelEditor*" -p 1000 -o results.json
+"""
+import contextlib
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from dotblox.testing import fakemaya
+
+fakemaya.install()
+
+from dotblox.core import color as colorm
+from dotblox.core import bevelsession, displaylayer, general, nodepath
+from dotblox.core.modeling import BevelEditor
+from dotbloxlib import benchmark, config, icon, intervals
+from dotbloxlib import color as colorlib
+from dotbloxlib.color import mdc
+from dotbloxlib.benchmark import SkipCase
+
+BUDGETS = os.path.join(os.path.dirname(__file__), "budgets.json")
+
+SUITE = benchmark.Suite(counter=fakemaya.counting)
+
+
+def grid_size(edges):
+    """Get the width of a square grid with at least the given number of edges"""
+    width = 1
+    while 2 * width * (width + 1) < edges:
+        width += 1
+    return width
+
+
+def get_qapp():
+    """Get or create the QApplication
+
+    Raises:
+        SkipCase: Qt is not available
+    """
+    try:
+        from PySide2 import QtWidgets
+    except ImportError:
+        raise SkipCase("PySide2 is not available")
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication(sys.argv)
+    return app
+
+
+@SUITE.case("nodepath.helpers")
+def bench_nodepath_helpers(scale):
+    paths = ["|grp|ns:node%d|ns:nodeShape%d.e[3]" % (i, i) for i in range(scale)]
+
+    def run():
+        for path in paths:
+            nodepath.name(path)
+            nodepath.leafname(path)
+            nodepath.namespace(path)
+            nodepath.parent(path)
+            nodepath.node(path)
+            nodepath.attr(path, strip=True)
+            nodepath.ancestors(path)
+    return run
+
+
+@SUITE.case("nodepath.full_path")
+def bench_nodepath_full_path(scale):
+    scene = fakemaya.new_scene()
+    group = scene.create_node("transform", "grp", select=False)
+    names = [scene.create_node("transform", "node%d" % i, parent=group, select=False).name
+             for i in range(scale)]
+
+    def run():
+        for name in names:
+            nodepath.full_path(name)
+    return run
+
+
+def _config_data(scale):
+    return dict(("key%d" % i, {"value": i, "name": "item%d" % i}) for i in range(scale))
+
+
+@SUITE.case("config.ConfigJSON.save")
+def bench_config_save(scale):
+    directory = tempfile.mkdtemp()
+    cfg = config.ConfigJSON(os.path.join(directory, "config.json"))
+    cfg.io.cache = _config_data(scale)
+
+    def run():
+        cfg.save()
+    return run, lambda: shutil.rmtree(directory)
+
+
+@SUITE.case("config.ConfigJSON.write_burst", params=[0.0, 60.0])
+def bench_config_write_burst(delay):
+    """100 edits in a row, saved each time or together after the delay"""
+    directory = tempfile.mkdtemp()
+    cfg = config.ConfigJSON(os.path.join(directory, "config.json"), delay=delay)
+    cfg.io.cache = _config_data(1000)
+    cfg.start_sync(save=True)
+
+    def run():
+        for i in range(100):
+            with cfg.io.write() as data:
+                data["key0"]["value"] = i
+        cfg.flush()
+    return run, lambda: shutil.rmtree(directory)
+
+
+CONFIG_FORMATS = {
+    "json": config.ConfigJSON,
+    "binary": config.ConfigBinary,
+    "indexed": config.ConfigIndexed,
+}
+
+
+def _preset_config(config_format):
+    """A config of 500 asset presets of 2000 edges each, like the bevel presets"""
+    directory = tempfile.mkdtemp()
+    cfg = CONFIG_FORMATS[config_format](os.path.join(directory, "presets"))
+    cfg.io.cache.update(("asset%d" % i, {"edges": list(range(i, i + 2000)),
+                                         "color": [0.5, 0.25, 1.0]})
+                        for i in range(500))
+    return directory, cfg
+
+
+@SUITE.case("config.format.write", params=sorted(CONFIG_FORMATS))
+def bench_config_format_write(config_format):
+    directory, cfg = _preset_config(config_format)
+
+    def run():
+        cfg.save()
+    return run, lambda: shutil.rmtree(directory)
+
+
+@SUITE.case("config.format.read", params=sorted(CONFIG_FORMATS))
+def bench_config_format_read(config_format):
+    """Open the config and use every key"""
+    directory, cfg = _preset_config(config_format)
+    cfg.save()
+
+    def run():
+        data = CONFIG_FORMATS[config_format](cfg.io.file_path).io.cache
+        for key in data:
+            data[key]
+    return run, lambda: shutil.rmtree(directory)
+
+
+@SUITE.case("config.format.read_key", params=sorted(CONFIG_FORMATS))
+def bench_config_format_read_key(config_format):
+    """Open the config and use a single key"""
+    directory, cfg = _preset_config(config_format)
+    cfg.save()
+
+    def run():
+        CONFIG_FORMATS[config_format](cfg.io.file_path).io.cache["asset250"]
+    return run, lambda: shutil.rmtree(directory)
+
+
+@contextlib.contextmanager
+def slow_filesystem(delay=0.0005):
+    """Make every `os.stat` take `delay` seconds longer, like a network mount"""
+    stat = os.stat
+
+    def slow_stat(*args, **kwargs):
+        time.sleep(delay)
+        return stat(*args, **kwargs)
+
+    os.stat = slow_stat
+    try:
+        yield
+    finally:
+        os.stat = stat
+
+
+def _scan_paths(name, paths):
+    """Search the paths for the config like `config.find_all` without its index"""
+    found = []
+    for path in paths:
+        config_path = os.path.join(path, name).replace("\\", "/")
+        if os.path.exists(config_path):
+            found.append(config_path)
+    return found
+
+
+@SUITE.case("config.find_all", params=["scan", "index"])
+def bench_config_find_all(mode):
+    """10 searches along 500 paths, 3 of which have the config"""
+    directory = tempfile.mkdtemp()
+    paths = []
+    for i in range(500):
+        path = os.path.join(directory, "path%d" % i)
+        os.makedirs(path)
+        if i % 200 == 0:
+            open(os.path.join(path, "dotblox.json"), "w").close()
+        paths.append(path)
+    index = config.PathIndex(paths)
+
+    def run():
+        with slow_filesystem():
+            for _ in range(10):
+                if mode == "scan":
+                    found = _scan_paths("dotblox.json", paths)
+                else:
+                    found = index.find_all("dotblox.json")
+                assert len(found) == 3
+    return run, lambda: shutil.rmtree(directory)
+
+
+@SUITE.case("config.ConfigJSON.read")
+def bench_config_read(scale):
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "config.json")
+    cfg = config.ConfigJSON(path)
+    cfg.io.cache = _config_data(scale)
+    cfg.save()
+
+    def run():
+        config.ConfigJSON(path)
+    return run, lambda: shutil.rmtree(directory)
+
+
+@SUITE.case("color.color_hex_to_rgbf")
+def bench_color_hex_to_rgbf(scale):
+    hex_values = [mdc.get_color(color, weight)
+                  for color in mdc.get_colors()
+                  for weight in mdc.get_weights(color)]
+    hex_values = (hex_values * (scale // len(hex_values) + 1))[:scale]
+
+    def run():
+        for hex_value in hex_values:
+            colorlib.color_hex_to_rgbf(hex_value)
+    return run
+
+
+@SUITE.case("mdc.nearest_colors")
+def bench_mdc_nearest_colors(scale):
+    mdc.get_index()
+    colors = [[(i * 7 % 256) / 255.0, (i * 13 % 256) / 255.0, (i * 29 % 256) / 255.0]
+              for i in range(scale)]
+
+    def run():
+        mdc.nearest_colors(colors)
+    return run
+
+
+@SUITE.case("color.colorize")
+def bench_colorize(scale):
+    scene = fakemaya.new_scene()
+    names = [scene.create_node("transform", "node%d" % i, select=False).name
+             for i in range(scale)]
+
+    def run():
+        colorm.colorize(names, (1.0, 0.5, 0.0), is_object=True, is_outliner=True)
+        colorm.clear_color(names, is_object=True, is_outliner=True)
+    return run
+
+
+@SUITE.case("color.colorize_many")
+def bench_colorize_many(scale):
+    scene = fakemaya.new_scene()
+    names = [scene.create_node("transform", "node%d" % i, select=False).path
+             for i in range(scale)]
+    colors = [[(i % 256) / 255.0, (i // 256 % 256) / 255.0, 0.5] for i in range(scale)]
+
+    def run():
+        colorm.colorize_many(names, colors, is_object=True, is_outliner=True)
+    return run
+
+
+@SUITE.case("color.colorize_distinct")
+def bench_colorize_distinct(scale):
+    scene = fakemaya.new_scene()
+    names = []
+    for group_index in range(10):
+        group = scene.create_node("transform", "ns%d:grp" % group_index, select=False)
+        names.append(group.path)
+        names.extend(scene.create_node("transform", "ns%d:node%d" % (group_index, i),
+                                       parent=group, select=False).path
+                     for i in range(scale // 10))
+
+    def run():
+        colorm.colorize_distinct(names, group_by=colorm.GROUP_BY.HIERARCHY)
+    return run
+
+
+@SUITE.case("displaylayer.colorize_selected")
+def bench_displaylayer_colorize_selected(scale):
+    scene = fakemaya.new_scene()
+    layers = [scene.create_node("displayLayer", "layer%d" % i, select=False).name
+              for i in range(scale)]
+    displaylayer.select(layers[::2])
+
+    def run():
+        displaylayer.colorize_distinct(displaylayer.get_selected())
+        displaylayer.clear_color(displaylayer.get_selected())
+    return run
+
+
+@SUITE.case("colorizer.build_palette", params=["basic", "standard", "advanced", "extreme"])
+def bench_colorizer_build_palette(mode):
+    get_qapp()
+    fakemaya.new_scene()
+    from dotblox.general import colorizer
+    widget = colorizer.ColorizerWidget()
+
+    def run():
+        widget.build_palette(mode)
+    return run
+
+
+@SUITE.case("colorizer.switch_palette", params=[1, 10])
+def bench_colorizer_switch_palette(cycles):
+    app = get_qapp()
+    fakemaya.new_scene()
+    from dotblox.general import colorizer
+    widget = colorizer.ColorizerWidget()
+    widget.show()
+    modes = [colorizer.PALETTE_MODES.BASIC,
+             colorizer.PALETTE_MODES.STANDARD,
+             colorizer.PALETTE_MODES.ADVANCED,
+             colorizer.PALETTE_MODES.EXTREME]
+
+    def run():
+        for _ in range(cycles):
+            for mode in modes:
+                widget.build_palette(mode)
+                # Include the paint of the new palette
+                widget.repaint()
+                app.processEvents()
+
+    def cleanup():
+        widget.close()
+    return run, cleanup
+
+
+@SUITE.case("ui.styled_widgets", params=["pivoting", "mirrorer", "palette"])
+def bench_styled_widgets(name):
+    """Create and polish the widgets styled by dotbloxlib.qt.theme"""
+    app = get_qapp()
+    fakemaya.new_scene()
+    from dotblox.general import colorizer, pivoting
+    from dotblox.modeling import mirrorer
+
+    def create():
+        if name == "pivoting":
+            return pivoting.PivotingWidget()
+        if name == "mirrorer":
+            return mirrorer.MirrorerWidget()
+        widget = colorizer.ColorizerWidget()
+        widget.build_palette(colorizer.PALETTE_MODES.EXTREME)
+        return widget
+
+    def run():
+        widget = create()
+        widget.show()
+        # Polish every child and re-polish the whole widget again
+        app.processEvents()
+        widget.setStyleSheet(widget.styleSheet())
+        app.processEvents()
+        widget.close()
+    return run
+
+
+@SUITE.case("ui.flattoolbutton_hover", params=[10, 100])
+def bench_flattoolbutton_hover(count):
+    """Hover in and out of buttons sharing an icon 5 times each
+
+    The events are processed after each enter and leave like a mouse
+    moving over the buttons. Prints how many times the buttons were painted.
+    """
+    app = get_qapp()
+    from PySide2 import QtCore, QtWidgets
+    from dotbloxlib.qt import flattoolbutton
+
+    paints = []
+
+    class CountingButton(flattoolbutton.FlatToolButton):
+        def paintEvent(self, event):
+            paints.append(self)
+            flattoolbutton.FlatToolButton.paintEvent(self, event)
+
+    flattoolbutton.clear_variants()
+    window = QtWidgets.QWidget()
+    layout = QtWidgets.QGridLayout(window)
+    buttons = [CountingButton(icon="dblx_pivot") for _ in range(count)]
+    for i, button in enumerate(buttons):
+        layout.addWidget(button, i // 10, i % 10)
+    window.show()
+    app.processEvents()
+
+    def run():
+        del paints[:]
+        for button in buttons:
+            for _ in range(5):
+                # Sent events do not set the hover state a real mouse would
+                button.setAttribute(QtCore.Qt.WA_UnderMouse, True)
+                app.sendEvent(button, QtCore.QEvent(QtCore.QEvent.Enter))
+                app.processEvents()
+                button.setAttribute(QtCore.Qt.WA_UnderMouse, False)
+                app.sendEvent(button, QtCore.QEvent(QtCore.QEvent.Leave))
+                app.processEvents()
+        print("{0} buttons hovered 5 times painted {1} times".format(count, len(paints)))
+
+    def cleanup():
+        window.close()
+    return run, cleanup
+
+
+@SUITE.case("ui.widgettoolbutton_open", params=["pivoting.first", "pivoting.repeat",
+                                                 "mirrorer.first", "mirrorer.repeat"])
+def bench_widgettoolbutton_open(mode):
+    """Open the popup of a tool button once, or 10 more times after a first open"""
+    app = get_qapp()
+    fakemaya.new_scene()
+    from dotblox.general import pivoting
+    from dotblox.modeling import mirrorer
+    from dotbloxlib.qt.widgettoolbutton import WidgetToolButton
+
+    tool, repeat = mode.split(".")
+    factory = pivoting.PivotingWidget if tool == "pivoting" else mirrorer.MirrorerWidget
+    button = WidgetToolButton(factory, icon="dblx_pivot")
+    button.show()
+    app.processEvents()
+
+    def open_popup():
+        button.showPopup()
+        app.processEvents()
+        button.tool_popup.hide()
+        app.processEvents()
+
+    if repeat == "repeat":
+        open_popup()
+
+    def run():
+        for _ in range(10 if repeat == "repeat" else 1):
+            open_popup()
+
+    def cleanup():
+        button.close()
+    return run, cleanup
+
+
+DOCK_MODULES = [
+    "dotblox.general.colorizer",
+    "dotblox.general.pivoting",
+    "dotblox.modeling.beveler",
+    "dotblox.modeling.dotmodeling",
+    "dotblox.modeling.mirrorer",
+    "dotblox.modeling.primitives",
+]
+
+
+@SUITE.case("ui.dock_restore", params=["eager", "lazy"])
+def bench_dock_restore(mode):
+    """Restore six docks like maya does on startup from a saved layout"""
+    app = get_qapp()
+    fakemaya.new_scene()
+    import importlib
+    from maya import cmds
+    from dotblox.core.ui import dockwindow
+    # The modules stay imported, only the windows are measured
+    managers = [importlib.import_module(module).dock for module in DOCK_MODULES]
+    cmds.optionVar(intValue=["dotblox_lazy_restore", int(mode == "lazy")])
+
+    def run():
+        for module in DOCK_MODULES:
+            dockwindow.restore(module, "dock")
+        app.processEvents()
+
+    def cleanup():
+        for manager in managers:
+            if manager.win is not None:
+                manager.win.deleteLater()
+                manager.win = None
+        for placeholder in list(dockwindow._PLACEHOLDERS.values()):
+            placeholder.deleteLater()
+        dockwindow._PLACEHOLDERS.clear()
+        cmds.optionVar(remove="dotblox_lazy_restore")
+    return run, cleanup
+
+
+_GLOB_ICONS = {}
+
+
+def _glob_icon(name):
+    """`dotbloxlib.icon.get_icon` before the index, caching only hits"""
+    cache = _GLOB_ICONS.get(name)
+    if cache:
+        return cache
+    files = glob.glob(os.path.join(icon.ICON_DIRECTORY, "%s*" % name))
+    if files:
+        _GLOB_ICONS[name] = files[0]
+        return files[0]
+
+
+@SUITE.case("icon.get_icon", params=["glob", "index"])
+def bench_icon_get_icon(mode):
+    """The icons of a panel looked up 50 times, a third of them missing"""
+    names = ["dblx_pivot", "dblx_polyMirror", "dblx_missing"] * 50
+    find = _glob_icon if mode == "glob" else icon.get_icon
+
+    def run():
+        for name in names:
+            find(name)
+    return run
+
+
+@SUITE.case("ui.dotmodeling_startup", params=["uncached", "registry"])
+def bench_dotmodeling_startup(mode):
+    """Create and show the DotModelingWidget
+
+    uncached rebuilds the icon index and empties the Qt icon caches before
+    every run, like a first start.
+    """
+    app = get_qapp()
+    fakemaya.new_scene()
+    from PySide2 import QtGui
+    from dotblox.modeling import dotmodeling
+    # Warm up the imports and the caches
+    dotmodeling.DotModelingWidget().close()
+
+    def run():
+        if mode == "uncached":
+            icon.build_index()
+            QtGui.QPixmapCache.clear()
+        widget = dotmodeling.DotModelingWidget()
+        widget.show()
+        app.processEvents()
+        widget.close()
+    return run
+
+
+def _bevel_scene(scale):
+    """A grid with a bevel shown on its vis node
+
+    Returns:
+        tuple: (vis node, edge count of the grid)
+    """
+    scene = fakemaya.new_scene()
+    width = grid_size(scale)
+    scene.create_grid("grid", width, width)
+    scene.add_bevel("grid", ["e[0]"])
+    vis_node = BevelEditor.show_bevel("polyBevel1")
+    return vis_node, min(scale, 2 * width * (width + 1))
+
+
+@SUITE.case("BevelEditor._eval_components")
+def bench_bevel_eval_components(scale):
+    vis_node, count = _bevel_scene(scale)
+    edges = [vis_node + ".e[%d]" % i for i in range(count)]
+
+    def run():
+        BevelEditor._eval_components(*edges)
+    return run
+
+
+@SUITE.case("BevelEditor.add_to_bevel")
+def bench_bevel_add_to_bevel(scale):
+    vis_node, count = _bevel_scene(scale)
+    edges = [vis_node + ".e[%d]" % i for i in range(0, count, 2)]
+
+    def run():
+        BevelEditor.add_to_bevel(*edges)
+    return run
+
+
+def _bevel_stack_scene():
+    """A 100x100 grid with 20 bevels of 500 edges each
+
+    Returns:
+        tuple: (src node, bevel nodes)
+    """
+    scene = fakemaya.new_scene()
+    scene.create_grid("grid", 100, 100)
+    for i in range(20):
+        scene.add_bevel("grid", ["e[%d:%d]" % (j, j + 9) for j in range(i * 20, 20000, 400)])
+    src_node = nodepath.full_path("grid")
+    return src_node, BevelEditor.get_bevel_nodes(src_node)
+
+
+@SUITE.case("BevelEditor.switch_bevels", params=["history", "session"])
+def bench_bevel_switch_bevels(mode):
+    """Flip through the 20 bevels of a mesh like the bevel editor does
+
+    history shows each bevel from its history like the editor did before
+    the sessions, session switches without the history.
+    """
+    src_node, bevel_nodes = _bevel_stack_scene()
+    if mode == "session":
+        bevelsession.switch(src_node, bevel_nodes[0])
+
+    def run():
+        for bevel_node in bevel_nodes:
+            if mode == "history":
+                BevelEditor.show_bevel(bevel_node)
+            else:
+                bevelsession.switch(src_node, bevel_node)
+    return run
+
+
+@SUITE.case("BevelEditor.list_bevels", params=["history", "session"])
+def bench_bevel_list_bevels(mode):
+    """List the 20 bevels of a mesh, their edge count and the one shown 20 times, like selecting it
+
+    history goes through the history like the editor did before the sessions.
+    """
+    from maya import cmds
+    src_node, bevel_nodes = _bevel_stack_scene()
+    bevelsession.switch(src_node, bevel_nodes[0])
+
+    def run():
+        for _ in range(20):
+            if mode == "history":
+                BevelEditor.get_vis_bevel(src_node)
+                for bevel_node in BevelEditor.get_bevel_nodes(src_node):
+                    intervals.count(intervals.from_components(
+                            cmds.getAttr(bevel_node + ".inputComponents") or []))
+            else:
+                session = bevelsession.get(src_node)
+                for bevel_node in session["bevels"]:
+                    intervals.count(bevelsession.session_edges(session, bevel_node))
+    return run
+
+
+@SUITE.case("general.pivot_to_bb")
+def bench_pivot_to_bb(scale):
+    scene = fakemaya.new_scene()
+    nodes = [scene.create_cube("cube%d" % i, position=(i, i, i)).path
+             for i in range(scale)]
+
+    def run():
+        general.pivot_to_bb(nodes)
+    return run
+
+
+if __name__ == "__main__":
+    sys.exit(benchmark.main(SUITE))
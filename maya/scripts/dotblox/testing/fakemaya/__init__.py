@@ -0,0 +1,249 @@
+"""Pure python stand-in for the parts of maya used by dotblox
+
+The fake modules are registered in `sys.modules` so the dotblox tools run
+unmodified against an in memory scene. Every `maya.cmds` call is counted
+which makes it possible to track the cost of an operation without maya.
+
+Usage:
+    from dotblox.testing import fakemaya
+    fakemaya.install()
+    scene = fakemaya.new_scene()
+    scene.create_cube("pCube1")
+
+    from dotblox.core import general
+    with fakemaya.counting() as counter:
+        general.pivot_to_bb(["pCube1"])
+    print(counter.cmds_total())
+
+It is also usable as the setup of the batch
+    python -m dotblox.batch job.json scene.json --setup dotblox.testing.fakemaya:install
+"""
+import contextlib
+import inspect
+import sys
+import types
+
+from dotblox.testing.fakemaya import cmds as _cmds
+from dotblox.testing.fakemaya import openmaya as _openmaya
+from dotblox.testing.fakemaya import scene as _scene
+
+_MODULES = [
+    "maya",
+    "maya.cmds",
+    "maya.api",
+    "maya.api.OpenMaya",
+    "maya.OpenMayaUI",
+    "maya.app",
+    "maya.app.general",
+    "maya.app.general.mayaMixin",
+]
+
+
+class CallCounter(object):
+    """Number of calls made to each `maya.cmds` function and api class"""
+    API_PREFIX = "OpenMaya."
+
+    def __init__(self, counts=None):
+        self.counts = dict(counts or {})
+
+    def count(self, name):
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def reset(self):
+        self.counts = {}
+
+    def cmds_total(self):
+        """Total calls made to `maya.cmds`"""
+        return sum(count for name, count in self.counts.items()
+                   if not name.startswith(self.API_PREFIX))
+
+    def api_total(self):
+        """Total api objects created"""
+        return sum(count for name, count in self.counts.items()
+                   if name.startswith(self.API_PREFIX))
+
+    def __sub__(self, other):
+        counts = {}
+        for name, count in self.counts.items():
+            count -= other.counts.get(name, 0)
+            if count:
+                counts[name] = count
+        return CallCounter(counts)
+
+    def __repr__(self):
+        return "<CallCounter cmds=%d api=%d>" % (self.cmds_total(), self.api_total())
+
+
+COUNTER = CallCounter()
+
+
+def _counted(name, func):
+    def wrap(*args, **kwargs):
+        COUNTER.count(name)
+        return func(*args, **kwargs)
+    wrap.__name__ = name
+    wrap.__doc__ = func.__doc__
+    return wrap
+
+
+def _build_cmds():
+    module = types.ModuleType("maya.cmds")
+    for name, func in inspect.getmembers(_cmds, inspect.isfunction):
+        if name.startswith("_") or func.__module__ != _cmds.__name__:
+            continue
+        setattr(module, name, _counted(name, func))
+    module.objectType = module.nodeType
+    return module
+
+
+def _build_openmaya():
+    module = types.ModuleType("maya.api.OpenMaya")
+    for name in dir(_openmaya):
+        if name.startswith("M"):
+            setattr(module, name, getattr(_openmaya, name))
+    return module
+
+
+def _build_openmayaui():
+    module = types.ModuleType("maya.OpenMayaUI")
+
+    class MQtUtil(object):
+        @staticmethod
+        def mainWindow():
+            return None
+
+        @staticmethod
+        def getCurrentParent():
+            return 0
+
+        @staticmethod
+        def findControl(name):
+            return 0
+
+        @staticmethod
+        def addWidgetToMayaLayout(widget, parent):
+            pass
+
+        @staticmethod
+        def fullName(ptr):
+            return ""
+
+    module.MQtUtil = MQtUtil
+    return module
+
+
+def _build_maya_mixin():
+    module = types.ModuleType("maya.app.general.mayaMixin")
+
+    class MayaQWidgetDockableMixin(object):
+        def __init__(self, parent=None, *args, **kwargs):
+            super(MayaQWidgetDockableMixin, self).__init__(parent, *args, **kwargs)
+            self.dockable_parameters = {}
+
+        def setDockableParameters(self, **kwargs):
+            self.dockable_parameters.update(kwargs)
+
+    module.MayaQWidgetDockableMixin = MayaQWidgetDockableMixin
+    return module
+
+
+def install():
+    """Register the fake maya modules in `sys.modules`
+
+    Calling this again keeps the modules that are already installed.
+
+    Returns:
+        module: the fake `maya` package
+    """
+    if is_installed():
+        return sys.modules["maya"]
+
+    maya = types.ModuleType("maya")
+    maya.__path__ = []
+    maya.cmds = _build_cmds()
+    maya.api = types.ModuleType("maya.api")
+    maya.api.__path__ = []
+    maya.api.OpenMaya = _build_openmaya()
+    maya.OpenMayaUI = _build_openmayaui()
+    maya.app = types.ModuleType("maya.app")
+    maya.app.__path__ = []
+    maya.app.general = types.ModuleType("maya.app.general")
+    maya.app.general.__path__ = []
+    maya.app.general.mayaMixin = _build_maya_mixin()
+    maya._dotblox_fake = True
+
+    _openmaya._count = lambda name: COUNTER.count(CallCounter.API_PREFIX + name)
+    _cmds._on_register = lambda name, func: setattr(maya.cmds, name, _counted(name, func))
+    _cmds._on_deregister = lambda name: delattr(maya.cmds, name)
+
+    for name in _MODULES:
+        module = maya
+        for part in name.split(".")[1:]:
+            module = getattr(module, part)
+        sys.modules[name] = module
+    return maya
+
+
+def uninstall():
+    """Remove the fake maya modules from `sys.modules`
+
+    Modules that imported maya keep their reference to the fake modules.
+    """
+    if not is_installed():
+        return
+    for name in _MODULES:
+        sys.modules.pop(name, None)
+    _openmaya._count = lambda name: None
+    _cmds._on_register = lambda name, func: None
+    _cmds._on_deregister = lambda name: None
+
+
+def is_installed():
+    """Check if the fake maya is what `import maya` returns"""
+    return getattr(sys.modules.get("maya"), "_dotblox_fake", False)
+
+
+def new_scene():
+    """Start a new empty scene
+
+    Returns:
+        dotblox.testing.fakemaya.scene.Scene:
+    """
+    return _scene.new()
+
+
+def current_scene():
+    """Get the scene `maya.cmds` currently operates on
+
+    Returns:
+        dotblox.testing.fakemaya.scene.Scene:
+    """
+    return _scene.current()
+
+
+def call_counts():
+    """Get a copy of the calls made since the last reset
+
+    Returns:
+        CallCounter:
+    """
+    return CallCounter(COUNTER.counts)
+
+
+def reset_call_counts():
+    COUNTER.reset()
+
+
+@contextlib.contextmanager
+def counting():
+    """Count the calls made within the context
+
+    Yields:
+        CallCounter: filled in with the calls once the context exits
+    """
+    result = CallCounter()
+    start = call_counts()
+    try:
+        yield result
+    finally:
+        result.counts = (call_counts() - start).counts
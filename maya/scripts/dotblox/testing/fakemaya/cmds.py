@@ -0,0 +1,816 @@
+"""Fake `maya.cmds` operating on :mod:`dotblox.testing.fakemaya.scene`
+
+The flags follow maya. Only the long names of the flags used by dotblox
+are supported unless noted.
+"""
+import os
+import sys
+
+from dotblox.testing.fakemaya import scene as _scene
+from dotblox.testing.fakemaya import openmaya as _openmaya
+from dotblox.testing.fakemaya.scene import Component, Node
+
+# Option vars are user preferences and outlive the scene
+OPTION_VARS = {}
+
+# Loaded plugin name: module
+PLUGINS = {}
+
+# Commands registered by plugins. See :func:`loadPlugin`
+COMMANDS = {}
+
+# Folder of the dotblox plugins, searched after `MAYA_PLUG_IN_PATH`
+PLUGIN_DIR = os.path.abspath(os.path.join(
+        os.path.dirname(__file__), "..", "..", "..", "..", "plugins"))
+
+# Hooked by :func:`dotblox.testing.fakemaya.install` to expose plugin commands
+_on_register = lambda name, func: None
+_on_deregister = lambda name: None
+
+_FILTER_MASKS = {
+    31: "vertex",
+    32: "edge",
+    34: "face",
+}
+
+
+def _current():
+    return _scene.current()
+
+
+def _flatten_args(args):
+    items = []
+    for arg in args:
+        if arg is None:
+            continue
+        if isinstance(arg, (list, tuple, set, frozenset)):
+            items.extend(_flatten_args(arg))
+        else:
+            items.append(arg)
+    return items
+
+
+def _split_plug(name):
+    """Split `node.attr` into the node and attribute"""
+    node, _, attr = name.partition(".")
+    return node, attr
+
+
+def _get_plug(name):
+    scene = _current()
+    node_name, attr = _split_plug(name)
+    node = scene.get(node_name)
+    scene.resolve_attr(node, attr)
+    return node, attr
+
+
+def _types(node_type):
+    if node_type is None:
+        return None
+    if isinstance(node_type, (list, tuple)):
+        return list(node_type)
+    return [node_type]
+
+
+def _resolve_items(names):
+    """Resolve names into nodes, components and plugs
+
+    Returns:
+        list[tuple]: (kind, item, attr) where kind is node, component or plug
+    """
+    scene = _current()
+    items = []
+    for name in names:
+        if isinstance(name, Node):
+            items.append(("node", name, None))
+            continue
+        component = scene.parse_component(name)
+        if component is not None:
+            items.append(("component", component, None))
+            continue
+        if "." in name:
+            node_name, attr = _split_plug(name)
+            for node in scene.match(node_name):
+                if "*" in attr:
+                    continue
+                if node.has_attr(attr):
+                    items.append(("plug", node, attr))
+            continue
+        for node in scene.match(name):
+            items.append(("node", node, None))
+    return items
+
+
+# ----------------------------------------------------------------------
+# Nodes
+# ----------------------------------------------------------------------
+def ls(*args, **kwargs):
+    scene = _current()
+    long = kwargs.get("long", kwargs.get("l", False))
+    flatten = kwargs.get("flatten", kwargs.get("fl", False))
+    objects_only = kwargs.get("objectsOnly", kwargs.get("o", False))
+    types = _types(kwargs.get("type", kwargs.get("typ")))
+    dag_objects = kwargs.get("dagObjects", kwargs.get("dag", False))
+    no_intermediate = kwargs.get("noIntermediate", kwargs.get("ni", False))
+    shapes = kwargs.get("shapes", False)
+    transforms = kwargs.get("transforms", False)
+
+    if kwargs.get("hilite", kwargs.get("hl", False)):
+        return []
+
+    names = _flatten_args(args)
+    selected_only = kwargs.get("selection", kwargs.get("sl", False))
+    if selected_only:
+        items = []
+        for item in scene.selection:
+            if isinstance(item, Component):
+                items.append(("component", item, None))
+            else:
+                items.append(("node", item, None))
+        if names:
+            selected = set(id(item[1]) for item in items)
+            items = [item for item in _resolve_items(names) if id(item[1]) in selected]
+    elif names:
+        items = _resolve_items(names)
+    else:
+        # Same as maya an empty list returns everything
+        items = [("node", node, None) for node in scene.nodes]
+
+    if dag_objects and (names or selected_only):
+        # Same as maya the given dag nodes are expanded to their descendants
+        expanded = []
+        for kind, item, attr in items:
+            expanded.append((kind, item, attr))
+            if kind == "node" and item.is_dag:
+                expanded.extend(("node", child, None) for child in item.descendants())
+        items = expanded
+
+    result = []
+    seen = set()
+    for kind, item, attr in items:
+        node = item.node if kind == "component" else item
+        if objects_only and kind != "node":
+            kind = "node"
+            item = node
+        if types is not None and not any(node.is_type(t) for t in types):
+            continue
+        if dag_objects and not node.is_dag:
+            continue
+        if shapes and not node.is_type("shape"):
+            continue
+        if transforms and node.type != "transform":
+            continue
+        if no_intermediate and node.type == "mesh" and node.attrs["intermediateObject"]:
+            continue
+
+        if kind == "plug":
+            # Plugs are listed as many times as they are given
+            result.append(scene.node_name(node, long=long) + "." + attr)
+            continue
+        if kind == "component":
+            names = item.names(long=long, flatten=flatten)
+        else:
+            names = [scene.node_name(node, long=long)]
+        # Same as maya every node and component is listed once
+        for name in names:
+            if name not in seen:
+                seen.add(name)
+                result.append(name)
+    return result
+
+
+def objExists(name):
+    try:
+        return bool(_resolve_items([name]))
+    except ValueError:
+        return False
+
+
+def nodeType(name, **kwargs):
+    scene = _current()
+    node = scene.get(_split_plug(name)[0])
+    if kwargs.get("inherited", kwargs.get("i", False)):
+        return list(reversed(node.inherited))
+    return node.type
+
+
+objectType = nodeType
+
+
+def createNode(node_type, name=None, parent=None, skipSelect=False, **kwargs):
+    scene = _current()
+    name = name or kwargs.get("n")
+    parent = parent or kwargs.get("p")
+    node = scene.create_node(node_type, name, parent=parent, select=not skipSelect)
+    return scene.node_name(node)
+
+
+def delete(*args, **kwargs):
+    scene = _current()
+    names = _flatten_args(args) or [item for item in scene.selection if isinstance(item, Node)]
+    for name in names:
+        node = scene.get(name)
+        if node in scene.nodes:
+            scene.delete(node)
+
+
+def listRelatives(*args, **kwargs):
+    scene = _current()
+    full_path = kwargs.get("fullPath", kwargs.get("f", False))
+    types = _types(kwargs.get("type", kwargs.get("typ")))
+    names = _flatten_args(args)
+    if not names:
+        names = [item for item in scene.selection if isinstance(item, Node)]
+
+    result = []
+    for name in names:
+        node = scene.get(name)
+        if kwargs.get("parent", kwargs.get("p", False)):
+            relatives = [node.parent] if node.parent is not None else []
+        elif kwargs.get("allDescendents", kwargs.get("ad", False)):
+            # Maya lists the deepest descendents first
+            relatives = list(reversed(list(node.descendants())))
+        else:
+            relatives = list(node.children)
+
+        if kwargs.get("shapes", kwargs.get("s", False)):
+            relatives = [relative for relative in relatives if relative.is_type("shape")]
+        if kwargs.get("noIntermediate", kwargs.get("ni", False)):
+            relatives = [relative for relative in relatives
+                         if not relative.attrs.get("intermediateObject")]
+        if types is not None:
+            relatives = [relative for relative in relatives
+                         if any(relative.is_type(t) for t in types)]
+        result.extend(scene.node_name(relative, long=full_path) for relative in relatives)
+    return result or None
+
+
+def listHistory(*args, **kwargs):
+    scene = _current()
+    names = _flatten_args(args)
+    result = []
+    for name in names:
+        node = scene.get(_split_plug(name)[0])
+        for history_node in scene.history(node):
+            result.append(scene.node_name(history_node))
+    return result or None
+
+
+def listConnections(*args, **kwargs):
+    scene = _current()
+    plugs = kwargs.get("plugs", kwargs.get("p", False))
+    source = kwargs.get("source", kwargs.get("s", True))
+    destination = kwargs.get("destination", kwargs.get("d", True))
+    types = _types(kwargs.get("type", kwargs.get("t")))
+
+    result = []
+    for name in _flatten_args(args):
+        node_name, attr = _split_plug(name)
+        node = scene.get(node_name)
+        connections = []
+        if source:
+            connections.extend(src for src, dst in scene.inputs(node)
+                               if not attr or dst[1] == attr)
+        if destination:
+            connections.extend(dst for src, dst in scene.outputs(node)
+                               if not attr or src[1] == attr)
+        for plug in connections:
+            if types is not None and not any(plug[0].is_type(t) for t in types):
+                continue
+            if plugs:
+                result.append(scene.plug_name(plug))
+            else:
+                result.append(scene.node_name(plug[0]))
+    return result or None
+
+
+# ----------------------------------------------------------------------
+# Attributes
+# ----------------------------------------------------------------------
+def getAttr(name, **kwargs):
+    scene = _current()
+    node, attr = _get_plug(name)
+    value = scene.get_attr(node, attr)
+    attr_type = node.attr_types.get(attr)
+    if attr_type == "float3":
+        return [tuple(value)]
+    if attr_type == "componentList":
+        return list(value) or None
+    if attr_type == "matrix":
+        return list(value)
+    return value
+
+
+def setAttr(name, *values, **kwargs):
+    scene = _current()
+    node, attr = _get_plug(name)
+    attr_type = kwargs.get("type", kwargs.get("typ"))
+    if attr_type == "componentList":
+        value = values[1:1 + int(values[0])]
+    elif attr_type == "string":
+        value = values[0]
+    elif len(values) == 1:
+        value = values[0]
+    else:
+        value = values
+    scene.set_attr(node, attr, value)
+
+
+def addAttr(*args, **kwargs):
+    scene = _current()
+    names = _flatten_args(args)
+    attr = kwargs.get("longName", kwargs.get("ln"))
+    attr_type = kwargs.get("attributeType", kwargs.get("at")) or \
+        kwargs.get("dataType", kwargs.get("dt")) or "double"
+    default = kwargs.get("defaultValue", kwargs.get("dv"))
+    if default is None:
+        default = "" if attr_type == "string" else (None if attr_type == "message" else 0)
+    for name in names:
+        scene.add_attr(scene.get(name), attr, attr_type, default)
+
+
+def connectAttr(src, dst, force=False, **kwargs):
+    scene = _current()
+    scene.connect(_get_plug(src), _get_plug(dst), force=force or kwargs.get("f", False))
+
+
+def disconnectAttr(src, dst, **kwargs):
+    scene = _current()
+    scene.disconnect(_get_plug(src), _get_plug(dst))
+
+
+def isConnected(src, dst, **kwargs):
+    scene = _current()
+    return scene.is_connected(_get_plug(src), _get_plug(dst))
+
+
+# ----------------------------------------------------------------------
+# Selection
+# ----------------------------------------------------------------------
+def select(*args, **kwargs):
+    _select(*args, **kwargs)
+    _scene.emit("SelectionChanged")
+
+
+def _select(*args, **kwargs):
+    scene = _current()
+    if kwargs.get("clear", kwargs.get("cl", False)):
+        scene.selection = []
+        return
+
+    names = _flatten_args(args)
+    items = []
+    for name in names:
+        resolved = _resolve_items([name])
+        if not resolved:
+            raise ValueError("No object matches name: %s" % name)
+        for kind, item, attr in resolved:
+            items.append(item)
+
+    if kwargs.get("deselect", kwargs.get("d", False)):
+        scene.selection = [item for item in scene.selection if item not in items]
+        return
+
+    if kwargs.get("add", False):
+        selection = list(scene.selection)
+    else:
+        selection = []
+
+    for item in items:
+        if isinstance(item, Component):
+            # Merge components of the same node
+            for current in selection:
+                if isinstance(current, Component) and current.node is item.node \
+                        and current.kind == item.kind:
+                    current.indices.update(item.indices)
+                    break
+            else:
+                selection.append(Component(item.node, item.kind, item.indices))
+        elif item not in selection:
+            selection.append(item)
+    scene.selection = selection
+
+
+def filterExpand(*args, **kwargs):
+    masks = kwargs.get("selectionMask", kwargs.get("sm"))
+    if not isinstance(masks, (list, tuple)):
+        masks = [masks]
+    kinds = [_FILTER_MASKS.get(mask) for mask in masks]
+    full_path = kwargs.get("fullPath", kwargs.get("fp", False))
+
+    result = []
+    for kind, item, attr in _resolve_items(_flatten_args(args)):
+        if kind == "component" and item.kind in kinds:
+            result.extend(item.names(long=full_path, flatten=True))
+    return result or None
+
+
+def polyListComponentConversion(*args, **kwargs):
+    border = kwargs.get("border", kwargs.get("bo", False))
+    if kwargs.get("toEdge", kwargs.get("te", False)):
+        to_kind = "edge"
+    elif kwargs.get("toFace", kwargs.get("tf", False)):
+        to_kind = "face"
+    else:
+        to_kind = "vertex"
+
+    converted = {}
+    for kind, item, attr in _resolve_items(_flatten_args(args)):
+        if kind != "component":
+            continue
+        mesh = item.shape.mesh
+        key = id(item.node)
+        component = converted.setdefault(key, Component(item.node, to_kind, []))
+
+        if item.kind == "vertex" and to_kind == "edge":
+            for index in item.indices:
+                component.indices.update(mesh.vertex_edges[index])
+        elif item.kind == "face" and to_kind == "edge":
+            counts = {}
+            for index in item.indices:
+                for edge in mesh.face_edges[index]:
+                    counts[edge] = counts.get(edge, 0) + 1
+            if border:
+                component.indices.update(edge for edge, count in counts.items() if count == 1)
+            else:
+                component.indices.update(counts)
+        elif item.kind == "edge" and to_kind == "vertex":
+            for index in item.indices:
+                component.indices.update(mesh.edges[index])
+        elif item.kind == "face" and to_kind == "vertex":
+            for index in item.indices:
+                component.indices.update(mesh.faces[index])
+        elif item.kind == to_kind:
+            component.indices.update(item.indices)
+
+    result = []
+    for component in converted.values():
+        if component.indices:
+            result.extend(component.names())
+    return result
+
+
+# ----------------------------------------------------------------------
+# Transforms
+# ----------------------------------------------------------------------
+def _world_translation(node):
+    x = y = z = 0.0
+    while node is not None:
+        if node.type == "transform":
+            tx, ty, tz = node.attrs["translate"]
+            x, y, z = x + tx, y + ty, z + tz
+        node = node.parent
+    return x, y, z
+
+
+def xform(*args, **kwargs):
+    scene = _current()
+    names = _flatten_args(args)
+    if not names:
+        names = [scene.node_name(item) for item in scene.selection if isinstance(item, Node)]
+    query = kwargs.get("query", kwargs.get("q", False))
+    world_space = kwargs.get("worldSpace", kwargs.get("ws", False))
+
+    if kwargs.get("centerPivotsOnComponents") or kwargs.get("cpc"):
+        return
+
+    for name in names:
+        node_name, attr = _split_plug(name)
+        node = scene.get(node_name)
+        if query:
+            if attr in ("rotatePivot", "scalePivot") or kwargs.get("rotatePivot", kwargs.get("rp")):
+                return list(node.attrs[attr or "rotatePivot"])
+            if "matrix" in kwargs or "m" in kwargs:
+                x, y, z = _world_translation(node) if world_space else node.attrs["translate"]
+                return [1.0, 0.0, 0.0, 0.0,
+                        0.0, 1.0, 0.0, 0.0,
+                        0.0, 0.0, 1.0, 0.0,
+                        x, y, z, 1.0]
+            if kwargs.get("translation", kwargs.get("t")):
+                if world_space:
+                    return list(_world_translation(node))
+                return list(node.attrs["translate"])
+            return None
+
+        matrix = kwargs.get("matrix", kwargs.get("m"))
+        if matrix is not None:
+            translate = list(matrix[12:15])
+            if world_space and node.parent is not None:
+                parent = _world_translation(node.parent)
+                translate = [value - offset for value, offset in zip(translate, parent)]
+            node.attrs["translate"] = tuple(float(i) for i in translate)
+        translation = kwargs.get("translation", kwargs.get("t"))
+        if translation is not None:
+            node.attrs["translate"] = tuple(float(i) for i in translation)
+
+
+def move(*args, **kwargs):
+    scene = _current()
+    values = [arg for arg in args if isinstance(arg, (int, float))]
+    names = _flatten_args([arg for arg in args if not isinstance(arg, (int, float))])
+    if not names:
+        names = [scene.node_name(item) for item in scene.selection if isinstance(item, Node)]
+    relative = kwargs.get("relative", kwargs.get("r", False))
+
+    for name in names:
+        node_name, attr = _split_plug(name)
+        node = scene.get(node_name)
+        attr = attr or "translate"
+        current = node.attrs[attr] if relative else (0.0, 0.0, 0.0)
+        node.attrs[attr] = tuple(a + float(b) for a, b in zip(current, values))
+
+
+def rotate(*args, **kwargs):
+    scene = _current()
+    values = [arg for arg in args if isinstance(arg, (int, float))]
+    names = _flatten_args([arg for arg in args if not isinstance(arg, (int, float))])
+    if not names:
+        names = [scene.node_name(item) for item in scene.selection if isinstance(item, Node)]
+    for name in names:
+        node = scene.get(name)
+        current = node.attrs["rotate"] if kwargs.get("relative") else (0.0, 0.0, 0.0)
+        node.attrs["rotate"] = tuple(a + float(b) for a, b in zip(current, values))
+
+
+# ----------------------------------------------------------------------
+# Modeling
+# ----------------------------------------------------------------------
+def polyMirrorFace(*args, **kwargs):
+    scene = _current()
+    names = _flatten_args(args)
+    if not names:
+        names = [scene.node_name(item) for item in scene.selection if isinstance(item, Node)]
+    result = []
+    for name in names:
+        modifier = scene.add_poly_modifier(name, "polyMirror",
+                                           axis=kwargs.get("axis", 0),
+                                           axisDirection=kwargs.get("axisDirection", 1),
+                                           mirrorAxis=kwargs.get("mirrorAxis", 1))
+        result.append(scene.node_name(modifier))
+    return result
+
+
+def polyCrease(*args, **kwargs):
+    value = kwargs.get("value", kwargs.get("v", 0))
+    for kind, item, attr in _resolve_items(_flatten_args(args)):
+        if kind != "component" or item.kind != "edge":
+            continue
+        creases = item.shape.mesh.creases
+        for index in item.indices:
+            if value:
+                creases[index] = value
+            else:
+                creases.pop(index, None)
+
+
+def polyEvaluate(*args, **kwargs):
+    scene = _current()
+    names = _flatten_args(args)
+    if not names:
+        names = [scene.node_name(item) for item in scene.selection if isinstance(item, Node)]
+    mesh = scene.shape(scene.get(names[0])).mesh
+    counts = {
+        "vertex": mesh.count("vertex"),
+        "edge": mesh.count("edge"),
+        "face": mesh.count("face"),
+    }
+    flags = [flag for flag in counts if kwargs.get(flag)]
+    if len(flags) == 1:
+        return counts[flags[0]]
+    return dict((flag, counts[flag]) for flag in flags or counts)
+
+
+def sets(*args, **kwargs):
+    scene = _current()
+    element = kwargs.get("forceElement", kwargs.get("fe"))
+    if element is not None:
+        for name in _flatten_args(args):
+            scene.shading[scene.node_name(scene.get(name), long=True)] = element
+
+
+def createDisplayLayer(*args, **kwargs):
+    scene = _current()
+    layer = scene.create_node("displayLayer", kwargs.get("name", kwargs.get("n", "layer1")),
+                              select=False)
+    if not kwargs.get("empty", kwargs.get("e", False)):
+        members = _flatten_args(args) or [scene.node_name(node, long=True)
+                                          for node in scene.selection
+                                          if isinstance(node, Node)]
+        if members:
+            editDisplayLayerMembers(layer.name, members)
+    return layer.name
+
+
+def editDisplayLayerMembers(layer, *args, **kwargs):
+    scene = _current()
+    layer = scene.get(layer)
+    if kwargs.get("query", kwargs.get("q", False)):
+        long = kwargs.get("fullNames", kwargs.get("fn", False))
+        members = [dst[0] for src, dst in scene.outputs(layer)
+                   if src[1] == "drawInfo" and dst[1] == "drawOverride"]
+        return [scene.node_name(node, long=long) for node in members] or None
+
+    count = 0
+    for name in _flatten_args(args):
+        for node in scene.match(name):
+            if not node.is_dag:
+                continue
+            scene.connect((layer, "drawInfo"), (node, "drawOverride"), force=True)
+            count += 1
+    return count
+
+
+def editDisplayLayerGlobals(**kwargs):
+    scene = _current()
+    if kwargs.get("query", kwargs.get("q", False)):
+        if kwargs.get("currentDisplayLayer", kwargs.get("cdl", False)):
+            return scene.current_display_layer
+        raise TypeError("Unsupported query flags: %s" % sorted(kwargs))
+
+    layer = kwargs.get("currentDisplayLayer", kwargs.get("cdl"))
+    if layer is not None:
+        scene.current_display_layer = scene.get(layer).name
+        _scene.emit("displayLayerManagerChange")
+
+
+# ----------------------------------------------------------------------
+# Scene and preferences
+# ----------------------------------------------------------------------
+def file(*args, **kwargs):
+    path = args[0] if args else None
+    if kwargs.get("new", False):
+        _scene.new()
+        return ""
+    if kwargs.get("open", kwargs.get("o", False)):
+        if not os.path.exists(path):
+            raise RuntimeError("File not found: %s" % path)
+        scene = _scene.Scene.load(path)
+        scene.file_path = path
+        _scene.set_current(scene)
+        return path
+    if kwargs.get("rename", kwargs.get("rn")):
+        _current().file_path = kwargs.get("rename", kwargs.get("rn"))
+        return _current().file_path
+    if kwargs.get("save", kwargs.get("s", False)):
+        scene = _current()
+        if not scene.file_path:
+            raise RuntimeError("Scene has not been named")
+        scene.save(scene.file_path)
+        return scene.file_path
+    if kwargs.get("query", kwargs.get("q", False)):
+        if kwargs.get("sceneName", kwargs.get("sn", False)):
+            return _current().file_path
+    return None
+
+
+def optionVar(**kwargs):
+    for flag in ("intValue", "floatValue", "stringValue", "iv", "fv", "sv"):
+        if flag in kwargs:
+            key, value = kwargs[flag]
+            OPTION_VARS[key] = value
+            return
+    if "exists" in kwargs or "ex" in kwargs:
+        return kwargs.get("exists", kwargs.get("ex")) in OPTION_VARS
+    if "query" in kwargs or "q" in kwargs:
+        return OPTION_VARS.get(kwargs.get("query", kwargs.get("q")), 0)
+    if "remove" in kwargs or "rm" in kwargs:
+        OPTION_VARS.pop(kwargs.get("remove", kwargs.get("rm")), None)
+
+
+def colorManagementPrefs(**kwargs):
+    prefs = _current().color_management
+    if kwargs.pop("query", kwargs.pop("q", False)):
+        for flag in kwargs:
+            return prefs.get(flag)
+        return None
+    kwargs.pop("edit", kwargs.pop("e", False))
+    prefs.update(kwargs)
+    _scene.emit("colorMgtPrefsChanged")
+
+
+def undoInfo(**kwargs):
+    scene = _current()
+    if kwargs.get("openChunk", kwargs.get("ock", False)):
+        scene.undo_chunks += 1
+    elif kwargs.get("closeChunk", kwargs.get("cck", False)):
+        scene.undo_chunks -= 1
+    elif kwargs.get("query", kwargs.get("q", False)):
+        return True
+
+
+def undo():
+    """Undo the last undoable plugin command"""
+    scene = _current()
+    if not scene.undo_queue:
+        warning("There are no more commands to undo.")
+        return
+    scene.undo_queue.pop().undoIt()
+
+
+# ----------------------------------------------------------------------
+# Plugins
+# ----------------------------------------------------------------------
+def _find_plugin(name):
+    paths = os.environ.get("MAYA_PLUG_IN_PATH", "").split(os.pathsep) + [PLUGIN_DIR]
+    file_name = name if name.endswith(".py") else name + ".py"
+    for path in paths:
+        if path and os.path.isfile(os.path.join(path, file_name)):
+            return os.path.join(path, file_name)
+    return None
+
+
+def _import_plugin(name, path):
+    module_name = "_fakemaya_plugin_" + name
+    try:
+        import importlib.util
+    except ImportError:
+        import imp
+        return imp.load_source(module_name, path)
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def loadPlugin(name, **kwargs):
+    name = os.path.splitext(os.path.basename(name))[0]
+    if name in PLUGINS:
+        return [name]
+    path = _find_plugin(name)
+    if path is None:
+        raise RuntimeError("Plug-in, \"%s\", was not found on MAYA_PLUG_IN_PATH." % name)
+    module = _import_plugin(name, path)
+    module.initializePlugin(object())
+    PLUGINS[name] = module
+    return [name]
+
+
+def unloadPlugin(name, **kwargs):
+    module = PLUGINS.pop(name, None)
+    if module is not None:
+        module.uninitializePlugin(object())
+    return [name]
+
+
+def pluginInfo(name=None, **kwargs):
+    if kwargs.get("listPlugins", kwargs.get("ls", False)):
+        return sorted(PLUGINS)
+    if kwargs.get("loaded", kwargs.get("l", False)):
+        return name in PLUGINS
+    if kwargs.get("registered", kwargs.get("r", False)):
+        return name in PLUGINS or _find_plugin(name) is not None
+    raise RuntimeError("pluginInfo: unsupported flags %s" % sorted(kwargs))
+
+
+def _register_command(name, creator):
+    if name in COMMANDS:
+        raise RuntimeError("(kFailure): Command %s is already registered" % name)
+
+    def command(*args, **kwargs):
+        instance = creator()
+        result = instance.doIt(_openmaya.MArgList(args))
+        if instance.isUndoable():
+            _current().undo_queue.append(instance)
+        return result
+
+    command.__name__ = name
+    COMMANDS[name] = command
+    setattr(sys.modules[__name__], name, command)
+    _on_register(name, command)
+
+
+def _deregister_command(name):
+    COMMANDS.pop(name, None)
+    if hasattr(sys.modules[__name__], name):
+        delattr(sys.modules[__name__], name)
+    _on_deregister(name)
+
+
+def workspaceControlState(name, **kwargs):
+    # No saved layouts
+    return False
+
+
+def workspaceControl(name, **kwargs):
+    return False
+
+
+def refresh(**kwargs):
+    _current().evaluate()
+
+
+def warning(*args, **kwargs):
+    _current().warnings.append(" ".join(str(arg) for arg in args))
+
+
+def inViewMessage(**kwargs):
+    pass
+
+
+def about(**kwargs):
+    if kwargs.get("batch", kwargs.get("b", False)):
+        return True
+    if kwargs.get("version", kwargs.get("v", False)):
+        return "2020"
+    if kwargs.get("apiVersion", kwargs.get("api", False)):
+        return 20200000
@@ -0,0 +1,680 @@
+"""Fake `maya.api.OpenMaya` operating on :mod:`dotblox.testing.fakemaya.scene`"""
+import math
+
+from dotblox.testing.fakemaya import scene as _scene
+from dotblox.testing.fakemaya.scene import Component, Node
+
+# Hooked by :func:`dotblox.testing.fakemaya.install` to count api usage
+_count = lambda name: None
+
+
+class MSpace(object):
+    kInvalid = 0
+    kTransform = 1
+    kPreTransform = 2
+    kObject = 2
+    kPostTransform = 3
+    kWorld = 4
+
+
+class MFn(object):
+    kInvalid = 0
+    kBase = 1
+    kDependencyNode = 4
+    kDagNode = 107
+    kTransform = 110
+    kShape = 248
+    kMesh = 296
+    kDisplayLayer = 731
+    kPolyBevel = 398
+    kMeshVertComponent = 31
+    kMeshEdgeComponent = 32
+    kMeshPolygonComponent = 34
+
+
+_API_TYPES = {
+    "transform": MFn.kTransform,
+    "mesh": MFn.kMesh,
+    "displayLayer": MFn.kDisplayLayer,
+    "polyBevel3": MFn.kPolyBevel,
+}
+
+_COMPONENT_API_TYPES = {
+    "vertex": MFn.kMeshVertComponent,
+    "edge": MFn.kMeshEdgeComponent,
+    "face": MFn.kMeshPolygonComponent,
+}
+
+
+class MVector(object):
+    def __init__(self, *args):
+        if len(args) == 1:
+            args = tuple(args[0])
+        values = list(args) + [0.0] * (3 - len(args))
+        self.x, self.y, self.z = [float(i) for i in values[:3]]
+
+    def __getitem__(self, index):
+        return (self.x, self.y, self.z)[index]
+
+    def __len__(self):
+        return 3
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
+    def __add__(self, other):
+        return self.__class__(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other):
+        return MVector(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __mul__(self, other):
+        if isinstance(other, MVector):
+            return self.x * other.x + self.y * other.y + self.z * other.z
+        return self.__class__(self.x * other, self.y * other, self.z * other)
+
+    __rmul__ = __mul__
+
+    def __xor__(self, other):
+        return MVector(self.y * other.z - self.z * other.y,
+                       self.z * other.x - self.x * other.z,
+                       self.x * other.y - self.y * other.x)
+
+    def __eq__(self, other):
+        return tuple(self) == tuple(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def length(self):
+        return math.sqrt(self.x ** 2 + self.y ** 2 + self.z ** 2)
+
+    def normal(self):
+        length = self.length() or 1.0
+        return MVector(self.x / length, self.y / length, self.z / length)
+
+    def __repr__(self):
+        return "%s(%s, %s, %s)" % (self.__class__.__name__, self.x, self.y, self.z)
+
+
+class MPoint(MVector):
+    def __init__(self, *args):
+        MVector.__init__(self, *args)
+        self.w = 1.0
+
+    def __sub__(self, other):
+        return MVector(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def distanceTo(self, other):
+        return (self - other).length()
+
+
+class MBoundingBox(object):
+    def __init__(self, min_point=None, max_point=None):
+        self.min = MPoint(min_point) if min_point is not None else MPoint()
+        self.max = MPoint(max_point) if max_point is not None else MPoint()
+        self._empty = min_point is None
+
+    @property
+    def width(self):
+        return self.max.x - self.min.x
+
+    @property
+    def height(self):
+        return self.max.y - self.min.y
+
+    @property
+    def depth(self):
+        return self.max.z - self.min.z
+
+    @property
+    def center(self):
+        return MPoint((self.min.x + self.max.x) / 2.0,
+                      (self.min.y + self.max.y) / 2.0,
+                      (self.min.z + self.max.z) / 2.0)
+
+    def expand(self, other):
+        if isinstance(other, MBoundingBox):
+            if other._empty:
+                return
+            self.expand(other.min)
+            self.expand(other.max)
+            return
+        if self._empty:
+            self.min = MPoint(other)
+            self.max = MPoint(other)
+            self._empty = False
+            return
+        self.min = MPoint(min(self.min.x, other.x), min(self.min.y, other.y), min(self.min.z, other.z))
+        self.max = MPoint(max(self.max.x, other.x), max(self.max.y, other.y), max(self.max.z, other.z))
+
+
+class MObject(object):
+    def __init__(self, item=None):
+        self._item = item
+
+    kNullObj = None
+
+    def isNull(self):
+        return self._item is None
+
+    def apiType(self):
+        if isinstance(self._item, Component):
+            return _COMPONENT_API_TYPES[self._item.kind]
+        if isinstance(self._item, Node):
+            return _API_TYPES.get(self._item.type, MFn.kDependencyNode)
+        return MFn.kInvalid
+
+    def hasFn(self, fn):
+        if isinstance(self._item, Node):
+            if fn == MFn.kDependencyNode:
+                return True
+            if fn == MFn.kDagNode:
+                return self._item.is_dag
+            if fn == MFn.kShape:
+                return self._item.is_type("shape")
+        return self.apiType() == fn
+
+    def __eq__(self, other):
+        return isinstance(other, MObject) and self._item is other._item
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return id(self._item)
+
+
+MObject.kNullObj = MObject()
+
+
+def _node(obj):
+    if isinstance(obj, MDagPath):
+        return obj._node
+    if isinstance(obj, MObject):
+        return obj._item
+    return obj
+
+
+class MDagPath(object):
+    def __init__(self, node=None):
+        self._node = node
+
+    @staticmethod
+    def getAPathTo(obj):
+        return MDagPath(_node(obj))
+
+    def node(self):
+        return MObject(self._node)
+
+    def transform(self):
+        node = self._node
+        if node.type != "transform":
+            node = node.parent
+        return MObject(node)
+
+    def extendToShape(self):
+        shape = self._node.scene.shape(self._node)
+        if shape is None:
+            raise RuntimeError("(kFailure): Object has no shape")
+        self._node = shape
+        return self
+
+    def fullPathName(self):
+        return self._node.path
+
+    def partialPathName(self):
+        return self._node.scene.node_name(self._node)
+
+    def isValid(self):
+        return self._node is not None and self._node in self._node.scene.nodes
+
+    def apiType(self):
+        return self.node().apiType()
+
+
+class MSelectionList(object):
+    def __init__(self, other=None):
+        _count("MSelectionList")
+        self._items = []
+        # ids of the items, to merge an item added twice
+        self._ids = set()
+        for item in (other._items if other is not None else []):
+            self._append(item)
+
+    def _append(self, item, merge=False):
+        if merge and id(item) in self._ids:
+            return
+        self._items.append(item)
+        self._ids.add(id(item))
+
+    def add(self, item, mergeWithExisting=True):
+        _count("MSelectionList.add")
+        scene = _scene.current()
+        if isinstance(item, MDagPath):
+            self._append(item._node, mergeWithExisting)
+            return self
+        if isinstance(item, MObject):
+            self._append(item._item, mergeWithExisting)
+            return self
+
+        component = None
+        try:
+            component = scene.parse_component(item)
+            if component is None:
+                nodes = scene.match(item.split(".")[0])
+            else:
+                nodes = [component]
+        except ValueError:
+            nodes = []
+        if not nodes:
+            raise RuntimeError("(kInvalidParameter): Object does not exist")
+        for node in nodes:
+            # Like maya a node already in the list is not added again
+            self._append(node, mergeWithExisting)
+        return self
+
+    def length(self):
+        return len(self._items)
+
+    def clear(self):
+        self._items = []
+        self._ids = set()
+
+    def isEmpty(self):
+        return not self._items
+
+    def _node(self, index):
+        item = self._items[index]
+        if isinstance(item, Component):
+            return item.node
+        return item
+
+    def getDependNode(self, index):
+        return MObject(self._node(index))
+
+    def getDagPath(self, index):
+        node = self._node(index)
+        if not node.is_dag:
+            raise TypeError("(kInvalidParameter): Object is not a DAG node")
+        return MDagPath(node)
+
+    def getComponent(self, index):
+        item = self._items[index]
+        if isinstance(item, Component):
+            return MDagPath(item.shape), MObject(item)
+        return MDagPath(item), MObject.kNullObj
+
+    def getSelectionStrings(self, index=None):
+        items = self._items if index is None else [self._items[index]]
+        result = []
+        for item in items:
+            if isinstance(item, Component):
+                result.extend(item.names())
+            else:
+                result.append(item.scene.node_name(item))
+        return result
+
+
+class MItDependencyNodes(object):
+    def __init__(self, filter=MFn.kInvalid):
+        _count(self.__class__.__name__)
+        self._nodes = [node for node in _scene.current().nodes
+                       if filter == MFn.kInvalid or MObject(node).hasFn(filter)]
+        self._index = 0
+
+    def isDone(self):
+        return self._index >= len(self._nodes)
+
+    def next(self):
+        self._index += 1
+
+    def thisNode(self):
+        return MObject(self._nodes[self._index])
+
+    def reset(self):
+        self._index = 0
+
+
+class MGlobal(object):
+    @staticmethod
+    def getActiveSelectionList():
+        selection = MSelectionList()
+        for item in _scene.current().selection:
+            selection._append(item)
+        return selection
+
+    @staticmethod
+    def displayWarning(message):
+        _scene.current().warnings.append(message)
+
+
+class MFnBase(object):
+    def __init__(self, obj=None):
+        _count(self.__class__.__name__)
+        self._node = None
+        if obj is not None:
+            self.setObject(obj)
+
+    def setObject(self, obj):
+        node = _node(obj)
+        if not self._compatible(node):
+            raise RuntimeError("(kInvalidParameter): Object is incompatible with this method")
+        self._node = node
+        return self
+
+    def _compatible(self, node):
+        return isinstance(node, Node)
+
+    def object(self):
+        return MObject(self._node)
+
+
+class MFnDependencyNode(MFnBase):
+    def name(self):
+        return self._node.name
+
+    def absoluteName(self):
+        return ":" + self._node.name
+
+    @property
+    def typeName(self):
+        return self._node.type
+
+    def hasAttribute(self, attr):
+        return self._node.has_attr(attr)
+
+    def findPlug(self, attr, want_networked_plug=False):
+        if not self._node.has_attr(attr):
+            raise RuntimeError("(kInvalidParameter): No element at given index")
+        return MPlug(self._node, attr)
+
+
+class MFnDagNode(MFnDependencyNode):
+    def _compatible(self, node):
+        return isinstance(node, Node) and node.is_dag
+
+    def fullPathName(self):
+        return self._node.path
+
+    def partialPathName(self):
+        return self._node.scene.node_name(self._node)
+
+    def childCount(self):
+        return len(self._node.children)
+
+    def child(self, index):
+        return MObject(self._node.children[index])
+
+    def parentCount(self):
+        return 1 if self._node.parent is not None else 0
+
+    def parent(self, index=0):
+        return MObject(self._node.parent)
+
+    def getPath(self):
+        return MDagPath(self._node)
+
+    @property
+    def isIntermediateObject(self):
+        return bool(self._node.attrs.get("intermediateObject"))
+
+    @property
+    def boundingBox(self):
+        return _bounding_box(self._node)
+
+
+def _bounding_box(node):
+    """Bounding box of the node including its own translation"""
+    bb = MBoundingBox()
+    if node.mesh is not None:
+        points = node.mesh.bounding_box()
+        if points is not None:
+            bb = MBoundingBox(*points)
+        return bb
+
+    for child in node.children:
+        if child.type == "mesh" and child.attrs["intermediateObject"]:
+            continue
+        bb.expand(_bounding_box(child))
+
+    if node.type == "transform" and not bb._empty:
+        offset = MVector(node.attrs["translate"])
+        bb.min = MPoint(bb.min + offset)
+        bb.max = MPoint(bb.max + offset)
+    return bb
+
+
+class MFnMesh(MFnDagNode):
+    def setObject(self, obj):
+        node = _node(obj)
+        if isinstance(node, Node) and node.type == "transform":
+            node = node.scene.shape(node)
+        return MFnDagNode.setObject(self, node)
+
+    def _compatible(self, node):
+        return isinstance(node, Node) and node.type == "mesh"
+
+    @property
+    def numVertices(self):
+        return self._node.mesh.count("vertex")
+
+    @property
+    def numEdges(self):
+        return self._node.mesh.count("edge")
+
+    @property
+    def numPolygons(self):
+        return self._node.mesh.count("face")
+
+    def _offset(self, space):
+        if space == MSpace.kWorld:
+            bb_node = self._node.parent
+            x = y = z = 0.0
+            while bb_node is not None:
+                tx, ty, tz = bb_node.attrs.get("translate", (0, 0, 0))
+                x, y, z = x + tx, y + ty, z + tz
+                bb_node = bb_node.parent
+            return MVector(x, y, z)
+        return MVector()
+
+    def getPoint(self, index, space=MSpace.kObject):
+        return MPoint(MVector(self._node.mesh.points[index]) + self._offset(space))
+
+    def getPoints(self, space=MSpace.kObject):
+        offset = self._offset(space)
+        return [MPoint(MVector(point) + offset) for point in self._node.mesh.points]
+
+    def getClosestPoint(self, point, space=MSpace.kObject):
+        """Closest face center to the given point"""
+        mesh = self._node.mesh
+        offset = self._offset(space)
+        closest = None
+        for face_id, face in enumerate(mesh.faces):
+            center = MPoint(*[sum(mesh.points[i][axis] for i in face) / float(len(face))
+                              for axis in range(3)]) + offset
+            distance = MPoint(center).distanceTo(point)
+            if closest is None or distance < closest[0]:
+                closest = (distance, MPoint(center), face_id)
+        return closest[1], closest[2]
+
+
+class MFnSingleIndexedComponent(MFnBase):
+    def _compatible(self, node):
+        return isinstance(node, Component)
+
+    @property
+    def elementCount(self):
+        return len(self._node.indices)
+
+    def element(self, index):
+        return sorted(self._node.indices)[index]
+
+    def getElements(self):
+        return sorted(self._node.indices)
+
+
+class MPlug(object):
+    def __init__(self, node=None, attr=None):
+        _count(self.__class__.__name__)
+        self._node = node
+        self._attr = attr
+
+    def isNull(self):
+        return self._node is None
+
+    def node(self):
+        return MObject(self._node)
+
+    def name(self):
+        return self._node.scene.plug_name((self._node, self._attr))
+
+    def partialName(self, *args, **kwargs):
+        return self._attr
+
+    @property
+    def isCompound(self):
+        return self._node.attr_types.get(self._attr) == "float3"
+
+    def numChildren(self):
+        return 3 if self.isCompound else 0
+
+    def child(self, index):
+        return MPlug(self._node, _scene.CHILD_SUFFIXES[self._attr][index])
+
+    def _get(self):
+        return self._node.scene.get_attr(self._node, self._attr)
+
+    def _set(self, value):
+        self._node.scene.set_attr(self._node, self._attr, value)
+
+    def asBool(self):
+        return bool(self._get())
+
+    def asInt(self):
+        return int(self._get())
+
+    def asFloat(self):
+        return float(self._get())
+
+    asDouble = asFloat
+
+    def setBool(self, value):
+        self._set(bool(value))
+
+    def setInt(self, value):
+        self._set(int(value))
+
+    def setFloat(self, value):
+        self._set(float(value))
+
+    setDouble = setFloat
+
+
+class MDGModifier(object):
+    """Queue of plug values applied by :meth:`doIt` and reverted by :meth:`undoIt`"""
+    def __init__(self):
+        _count(self.__class__.__name__)
+        self._operations = []
+        self._done = []
+
+    def _queue(self, plug, value):
+        self._operations.append((MPlug(plug._node, plug._attr), value))
+        return self
+
+    def newPlugValueBool(self, plug, value):
+        return self._queue(plug, bool(value))
+
+    def newPlugValueInt(self, plug, value):
+        return self._queue(plug, int(value))
+
+    def newPlugValueFloat(self, plug, value):
+        return self._queue(plug, float(value))
+
+    newPlugValueDouble = newPlugValueFloat
+
+    def doIt(self):
+        for plug, value in self._operations[len(self._done):]:
+            self._done.append((plug, plug._get()))
+            plug._set(value)
+        return self
+
+    def undoIt(self):
+        for plug, value in reversed(self._done):
+            plug._set(value)
+        self._done = []
+        return self
+
+
+class MArgList(object):
+    def __init__(self, args=None):
+        self._args = list(args or [])
+
+    def __len__(self):
+        return len(self._args)
+
+    def asString(self, index):
+        return str(self._args[index])
+
+
+class MPxCommand(object):
+    def __init__(self):
+        pass
+
+    def doIt(self, args):
+        pass
+
+    def redoIt(self):
+        pass
+
+    def undoIt(self):
+        pass
+
+    def isUndoable(self):
+        return False
+
+
+class MFnPlugin(MFnBase):
+    def __init__(self, obj=None, vendor="Unknown", version="Unknown", api_version="Any"):
+        MFnBase.__init__(self)
+        self._node = obj
+
+    def _compatible(self, node):
+        return True
+
+    def registerCommand(self, name, creator, syntax=None):
+        from dotblox.testing.fakemaya import cmds
+        cmds._register_command(name, creator)
+
+    def deregisterCommand(self, name):
+        from dotblox.testing.fakemaya import cmds
+        cmds._deregister_command(name)
+
+
+class MMessage(object):
+    _next_id = [0]
+
+    @staticmethod
+    def _new_id():
+        MMessage._next_id[0] += 1
+        return MMessage._next_id[0]
+
+    @staticmethod
+    def removeCallback(callback_id):
+        for callbacks in _scene.EVENT_CALLBACKS.values():
+            if callbacks.pop(callback_id, None) is not None:
+                return
+        raise RuntimeError("(kInvalidParameter): Invalid callback id")
+
+    @staticmethod
+    def removeCallbacks(callback_ids):
+        for callback_id in callback_ids:
+            MMessage.removeCallback(callback_id)
+
+
+class MEventMessage(MMessage):
+    @staticmethod
+    def addEventCallback(event, func, client_data=None):
+        callback_id = MMessage._new_id()
+        _scene.EVENT_CALLBACKS.setdefault(event, {})[callback_id] = (func, client_data)
+        return callback_id
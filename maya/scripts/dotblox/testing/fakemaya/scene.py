@@ -0,0 +1,814 @@
+"""The in memory scene used by the fake `maya.cmds` and `maya.api.OpenMaya`
+
+Only what dotblox uses is modelled.
+
+    - Transforms only carry their translation into world space.
+      Rotation and scale are stored but do not affect bounding boxes.
+    - Poly modifiers are hooked into the history but only mirror changes
+      the topology.
+"""
+import fnmatch
+import json
+import re
+
+DAG_ATTRS = {
+    "message": ("message", None),
+    "visibility": ("bool", True),
+    "intermediateObject": ("bool", False),
+    "overrideEnabled": ("bool", False),
+    "overrideRGBColors": ("bool", False),
+    "overrideColor": ("int", 0),
+    "overrideColorRGB": ("float3", (0.0, 0.0, 0.0)),
+    "useOutlinerColor": ("bool", False),
+    "outlinerColor": ("float3", (0.0, 0.0, 0.0)),
+    "drawOverride": ("message", None),
+}
+
+TRANSFORM_ATTRS = {
+    "translate": ("float3", (0.0, 0.0, 0.0)),
+    "rotate": ("float3", (0.0, 0.0, 0.0)),
+    "scale": ("float3", (1.0, 1.0, 1.0)),
+    "rotatePivot": ("float3", (0.0, 0.0, 0.0)),
+    "scalePivot": ("float3", (0.0, 0.0, 0.0)),
+}
+
+MESH_ATTRS = {
+    "inMesh": ("mesh", None),
+    "outMesh": ("mesh", None),
+    "worldMesh": ("mesh", None),
+}
+
+POLY_MODIFIER_ATTRS = {
+    "message": ("message", None),
+    "inputPolymesh": ("mesh", None),
+    "output": ("mesh", None),
+    "inputComponents": ("componentList", ()),
+}
+
+DISPLAY_LAYER_ATTRS = {
+    "message": ("message", None),
+    "enabled": ("bool", True),
+    "visibility": ("bool", True),
+    "displayType": ("int", 0),
+    "color": ("int", 0),
+    "overrideRGBColors": ("bool", False),
+    "overrideColorRGB": ("float3", (0.0, 0.0, 0.0)),
+    "drawInfo": ("message", None),
+    "identification": ("int", 0),
+}
+
+NODE_TYPES = {
+    "transform": (("dagNode",), [DAG_ATTRS, TRANSFORM_ATTRS]),
+    "mesh": (("shape", "dagNode"), [DAG_ATTRS, MESH_ATTRS]),
+    "displayLayer": ((), [DISPLAY_LAYER_ATTRS]),
+    "shadingEngine": ((), [{"message": ("message", None)}]),
+}
+for _poly_type in ["polyBevel", "polyBevel2", "polyBevel3", "polyCube", "polyPlane"]:
+    NODE_TYPES[_poly_type] = (("polyBase",), [POLY_MODIFIER_ATTRS])
+NODE_TYPES["polyMirror"] = (("polyBase",), [POLY_MODIFIER_ATTRS, {
+    "axis": ("int", 0),
+    "axisDirection": ("int", 1),
+    "mirrorAxis": ("int", 1),
+}])
+
+# Children of the compound attributes
+CHILD_SUFFIXES = {
+    "overrideColorRGB": ["overrideColorR", "overrideColorG", "overrideColorB"],
+    "outlinerColor": ["outlinerColorR", "outlinerColorG", "outlinerColorB"],
+    "translate": ["translateX", "translateY", "translateZ"],
+    "rotate": ["rotateX", "rotateY", "rotateZ"],
+    "scale": ["scaleX", "scaleY", "scaleZ"],
+    "rotatePivot": ["rotatePivotX", "rotatePivotY", "rotatePivotZ"],
+    "scalePivot": ["scalePivotX", "scalePivotY", "scalePivotZ"],
+}
+CHILD_ATTRS = {}
+for _parent, _children in CHILD_SUFFIXES.items():
+    for _index, _child in enumerate(_children):
+        CHILD_ATTRS[_child] = (_parent, _index)
+
+COMPONENT_TYPES = {
+    "vtx": "vertex",
+    "e": "edge",
+    "f": "face",
+}
+
+_COMPONENT_RE = re.compile(r"^(?P<node>[^.]+)\.(?P<kind>vtx|e|f)\[(?P<index>[^\]]*)\]$")
+
+
+class MeshData(object):
+    """Polygon data of a mesh shape
+
+    Args:
+        points (list[tuple]): vertex positions
+        faces (list[tuple]): vertex indices of each face
+    """
+
+    def __init__(self, points=None, faces=None):
+        self.points = [tuple(float(i) for i in point) for point in points or []]
+        self.faces = [tuple(face) for face in faces or []]
+        self.creases = {}
+        self._build_edges()
+
+    def _build_edges(self):
+        self.edges = []
+        self.face_edges = []
+        self.vertex_edges = [[] for _ in self.points]
+        edge_ids = {}
+        for face in self.faces:
+            face_edges = []
+            for i, vertex in enumerate(face):
+                key = tuple(sorted((vertex, face[(i + 1) % len(face)])))
+                edge_id = edge_ids.get(key)
+                if edge_id is None:
+                    edge_id = edge_ids[key] = len(self.edges)
+                    self.edges.append(key)
+                    self.vertex_edges[key[0]].append(edge_id)
+                    self.vertex_edges[key[1]].append(edge_id)
+                face_edges.append(edge_id)
+            self.face_edges.append(face_edges)
+
+    def count(self, kind):
+        """Number of elements of the given component kind"""
+        return {
+            "vertex": len(self.points),
+            "edge": len(self.edges),
+            "face": len(self.faces),
+        }[kind]
+
+    def bounding_box(self):
+        """Get the min and max of all the points
+
+        Returns:
+            tuple: (min, max) or None when there are no points
+        """
+        if not self.points:
+            return None
+        xs, ys, zs = zip(*self.points)
+        return (min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs))
+
+    def copy(self):
+        mesh = MeshData()
+        mesh.points = list(self.points)
+        mesh.faces = list(self.faces)
+        mesh.edges = list(self.edges)
+        mesh.face_edges = [list(edges) for edges in self.face_edges]
+        mesh.vertex_edges = [list(edges) for edges in self.vertex_edges]
+        mesh.creases = dict(self.creases)
+        return mesh
+
+    def mirror(self, axis=0, direction=1):
+        """Mirror the mesh across the axis of the object pivot"""
+        offset = len(self.points)
+        points = []
+        for point in self.points:
+            point = list(point)
+            point[axis] *= -1
+            points.append(tuple(point))
+        self.points = self.points + points
+        self.faces = self.faces + [tuple(i + offset for i in reversed(face))
+                                   for face in self.faces]
+        self._build_edges()
+
+    def to_dict(self):
+        return {"points": self.points, "faces": self.faces}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["points"], data["faces"])
+
+
+class Node(object):
+    """A dependency node of the scene"""
+
+    def __init__(self, scene, name, node_type, parent=None):
+        self.scene = scene
+        self.name = name
+        self.type = node_type
+        self.parent = parent
+        self.children = []
+        self.attrs = {}
+        self.attr_types = {}
+        self.dynamic_attrs = []
+        self.mesh = None
+
+        inherited, attr_sets = NODE_TYPES.get(node_type, ((), [{"message": ("message", None)}]))
+        self.inherited = (node_type,) + tuple(inherited)
+        for attr_set in attr_sets:
+            for attr, (attr_type, default) in attr_set.items():
+                self.attr_types[attr] = attr_type
+                self.attrs[attr] = default
+
+        if node_type == "mesh":
+            self.mesh = MeshData()
+
+    @property
+    def is_dag(self):
+        return "dagNode" in self.inherited
+
+    @property
+    def path(self):
+        if not self.is_dag:
+            return self.name
+        names = []
+        node = self
+        while node is not None:
+            names.append(node.name)
+            node = node.parent
+        return "|" + "|".join(reversed(names))
+
+    def is_type(self, node_type):
+        return node_type in self.inherited
+
+    def has_attr(self, attr):
+        return attr in self.attr_types or attr in CHILD_ATTRS and CHILD_ATTRS[attr][0] in self.attr_types
+
+    def descendants(self):
+        for child in self.children:
+            yield child
+            for descendant in child.descendants():
+                yield descendant
+
+    def __repr__(self):
+        return "<Node %s %s>" % (self.type, self.path)
+
+
+class Component(object):
+    """A set of component indices of a mesh
+
+    Args:
+        node (Node): the transform or shape the component was given with
+        kind (str): vertex, edge or face
+        indices (set[int]):
+    """
+    PREFIXES = dict((value, key) for key, value in COMPONENT_TYPES.items())
+
+    def __init__(self, node, kind, indices):
+        self.node = node
+        self.kind = kind
+        self.indices = set(indices)
+
+    @property
+    def shape(self):
+        return self.node.scene.shape(self.node)
+
+    def names(self, long=False, flatten=False):
+        """Get the maya names of the component
+
+        Returns:
+            list[str]: `node.e[0:3]` or flattened `node.e[0]`
+        """
+        node_name = self.node.scene.node_name(self.node, long=long)
+        prefix = self.PREFIXES[self.kind]
+        if flatten:
+            return ["%s.%s[%d]" % (node_name, prefix, index)
+                    for index in sorted(self.indices)]
+        return ["%s.%s[%s]" % (node_name, prefix, index_range)
+                for index_range in compress_indices(self.indices)]
+
+    def __repr__(self):
+        return "<Component %s>" % self.names()
+
+
+def compress_indices(indices):
+    """Compress the given indices into maya index ranges
+
+    Returns:
+        list[str]: ["0:3", "5"]
+    """
+    ranges = []
+    start = end = None
+    for index in sorted(indices):
+        if start is None:
+            start = end = index
+        elif index == end + 1:
+            end = index
+        else:
+            ranges.append((start, end))
+            start = end = index
+    if start is not None:
+        ranges.append((start, end))
+    return [str(start) if start == end else "%d:%d" % (start, end)
+            for start, end in ranges]
+
+
+def expand_indices(index, count):
+    """Expand a maya index range into indices
+
+    Args:
+        index (str): "3", "3:6", ":", "*"
+        count (int): number of elements available
+
+    Returns:
+        list[int]
+    """
+    if index in ("*", ":", ""):
+        return list(range(count))
+    if ":" in index:
+        start, end = index.split(":")
+        start = int(start) if start else 0
+        end = int(end) if end else count - 1
+        return list(range(start, end + 1))
+    return [int(index)]
+
+
+# Event name: {callback id: (function, client data)}
+EVENT_CALLBACKS = {}
+
+
+def emit(event):
+    """Call the functions registered with `MEventMessage.addEventCallback`"""
+    for func, client_data in list(EVENT_CALLBACKS.get(event, {}).values()):
+        func(client_data)
+
+
+class Scene(object):
+    """Container of all the nodes, connections, selection and preferences"""
+
+    def __init__(self):
+        self.nodes = []
+        self._by_name = {}
+        # destination plug -> source plug. plug being (node, attr)
+        self.connections = {}
+        self.selection = []
+        self.color_management = {
+            "cmEnabled": True,
+            "cmConfigFileEnabled": False,
+            "configFilePath": "",
+            "renderingSpaceName": "scene-linear Rec.709-sRGB",
+            "viewTransformName": "sRGB gamma",
+        }
+        self.file_path = ""
+        self.warnings = []
+        self.undo_chunks = 0
+        # Undoable plugin commands. See :func:`dotblox.testing.fakemaya.cmds.undo`
+        self.undo_queue = []
+        self.shading = {}
+        self.create_node("shadingEngine", "initialShadingGroup", select=False)
+        self.create_node("displayLayer", "defaultLayer", select=False)
+        self.current_display_layer = "defaultLayer"
+
+    # ------------------------------------------------------------------
+    # Names
+    # ------------------------------------------------------------------
+    def unique_name(self, name, parent=None):
+        """Get a name that does not clash with the siblings of the parent
+        or with the dependency nodes when there is no parent
+        """
+        if not self._taken(name, parent):
+            return name
+        match = re.match(r"^(.*?)(\d*)$", name)
+        base, number = match.group(1), match.group(2)
+        number = int(number) if number else 0
+        while True:
+            number += 1
+            candidate = "%s%d" % (base, number)
+            if not self._taken(candidate, parent):
+                return candidate
+
+    def _taken(self, name, parent=None):
+        nodes = self._by_name.get(name, [])
+        if parent is not None:
+            return any(node.parent is parent for node in nodes)
+        return any(node.parent is None for node in nodes)
+
+    def node_name(self, node, long=False):
+        """Get the full path or the shortest unique name of the node"""
+        if not node.is_dag:
+            return node.name
+        path = node.path
+        if long:
+            return path
+        if len(self._by_name.get(node.name, [])) == 1:
+            return node.name
+        # Shortest unique partial path
+        names = path.split("|")[1:]
+        for i in range(len(names) - 1, -1, -1):
+            partial = "|".join(names[i:])
+            if len(self.find(partial)) == 1:
+                return partial
+        return path
+
+    def find(self, name):
+        """Find the nodes matching the exact name or path
+
+        Returns:
+            list[Node]
+        """
+        if "|" not in name:
+            return list(self._by_name.get(name, []))
+        leaf = name.rsplit("|", 1)[-1]
+        if name.startswith("|"):
+            return [node for node in self._by_name.get(leaf, []) if node.path == name]
+        return [node for node in self._by_name.get(leaf, [])
+                if node.path.endswith("|" + name)]
+
+    def get(self, name):
+        """Get a single node
+
+        Raises:
+            ValueError: node does not exist or is not unique
+        """
+        if isinstance(name, Node):
+            return name
+        nodes = self.find(name)
+        if len(nodes) != 1:
+            if not nodes:
+                raise ValueError("No object matches name: %s" % name)
+            raise ValueError("More than one object matches name: %s" % name)
+        return nodes[0]
+
+    def match(self, pattern):
+        """Find the nodes matching the given pattern which may contain wildcards"""
+        if "*" not in pattern and "?" not in pattern:
+            return self.find(pattern)
+        if "|" in pattern:
+            if not pattern.startswith("|"):
+                pattern = "*|" + pattern
+            return [node for node in self.nodes if fnmatch.fnmatchcase(node.path, pattern)]
+        return [node for node in self.nodes if fnmatch.fnmatchcase(node.name, pattern)]
+
+    # ------------------------------------------------------------------
+    # Nodes
+    # ------------------------------------------------------------------
+    def create_node(self, node_type, name=None, parent=None, select=True):
+        """Create a node
+
+        A shape created without a parent gets a transform created for it
+
+        Returns:
+            Node:
+        """
+        if isinstance(parent, str):
+            parent = self.get(parent)
+
+        if node_type == "mesh" and parent is None:
+            parent = self.create_node("transform", "polySurface1", select=False)
+            if name is None:
+                name = parent.name.replace("polySurface", "polySurfaceShape")
+
+        if name is None:
+            name = node_type + "1"
+
+        is_dag = "dagNode" in NODE_TYPES.get(node_type, ((),))[0]
+        name = self.unique_name(name, parent if is_dag else None)
+        node = Node(self, name, node_type, parent=parent if is_dag else None)
+        if node.parent is not None:
+            node.parent.children.append(node)
+        self.nodes.append(node)
+        self._by_name.setdefault(name, []).append(node)
+        if select:
+            self.selection = [node]
+        if node_type == "displayLayer":
+            emit("displayLayerAdded")
+        return node
+
+    def delete(self, node):
+        for child in list(node.children):
+            self.delete(child)
+        for dst, src in list(self.connections.items()):
+            if dst[0] is node or src[0] is node:
+                del self.connections[dst]
+        if node.parent is not None:
+            node.parent.children.remove(node)
+        self.nodes.remove(node)
+        self._by_name[node.name].remove(node)
+        if not self._by_name[node.name]:
+            del self._by_name[node.name]
+        self.selection = [item for item in self.selection
+                          if item is not node
+                          and not (isinstance(item, Component) and item.node is node)]
+        if node.type == "displayLayer":
+            emit("displayLayerDeleted")
+
+    def shape(self, node):
+        """Get the first non intermediate shape of the given node"""
+        if node.type == "mesh":
+            return node
+        for child in node.children:
+            if child.type == "mesh" and not child.attrs["intermediateObject"]:
+                return child
+
+    def create_mesh(self, name, points, faces, parent=None):
+        """Create a transform with a mesh shape
+
+        Returns:
+            Node: the transform
+        """
+        transform = self.create_node("transform", name, parent=parent, select=False)
+        shape = self.create_node("mesh", transform.name + "Shape", parent=transform, select=False)
+        shape.mesh = MeshData(points, faces)
+        return transform
+
+    def create_cube(self, name, parent=None, size=1.0, position=(0, 0, 0)):
+        """Create a cube mesh centered on the given position"""
+        half = size / 2.0
+        x, y, z = position
+        points = [(x + i * half, y + j * half, z + k * half)
+                  for i, j, k in [(-1, -1, 1), (1, -1, 1), (-1, 1, 1), (1, 1, 1),
+                                  (-1, 1, -1), (1, 1, -1), (-1, -1, -1), (1, -1, -1)]]
+        faces = [(0, 1, 3, 2), (2, 3, 5, 4), (4, 5, 7, 6),
+                 (6, 7, 1, 0), (1, 7, 5, 3), (6, 0, 2, 4)]
+        return self.create_mesh(name, points, faces, parent=parent)
+
+    def create_grid(self, name, width, height, parent=None):
+        """Create a plane on the xz axis with the given number of faces"""
+        points = [(float(x), 0.0, float(z))
+                  for z in range(height + 1)
+                  for x in range(width + 1)]
+        faces = []
+        for z in range(height):
+            for x in range(width):
+                i = z * (width + 1) + x
+                faces.append((i, i + 1, i + width + 2, i + width + 1))
+        return self.create_mesh(name, points, faces, parent=parent)
+
+    def add_poly_modifier(self, node, node_type, name=None, **attrs):
+        """Hook a poly modifier into the history of the given mesh
+
+        When the mesh does not have any history an intermediate shape
+        is created as the input, the same as maya.
+
+        Returns:
+            Node: the modifier node
+        """
+        shape = self.shape(self.get(node))
+        # polyBevel3 nodes are named polyBevel1
+        name = name or node_type.rstrip("0123456789") + "1"
+        modifier = self.create_node(node_type, name, select=False)
+        for attr, value in attrs.items():
+            self.set_attr(modifier, attr, value)
+
+        src = self.connections.get((shape, "inMesh"))
+        if src is None:
+            orig = self.create_node("mesh", "polySurfaceShape1", parent=shape.parent, select=False)
+            orig.mesh = shape.mesh.copy()
+            orig.attrs["intermediateObject"] = True
+            src = (orig, "outMesh")
+        self.connect(src, (modifier, "inputPolymesh"), force=True)
+        self.connect((modifier, "output"), (shape, "inMesh"), force=True)
+        return modifier
+
+    def add_bevel(self, node, edges, name=None):
+        """Add a bevel node to the given mesh
+
+        Args:
+            node (str): transform of the mesh
+            edges (list[str]): edges `["e[0:3]"]`
+        """
+        return self.add_poly_modifier(node, "polyBevel3", name=name,
+                                      inputComponents=tuple(edges))
+
+    # ------------------------------------------------------------------
+    # Attributes
+    # ------------------------------------------------------------------
+    def resolve_attr(self, node, attr):
+        """Get the attribute and child index of the given attribute name
+
+        Returns:
+            tuple: (attribute, child index or None)
+
+        Raises:
+            ValueError: attribute does not exist
+        """
+        if attr in node.attr_types:
+            return attr, None
+        if attr in CHILD_ATTRS and CHILD_ATTRS[attr][0] in node.attr_types:
+            return CHILD_ATTRS[attr]
+        raise ValueError("No object matches name: %s.%s" % (node.name, attr))
+
+    def get_attr(self, node, attr):
+        attr, index = self.resolve_attr(node, attr)
+        value = node.attrs[attr]
+        if index is not None:
+            return value[index]
+        return value
+
+    def set_attr(self, node, attr, value):
+        attr, index = self.resolve_attr(node, attr)
+        attr_type = node.attr_types[attr]
+        if index is not None:
+            current = list(node.attrs[attr])
+            current[index] = float(value)
+            node.attrs[attr] = tuple(current)
+            return
+        if attr_type == "bool":
+            value = bool(value)
+        elif attr_type == "int":
+            value = int(value)
+        elif attr_type in ("float", "double"):
+            value = float(value)
+        elif attr_type == "float3":
+            value = tuple(float(i) for i in value)
+        elif attr_type == "componentList":
+            value = tuple(value)
+        node.attrs[attr] = value
+
+    def add_attr(self, node, attr, attr_type, default=None):
+        if attr in node.attr_types:
+            raise RuntimeError("Found existing attribute %s on %s" % (attr, node.name))
+        node.attr_types[attr] = attr_type
+        node.attrs[attr] = default
+        node.dynamic_attrs.append(attr)
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+    def connect(self, src, dst, force=False):
+        if dst in self.connections and not force:
+            raise RuntimeError("%s is already connected" % self.plug_name(dst))
+        self.connections[dst] = src
+        self.evaluate(dst)
+
+    def disconnect(self, src, dst):
+        if self.connections.get(dst) != src:
+            raise RuntimeError("%s is not connected to %s" % (
+                self.plug_name(src), self.plug_name(dst)))
+        del self.connections[dst]
+
+    def is_connected(self, src, dst):
+        return self.connections.get(dst) == src
+
+    def plug_name(self, plug, long=False):
+        return self.node_name(plug[0], long=long) + "." + plug[1]
+
+    def inputs(self, node):
+        """Get the connections into the node
+
+        Returns:
+            list[tuple]: (source plug, destination plug)
+        """
+        return [(src, dst) for dst, src in self.connections.items() if dst[0] is node]
+
+    def outputs(self, node):
+        """Get the connections out of the node
+
+        Returns:
+            list[tuple]: (source plug, destination plug)
+        """
+        return [(src, dst) for dst, src in self.connections.items() if src[0] is node]
+
+    def history(self, node):
+        """Get the node and all its upstream geometry history"""
+        if node.type == "transform":
+            start = [child for child in node.children if child.type == "mesh"
+                     and not child.attrs["intermediateObject"]]
+        else:
+            start = [node]
+
+        result = []
+        stack = list(reversed(start))
+        while stack:
+            current = stack.pop()
+            if current in result:
+                continue
+            result.append(current)
+            for src, dst in sorted(self.inputs(current), key=lambda c: c[1][1]):
+                if current.attr_types.get(dst[1]) == "mesh":
+                    stack.append(src[0])
+        return result
+
+    def evaluate_mesh(self, plug):
+        """Evaluate the mesh data coming out of the given plug"""
+        node = plug[0]
+        if node.type == "mesh":
+            src = self.connections.get((node, "inMesh"))
+            if src is not None and plug[1] != "inMesh":
+                node.mesh = self.evaluate_mesh(src)
+            return node.mesh
+        src = self.connections.get((node, "inputPolymesh"))
+        if src is None:
+            return None
+        mesh = self.evaluate_mesh(src)
+        if mesh is not None and node.type == "polyMirror":
+            mesh = mesh.copy()
+            mesh.mirror(node.attrs["axis"], node.attrs["axisDirection"])
+        return mesh
+
+    def evaluate(self, dst=None):
+        """Pull mesh data into shapes with incoming mesh connections"""
+        if dst is not None:
+            targets = [dst]
+        else:
+            targets = list(self.connections)
+        for target in targets:
+            node, attr = target
+            if node.type == "mesh" and attr == "inMesh":
+                mesh = self.evaluate_mesh(self.connections[target])
+                if mesh is not None:
+                    node.mesh = mesh.copy()
+
+    # ------------------------------------------------------------------
+    # Components
+    # ------------------------------------------------------------------
+    def parse_component(self, name):
+        """Parse `node.e[0:3]` into a component
+
+        Returns:
+            Component: or None if the name is not a component
+        """
+        match = _COMPONENT_RE.match(name)
+        if not match:
+            return None
+        node = self.get(match.group("node"))
+        shape = self.shape(node)
+        if shape is None:
+            raise ValueError("No object matches name: %s" % name)
+        kind = COMPONENT_TYPES[match.group("kind")]
+        count = shape.mesh.count(kind)
+        indices = expand_indices(match.group("index"), count)
+        for index in indices:
+            if index >= count:
+                raise ValueError("No object matches name: %s" % name)
+        return Component(node, kind, indices)
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+    def to_dict(self):
+        nodes = []
+        for node in self.nodes:
+            attrs = dict((attr, value) for attr, value in node.attrs.items()
+                         if node.attr_types[attr] not in ("message", "mesh"))
+            nodes.append({
+                "name": node.name,
+                "type": node.type,
+                "parent": node.parent.path if node.parent is not None else None,
+                "attrs": attrs,
+                "dynamic": [[attr, node.attr_types[attr]] for attr in node.dynamic_attrs],
+                "mesh": node.mesh.to_dict() if node.mesh is not None else None,
+            })
+        connections = [[self.plug_name(src, long=True), self.plug_name(dst, long=True)]
+                       for dst, src in self.connections.items()]
+        return {
+            "nodes": nodes,
+            "connections": connections,
+            "colorManagement": self.color_management,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        scene = cls()
+        scene.nodes = []
+        scene._by_name = {}
+        scene.selection = []
+        for node_data in data["nodes"]:
+            parent = scene.get(node_data["parent"]) if node_data["parent"] else None
+            node = Node(scene, node_data["name"], node_data["type"], parent=parent)
+            if parent is not None:
+                parent.children.append(node)
+            for attr, attr_type in node_data.get("dynamic", []):
+                scene.add_attr(node, attr, attr_type)
+            for attr, value in node_data["attrs"].items():
+                if isinstance(value, list):
+                    value = tuple(value)
+                node.attrs[attr] = value
+            if node_data.get("mesh"):
+                node.mesh = MeshData.from_dict(node_data["mesh"])
+            scene.nodes.append(node)
+            scene._by_name.setdefault(node.name, []).append(node)
+        for src, dst in data.get("connections", []):
+            src_node, src_attr = src.split(".", 1)
+            dst_node, dst_attr = dst.split(".", 1)
+            scene.connections[(scene.get(dst_node), dst_attr)] = (scene.get(src_node), src_attr)
+        scene.color_management.update(data.get("colorManagement", {}))
+        return scene
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r") as f:
+            return cls.from_dict(json.load(f))
+
+
+_CURRENT = [Scene()]
+
+
+def current():
+    """Get the scene the fake maya operates on
+
+    Returns:
+        Scene:
+    """
+    return _CURRENT[0]
+
+
+def new():
+    """Start a new scene
+
+    Returns:
+        Scene:
+    """
+    _CURRENT[0] = Scene()
+    emit("NewSceneOpened")
+    emit("colorMgtPrefsChanged")
+    return _CURRENT[0]
+
+
+def set_current(scene):
+    _CURRENT[0] = scene
+    emit("SceneOpened")
+    emit("colorMgtPrefsChanged")
+    return scene
@@ -0,0 +1,127 @@
+import json
+import os
+import shutil
+import tempfile
+
+from dotblox.testing import fakemaya
+
+fakemaya.install()
+
+from maya import cmds
+
+from dotblox.batch import runner
+
+SETUP = "dotblox.testing.fakemaya:install"
+
+
+def _make_scene(directory):
+    scene = fakemaya.new_scene()
+    scene.create_cube("a_GEO", position=(0, 2, 0))
+    scene.create_cube("b_GEO", position=(3, 0, 0))
+    scene.create_grid("grid_GEO", 4, 4)
+    scene.add_bevel("grid_GEO", ["e[0:3]"])
+    cmds.createDisplayLayer(name="props", empty=True)
+    cmds.createDisplayLayer(name="sets", empty=True)
+    path = os.path.join(directory, "scene.ma")
+    cmds.file(rename=path)
+    cmds.file(save=True)
+    return path
+
+
+def _run(operations):
+    """Run the operations on a new scene and open the saved scene
+
+    Returns:
+        dict: the result of the scene
+    """
+    directory = tempfile.mkdtemp()
+    try:
+        path = _make_scene(directory)
+        job = {"operations": operations, "output": "{dirname}/{name}_batch{ext}"}
+        results = runner.run([path], job, workers=1, setup=SETUP)
+        assert len(results) == 1
+        result = results[0]
+        if result["success"]:
+            assert result["output"] == os.path.join(directory, "scene_batch.ma")
+            cmds.file(result["output"], open=True, force=True)
+        return result
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_pivot():
+    result = _run([{"op": "pivot", "nodes": "*_GEO", "axis": "y", "direction": -1}])
+    assert result["success"], result["error"]
+    assert result["operations"][0][:2] == ["pivot", 3]
+    assert cmds.xform("a_GEO", query=True, worldSpace=True, rotatePivot=True) == [0.0, 1.5, 0.0]
+
+
+def test_mirror():
+    result = _run([{"op": "mirror", "nodes": "a_GEO"}])
+    assert result["success"], result["error"]
+    assert cmds.polyEvaluate("a_GEO", vertex=True) == 16
+    assert cmds.polyEvaluate("b_GEO", vertex=True) == 8
+
+
+def test_bevel():
+    result = _run([{"op": "bevel", "nodes": "grid_GEO", "add": ["e[5]"], "remove": ["e[0]"]}])
+    assert result["success"], result["error"]
+    assert cmds.getAttr("polyBevel1.inputComponents") == ["e[1:3]", "e[5]"]
+    # The vis node is only used while editing
+    assert not cmds.ls("*_bevel_vis")
+
+
+def test_colorize():
+    result = _run([{"op": "colorize", "nodes": "a_GEO", "color": "#ff0000"}])
+    assert result["success"], result["error"]
+    assert cmds.getAttr("a_GEO.overrideRGBColors")
+    assert cmds.getAttr("a_GEO.overrideColorRGB")[0][1:] == (0.0, 0.0)
+    assert not cmds.getAttr("b_GEO.overrideEnabled")
+
+
+def test_distinct_and_clear_color():
+    result = _run([{"op": "distinct_color", "nodes": "*_GEO"},
+                   {"op": "clear_color", "nodes": "grid_GEO"}])
+    assert result["success"], result["error"]
+    assert [name for name, _, _ in result["operations"]] == ["distinct_color", "clear_color"]
+    assert cmds.getAttr("a_GEO.overrideColorRGB") != cmds.getAttr("b_GEO.overrideColorRGB")
+    assert cmds.getAttr("a_GEO.overrideRGBColors")
+    assert not cmds.getAttr("grid_GEO.overrideRGBColors")
+
+
+def test_layer_colors():
+    result = _run([{"op": "colorize_layers", "nodes": "props", "type": "displayLayer",
+                    "color": "#00ff00"},
+                   {"op": "distinct_layer_color", "nodes": "sets", "type": "displayLayer"},
+                   {"op": "clear_layer_color", "nodes": "sets", "type": "displayLayer"}])
+    assert result["success"], result["error"]
+    assert cmds.getAttr("props.overrideColorRGB") == [(0.0, 1.0, 0.0)]
+    assert not cmds.getAttr("sets.overrideRGBColors")
+
+
+def test_unknown_operation_fails():
+    result = _run([{"op": "explode"}])
+    assert not result["success"]
+    assert "Operation \"explode\" is not registered" in result["error"]
+    assert result["output"] is None
+
+
+def test_main_exit_code():
+    directory = tempfile.mkdtemp()
+    try:
+        path = _make_scene(directory)
+        job_path = os.path.join(directory, "job.json")
+        report_path = os.path.join(directory, "report.json")
+        with open(job_path, "w") as f:
+            json.dump({"operations": [{"op": "pivot", "nodes": "*_GEO"}], "save": False}, f)
+
+        options = ["--workers", "1", "--setup", SETUP, "--report", report_path]
+        assert runner.main([job_path, path] + options) == 0
+        missing = os.path.join(directory, "missing.ma")
+        assert runner.main([job_path, path, missing] + options) == 1
+        with open(report_path) as f:
+            results = json.load(f)["results"]
+        assert [result["success"] for result in results] == [True, False]
+        assert "File not found" in results[1]["error"]
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,40 @@
+from dotblox.testing import fakemaya
+
+fakemaya.install()
+
+from maya import cmds
+
+from dotblox.core import bevelsession
+from dotblox.core.modeling import BevelEditor
+
+
+def _creases(scene, shape):
+    return sorted(scene.match(shape)[0].mesh.creases)
+
+
+def test_session_sees_edges_edited_elsewhere():
+    scene = fakemaya.new_scene()
+    scene.create_grid("grid", 4, 4)
+    scene.add_bevel("grid", ["e[0:3]"])
+    bevelsession.invalidate()
+
+    session = bevelsession.get("grid")
+    bevel_node = session["bevels"][0]
+    assert bevelsession.session_edges(session, bevel_node) == [0, 3]
+    bevelsession.switch("grid", bevel_node)
+    assert _creases(scene, "grid_bevel_visShape") == [0, 1, 2, 3]
+
+    # Like the Attribute Editor
+    cmds.setAttr(bevel_node + ".inputComponents", 2, "e[1]", "e[5:6]", type="componentList")
+    assert bevelsession.get_edges("grid", bevel_node) == [1, 1, 5, 6]
+    bevelsession.switch("grid", bevel_node)
+    assert _creases(scene, "grid_bevel_visShape") == [1, 5, 6]
+
+    BevelEditor.add_to_bevel("grid_bevel_vis.e[8]")
+    assert bevelsession.get_edges("grid", bevel_node) == [1, 1, 5, 6, 8, 8]
+    assert bevelsession.get("grid") is session
+
+    # A new bevel changes the node feeding the mesh
+    scene.add_bevel("grid", ["e[9]"])
+    assert len(bevelsession.get_bevels("grid")) == 2
+    assert bevelsession.get("grid") is not session
@@ -0,0 +1,23 @@
+from dotblox.testing import fakemaya
+
+fakemaya.install()
+
+from maya import cmds
+
+from dotblox.core import color as colorm
+
+
+def test_colorize_many_duplicates():
+    scene = fakemaya.new_scene()
+    scene.create_cube("a_GEO")
+    scene.create_cube("b_GEO")
+
+    writer = colorm.colorize_many(["a_GEO", "b_GEO", "|a_GEO", "missing"],
+                                  [(1.0, 0.0, 0.0), (0.0, 0.0, 1.0),
+                                   (0.0, 1.0, 0.0), (1.0, 1.0, 1.0)],
+                                  is_object=False,
+                                  is_outliner=True)
+    assert len(writer.nodes) == 2
+    assert cmds.getAttr("a_GEO.outlinerColor") == [(0.0, 1.0, 0.0)]
+    assert cmds.getAttr("b_GEO.outlinerColor") == [(0.0, 0.0, 1.0)]
+    assert cmds.getAttr("a_GEO.useOutlinerColor")
@@ -0,0 +1,79 @@
+import pytest
+
+from dotblox.testing import fakemaya
+
+fakemaya.install()
+
+from maya import cmds
+
+
+def _bevel_scene():
+    scene = fakemaya.new_scene()
+    scene.create_grid("grid", 4, 4)
+    scene.add_bevel("grid", ["e[0:3]"])
+    return scene
+
+
+def test_ls_long_names():
+    scene = fakemaya.new_scene()
+    scene.create_cube("pCube1")
+    cmds.createNode("transform", name="grp")
+    scene.create_cube("pCube1", parent="grp")
+
+    assert cmds.ls("grp|pCube1", long=True) == ["|grp|pCube1"]
+    assert cmds.ls("pCube1", long=True) == ["|pCube1", "|grp|pCube1"]
+    # Short names are only as long as needed to be unique
+    assert cmds.ls("pCube1") == ["|pCube1", "grp|pCube1"]
+    assert cmds.ls("pCube1Shape", long=True) == ["|pCube1|pCube1Shape", "|grp|pCube1|pCube1Shape"]
+    assert cmds.ls("grp", dagObjects=True, long=True, shapes=True) == ["|grp|pCube1|pCube1Shape"]
+    assert cmds.ls("grp", "|grp", long=True) == ["|grp"]
+    assert cmds.ls("missing") == []
+    with pytest.raises(ValueError):
+        cmds.polyEvaluate("pCube1", vertex=True)
+
+
+def test_ls_components():
+    scene = fakemaya.new_scene()
+    scene.create_cube("pCube1")
+    assert cmds.ls("pCube1.e[0:2]", long=True) == ["|pCube1.e[0:2]"]
+    assert cmds.ls("pCube1.e[0:2]", "pCube1.e[1:3]", flatten=True) == [
+        "pCube1.e[0]", "pCube1.e[1]", "pCube1.e[2]", "pCube1.e[3]"]
+    assert cmds.ls("pCube1.e[0]", objectsOnly=True, long=True) == ["|pCube1"]
+
+
+def test_poly_evaluate():
+    scene = fakemaya.new_scene()
+    scene.create_cube("pCube1")
+    scene.create_grid("grid", 4, 3)
+    assert cmds.polyEvaluate("pCube1", vertex=True) == 8
+    assert cmds.polyEvaluate("pCube1", edge=True) == 12
+    assert cmds.polyEvaluate("pCube1", face=True) == 6
+    assert cmds.polyEvaluate("grid", face=True) == 12
+    assert cmds.polyEvaluate("grid", edge=True) == 31
+
+
+def test_list_connections_and_history():
+    _bevel_scene()
+    assert cmds.listConnections("gridShape.inMesh", source=True, destination=False) == ["polyBevel1"]
+    assert cmds.listConnections("polyBevel1.output", plugs=True) == ["gridShape.inMesh"]
+    assert cmds.listConnections("polyBevel1.inputPolymesh", plugs=True) == ["polySurfaceShape1.outMesh"]
+    assert cmds.listHistory("grid") == ["gridShape", "polyBevel1", "polySurfaceShape1"]
+    assert cmds.listConnections("gridShape.outMesh") is None
+
+
+def test_component_list_attr():
+    _bevel_scene()
+    assert cmds.getAttr("polyBevel1.inputComponents") == ["e[0:3]"]
+    cmds.setAttr("polyBevel1.inputComponents", 2, "e[1]", "e[5:6]", type="componentList")
+    assert cmds.getAttr("polyBevel1.inputComponents") == ["e[1]", "e[5:6]"]
+
+
+def test_calls_are_counted():
+    scene = fakemaya.new_scene()
+    scene.create_cube("pCube1")
+    with fakemaya.counting() as counter:
+        cmds.ls("pCube1")
+        cmds.polyEvaluate("pCube1", vertex=True)
+        cmds.polyEvaluate("pCube1", face=True)
+    assert counter.counts == {"ls": 1, "polyEvaluate": 2}
+    assert counter.cmds_total() == 3
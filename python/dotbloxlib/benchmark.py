@@ -0,0 +1,293 @@
+"""Minimal benchmark harness with call-count and wall-time budgets
+
+Cases are registered on a :class:`Suite`. A case receives one parameter
+(usually the number of items), does its setup and returns the function
+that is timed, or a tuple of it and a cleanup function run once the
+timing is done.
+
+Usage:
+    suite = Suite()
+
+    @suite.case("color_hex_to_rgbf", params=[10, 1000])
+    def bench(scale):
+        colors = ["#ff0000"] * scale
+        return lambda: [color_hex_to_rgbf(c) for c in colors]
+
+    results = suite.run()
+
+Budgets are stored as json keyed by "name[param]"
+
+    {"color_hex_to_rgbf[10]": {"seconds": 0.001, "calls": 0}}
+
+The calls are always checked. Wall time depends on the machine and its
+load so the seconds are only checked when given a `time_factor`. A case
+raising an error is reported as failed and the others still run.
+"""
+import argparse
+import fnmatch
+import json
+import sys
+import timeit
+import traceback
+
+SCALES = (10, 1000, 100000)
+
+
+class SkipCase(Exception):
+    """Raise from a case when it can not run in the current environment"""
+
+
+class Result(object):
+    def __init__(self, name, param, seconds=None, calls=None, skipped=None, error=None):
+        self.name = name
+        self.param = param
+        self.seconds = seconds
+        self.calls = calls
+        self.skipped = skipped
+        # Traceback of the error the case failed with
+        self.error = error
+
+    @property
+    def key(self):
+        return "{name}[{param}]".format(name=self.name, param=self.param)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "param": self.param,
+            "seconds": self.seconds,
+            "calls": self.calls,
+            "skipped": self.skipped,
+            "error": self.error,
+        }
+
+
+class Case(object):
+    def __init__(self, name, func, params, repeat=1):
+        self.name = name
+        self.func = func
+        self.params = list(params)
+        self.repeat = repeat
+
+
+class Suite(object):
+    def __init__(self, counter=None):
+        """Collection of benchmark cases
+
+        Args:
+            counter (func): returns a context manager yielding an object
+                            with a `cmds_total()` method filled in on exit.
+                            Used to count the calls made by a case.
+        """
+        self.cases = []
+        self.counter = counter
+
+    def case(self, name, params=SCALES, repeat=1):
+        """Decorator to register a case
+
+        Args:
+            name (str): name of the case
+            params (list): each param the case is run with
+            repeat (int): the fastest of the repeats is recorded
+        """
+        def wrap(func):
+            self.cases.append(Case(name, func, params, repeat))
+            return func
+        return wrap
+
+    def _count(self):
+        if self.counter is None:
+            return _NullCounter()
+        return self.counter()
+
+    def run_case(self, case, param):
+        """Run a single param of a case
+
+        Returns:
+            Result: skipped on `SkipCase`, failed on any other error
+        """
+        try:
+            func = case.func(param)
+        except SkipCase as e:
+            return Result(case.name, param, skipped=str(e) or "skipped")
+        except Exception:
+            return Result(case.name, param, error=traceback.format_exc())
+
+        cleanup = None
+        if isinstance(func, tuple):
+            func, cleanup = func
+
+        best = None
+        calls = None
+        try:
+            for _ in range(case.repeat):
+                with self._count() as counter:
+                    start = timeit.default_timer()
+                    func()
+                    seconds = timeit.default_timer() - start
+                if best is None or seconds < best:
+                    best = seconds
+                calls = counter.cmds_total()
+        except SkipCase as e:
+            return Result(case.name, param, skipped=str(e) or "skipped")
+        except Exception:
+            return Result(case.name, param, error=traceback.format_exc())
+        finally:
+            if cleanup is not None:
+                cleanup()
+        return Result(case.name, param, seconds=best, calls=calls)
+
+    def run(self, pattern="*", params=None, callback=None):
+        """Run all the cases matching the pattern
+
+        Args:
+            pattern (str): fnmatch pattern of the case names
+            params (list): only run these params
+            callback (func): called with each result
+
+        Returns:
+            list[Result]:
+        """
+        results = []
+        for case in self.cases:
+            if not fnmatch.fnmatch(case.name, pattern):
+                continue
+            for param in case.params:
+                if params and str(param) not in params:
+                    continue
+                result = self.run_case(case, param)
+                results.append(result)
+                if callback is not None:
+                    callback(result)
+        return results
+
+
+class _NullCounter(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def cmds_total(self):
+        return 0
+
+
+def check_budgets(results, budgets, time_factor=None):
+    """Compare the results to the budgets
+
+    Args:
+        results (list[Result]):
+        budgets (dict): "name[param]": {"seconds": float, "calls": int}
+        time_factor (float): multiplier applied to the seconds budget,
+            the seconds are not checked without it
+
+    Returns:
+        list[str]: messages of the budgets that regressed and the cases
+                   that failed
+    """
+    failures = []
+    for result in results:
+        if result.error:
+            failures.append("{key}: failed".format(key=result.key))
+            continue
+        budget = budgets.get(result.key)
+        if budget is None or result.skipped:
+            continue
+        calls = budget.get("calls")
+        if calls is not None and result.calls > calls:
+            failures.append("{key}: {calls} calls exceeds budget of {budget}".format(
+                    key=result.key, calls=result.calls, budget=calls))
+        seconds = budget.get("seconds")
+        if time_factor is None or seconds is None:
+            continue
+        if result.seconds > seconds * time_factor:
+            failures.append("{key}: {seconds:.4f}s exceeds budget of {budget:.4f}s".format(
+                    key=result.key, seconds=result.seconds, budget=seconds * time_factor))
+    return failures
+
+
+def make_budgets(results, headroom=3.0):
+    """Create budgets from the results
+
+    Args:
+        results (list[Result]):
+        headroom (float): multiplier applied to the measured seconds
+
+    Returns:
+        dict:
+    """
+    budgets = {}
+    for result in results:
+        if result.skipped or result.error:
+            continue
+        budgets[result.key] = {
+            "seconds": round(max(result.seconds * headroom, 0.01), 4),
+            "calls": result.calls,
+        }
+    return budgets
+
+
+def format_result(result):
+    if result.skipped:
+        return "{key:<50} skipped: {reason}".format(key=result.key, reason=result.skipped)
+    if result.error:
+        return "{key:<50} failed\n{error}".format(key=result.key, error=result.error)
+    return "{key:<50} {seconds:10.4f}s {calls:8d} calls".format(
+            key=result.key, seconds=result.seconds, calls=result.calls)
+
+
+def main(suite, argv=None):
+    """Command line entry point of a suite
+
+    Returns:
+        int: exit code. 1 when a budget regressed or a case failed
+    """
+    parser = argparse.ArgumentParser(description="Run the benchmarks")
+    parser.add_argument("-k", "--filter", default="*",
+                        help="fnmatch pattern of the case names to run")
+    parser.add_argument("-p", "--param", action="append", default=None,
+                        help="only run the given param/scale, can be repeated")
+    parser.add_argument("-o", "--output", default=None,
+                        help="write the results to the given json file")
+    parser.add_argument("-b", "--budgets", default=None,
+                        help="json file of budgets to check against")
+    parser.add_argument("--update-budgets", action="store_true",
+                        help="write the results as the new budgets")
+    parser.add_argument("--time-factor", type=float, default=None,
+                        help="also check the seconds budgets, multiplied by this factor")
+    args = parser.parse_args(argv)
+
+    def report(result):
+        print(format_result(result))
+        sys.stdout.flush()
+
+    results = suite.run(args.filter, params=args.param, callback=report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump([result.to_dict() for result in results], f, indent=4)
+
+    failed = any(result.error for result in results)
+    if not args.budgets:
+        return 1 if failed else 0
+
+    if args.update_budgets:
+        budgets = {}
+        try:
+            with open(args.budgets, "r") as f:
+                budgets = json.load(f)
+        except (IOError, OSError, ValueError):
+            pass
+        budgets.update(make_budgets(results))
+        with open(args.budgets, "w") as f:
+            json.dump(budgets, f, indent=4, sort_keys=True)
+        return 1 if failed else 0
+
+    with open(args.budgets, "r") as f:
+        budgets = json.load(f)
+
+    failures = check_budgets(results, budgets, time_factor=args.time_factor)
+    for failure in failures:
+        print("REGRESSION " + failure)
+    return 1 if failures else 0
@@ -0,0 +1,103 @@
+"""Pick palette colors that look as different from each other as possible
+
+Colors are picked greedily: each next color is the one farthest in OKLab
+from all the colors picked so far.
+
+Usage:
+    for color, weight in distinct_colors(5):
+        mdc.get_color(color, weight)
+"""
+from dotbloxlib.color import mdc, oklab
+
+# weights: order of the palette entries
+_ORDERS = {}
+
+
+def farthest_point_order(points, count=None, start=0):
+    """Order the points so every point is the farthest from the previous ones
+
+    Args:
+        points (list[list[float]]): points of the same dimension
+        count (int): number of points to order, all by default
+        start (int): index of the first point
+
+    Returns:
+        list[int]: indices of the points
+    """
+    if not len(points):
+        return []
+    count = len(points) if count is None else min(count, len(points))
+    if oklab.numpy is not None:
+        return _farthest_point_order_numpy(points, count, start)
+
+    points = [list(point) for point in points]
+    order = [start]
+    # Distance of each point to the closest ordered point
+    closest = [oklab.distance_sq(point, points[start]) for point in points]
+    while len(order) < count:
+        index = closest.index(max(closest))
+        order.append(index)
+        point = points[index]
+        for i, other in enumerate(points):
+            distance = oklab.distance_sq(other, point)
+            if distance < closest[i]:
+                closest[i] = distance
+    return order
+
+
+def _farthest_point_order_numpy(points, count, start):
+    numpy = oklab.numpy
+    points = numpy.asarray(points, dtype=numpy.float64)
+    order = [start]
+    closest = ((points - points[start]) ** 2).sum(axis=1)
+    while len(order) < count:
+        index = int(closest.argmax())
+        order.append(index)
+        numpy.minimum(closest, ((points - points[index]) ** 2).sum(axis=1), out=closest)
+    return order
+
+
+def palette_order(weights=None):
+    """Get the palette entries ordered by :func:`farthest_point_order`
+
+    The order is computed once per set of weights.
+
+    Args:
+        weights (list[str]): only use these weights, all by default
+
+    Returns:
+        list[tuple]: (color, weight)
+    """
+    key = tuple(sorted(weights)) if weights else None
+    order = _ORDERS.get(key)
+    if order is None:
+        index = mdc.get_index()
+        entries = [i for i, (color, weight) in enumerate(index.entries)
+                   if key is None or weight in key]
+        if not entries:
+            raise ValueError("No palette colors with the weights {0}".format(weights))
+        points = [index.lab[i] for i in entries]
+
+        # Start from the most saturated color to avoid starting on a grey
+        chroma = [point[1] ** 2 + point[2] ** 2 for point in points]
+        start = chroma.index(max(chroma))
+        order = [index.entries[entries[i]]
+                 for i in farthest_point_order(points, start=start)]
+        _ORDERS[key] = order
+    return order
+
+
+def distinct_colors(count, weights=None):
+    """Get `count` palette colors which are the most distinct
+
+    The palette repeats when more colors are asked than it has.
+
+    Args:
+        count (int): number of colors
+        weights (list[str]): only use these weights, all by default
+
+    Returns:
+        list[tuple]: (color, weight)
+    """
+    order = palette_order(weights)
+    return [order[i % len(order)] for i in range(count)]
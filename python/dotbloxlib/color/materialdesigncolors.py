@@ -1,3 +1,5 @@
+import array
+
 Red = "red"
 Pink = "pink"
 Purple = "purple"
@@ -33,6 +35,24 @@ WeightA200 = "a200"
 WeightA400 = "a400"
 WeightA700 = "a700"
 
+# Numeric weights first then the accents
+WEIGHT_ORDER = [
+    Weight50,
+    Weight100,
+    Weight200,
+    Weight300,
+    Weight400,
+    Weight500,
+    Weight600,
+    Weight700,
+    Weight800,
+    Weight900,
+    WeightA100,
+    WeightA200,
+    WeightA400,
+    WeightA700,
+]
+
 __COLOR_ORDER = [
     Red,
     Pink,
@@ -352,10 +372,10 @@ __COLOR_MAP = {
 
 
 def get_color(color, weight=Weight500):
-    color = __COLOR_MAP.get(color)
-    if color is None:
+    weights = __COLOR_MAP.get(color)
+    if weights is None:
         raise RuntimeError("Color %s not valid" % color)
-    hex_color = color.get(weight)
+    hex_color = weights.get(weight)
     if hex_color is None:
         raise RuntimeError("Weight \"{weight}\" is not valid for \"{color}\".".format(
                 color=color,
@@ -365,12 +385,131 @@ def get_color(color, weight=Weight500):
 
 def get_weights(color):
     """Get Weights of a color"""
-    color = __COLOR_MAP.get(color)
-    if color is None:
+    weights = __COLOR_MAP.get(color)
+    if weights is None:
         raise RuntimeError("Color %s not valid" % color)
-    return color
+    return weights
 
 
 def get_colors():
     """Get all registered colors"""
     return __COLOR_ORDER
+
+
+def get_sorted_weights(color):
+    """Get the weights of a color in `WEIGHT_ORDER`"""
+    return get_index().weight_order[color]
+
+
+def find_color(hex_value):
+    """Get the color and weight of the hex value
+
+    Returns:
+        tuple: (color, weight) or None if the hex value is not in the palette
+    """
+    return get_index().reverse.get(hex_value.lower())
+
+
+def nearest_color(rgbf):
+    """Get the (color, weight) which looks the closest to the 0-1 color"""
+    return get_index().nearest([rgbf])[0]
+
+
+def nearest_colors(colors):
+    """Get the (color, weight) which looks the closest to each 0-1 color"""
+    return get_index().nearest(colors)
+
+
+# Colors whose closest entry is kept, without NumPy
+MAX_NEAREST_CACHED = 65536
+
+
+class PaletteIndex(object):
+    def __init__(self):
+        """Every color and weight of the palette packed for lookups
+
+        Entries are in the palette order, colors then sorted weights.
+        """
+        from dotbloxlib.color import color_hex_to_rgbf, oklab
+
+        self.entries = []
+        self.hex_values = []
+        self.weight_order = {}
+        for color in get_colors():
+            weights = get_weights(color)
+            self.weight_order[color] = tuple(weight for weight in WEIGHT_ORDER if weight in weights)
+            for weight in self.weight_order[color]:
+                self.entries.append((color, weight))
+                self.hex_values.append(weights[weight].lower())
+
+        # Some colors share values, the first in the palette order wins
+        self.reverse = {}
+        for hex_value, entry in zip(self.hex_values, self.entries):
+            self.reverse.setdefault(hex_value, entry)
+
+        # r, g, b bytes of each entry
+        self.rgb = array.array("B", [int(hex_value[i: i + 2], 16)
+                                     for hex_value in self.hex_values
+                                     for i in (1, 3, 5)])
+        self.rgbf = [color_hex_to_rgbf(hex_value) for hex_value in self.hex_values]
+        self.lab = oklab.from_srgb_many(self.rgbf)
+        # color tuple: index of the closest entry, without NumPy
+        self._nearest = {}
+
+    def nearest_indices(self, colors):
+        """Index of the closest entry of each 0-1 color in OKLab
+
+        Each distinct color is only looked up once.
+        """
+        from dotbloxlib.color import oklab
+
+        if not len(colors):
+            return []
+        if oklab.numpy is not None:
+            return self._nearest_indices_numpy(colors)
+
+        # The colors mostly come from hex values, the lookups of the
+        # distinct colors are kept for the next calls
+        keys = set(tuple(color) for color in colors)
+        if len(self._nearest) + len(keys) > MAX_NEAREST_CACHED:
+            self._nearest.clear()
+        missing = [key for key in keys if key not in self._nearest]
+        for key, lab in zip(missing, oklab.from_srgb_many(missing)):
+            distances = [oklab.distance_sq(lab, entry) for entry in self.lab]
+            self._nearest[key] = distances.index(min(distances))
+        return [self._nearest[tuple(color)] for color in colors]
+
+    def _nearest_indices_numpy(self, colors):
+        from dotbloxlib.color import oklab
+
+        numpy = oklab.numpy
+        unique, inverse = numpy.unique(numpy.asarray(colors, dtype=numpy.float64),
+                                       axis=0, return_inverse=True)
+        labs = oklab.from_srgb_many(unique)
+        # |a - b|^2 = |a|^2 - 2ab + |b|^2, |a|^2 is the same for every entry
+        entries_sq = (self.lab ** 2).sum(axis=1)
+        indices = numpy.empty(len(labs), dtype=numpy.intp)
+        # Chunked to bound the colors x entries distance matrix
+        for start in range(0, len(labs), 4096):
+            chunk = labs[start:start + 4096]
+            distances = entries_sq[None, :] - 2.0 * chunk.dot(self.lab.T)
+            indices[start:start + 4096] = distances.argmin(axis=1)
+        return indices[inverse.ravel()].tolist()
+
+    def nearest(self, colors):
+        """Get the (color, weight) of the closest entry of each 0-1 color"""
+        return [self.entries[index] for index in self.nearest_indices(colors)]
+
+
+__INDEX = []
+
+
+def get_index():
+    """Get the palette index, built on first use
+
+    Returns:
+        PaletteIndex:
+    """
+    if not __INDEX:
+        __INDEX.append(PaletteIndex())
+    return __INDEX[0]
@@ -0,0 +1,385 @@
+"""OCIO color transforms baked into lookup tables
+
+PyOpenColorIO is only needed to bake a transform. The baked table is
+written to the cache as a `.cube` file keyed by the hash of the config,
+after which it loads without PyOpenColorIO.
+
+Usage:
+    lut = get_lut("/path/config.ocio", "sRGB", "ACEScg")
+    if lut is not None:
+        lut.apply([1.0, 0.5, 0.0])
+
+    # Bake in a thread when missing instead of blocking the caller
+    lut = get_lut("/path/config.ocio", "sRGB", "ACEScg", background=True,
+                  callback=on_baked)
+
+Bake ahead of time on a machine with PyOpenColorIO, sharing the cache
+through `DOTBLOX_LUT_CACHE`:
+    python -m dotbloxlib.color.ocio /path/config.ocio sRGB ACEScg
+"""
+import argparse
+import hashlib
+import os
+import sys
+import threading
+import traceback
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import PyOpenColorIO
+except ImportError:
+    PyOpenColorIO = None
+
+
+LUT_1D_SIZE = 4096
+LUT_3D_SIZE = 33
+
+
+def cache_dir():
+    """Folder of the baked tables, `DOTBLOX_LUT_CACHE` or `~/.dotblox/luts`"""
+    return os.environ.get("DOTBLOX_LUT_CACHE") or os.path.join(
+            os.path.expanduser("~"), ".dotblox", "luts")
+
+
+def config_hash(config_path):
+    """Hash of the content of the config file"""
+    digest = hashlib.sha1()
+    with open(config_path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def lut_path(config_path, src, dst, dimension=3, directory=None):
+    """Path of the baked table of the transform
+
+    Args:
+        config_path (str): path of the config.ocio
+        src (str): source color space
+        dst (str): destination color space
+        dimension (int): 1 or 3
+        directory (str): defaults to :func:`cache_dir`
+
+    Returns:
+        str:
+    """
+    key = "{config}|{src}|{dst}|{dimension}".format(
+            config=config_hash(config_path), src=src, dst=dst, dimension=dimension)
+    file_name = hashlib.sha1(key.encode("utf-8")).hexdigest() + ".cube"
+    return os.path.join(directory or cache_dir(), file_name)
+
+
+class LUT(object):
+    def __init__(self, dimension, size, table, title=""):
+        """Lookup table in the `.cube` layout
+
+        Args:
+            dimension (int): 1 applies each channel separately,
+                             3 maps the whole color
+            size (int): samples per axis
+            table (list[list[float]]): rgb samples, red changes the fastest
+            title (str): description written to the file
+        """
+        if dimension not in (1, 3):
+            raise ValueError("Unsupported LUT dimension: {0}".format(dimension))
+        expected = size if dimension == 1 else size ** 3
+        if len(table) != expected:
+            raise ValueError("Expected {0} samples, got {1}".format(expected, len(table)))
+
+        self.dimension = dimension
+        self.size = size
+        self.table = [list(sample) for sample in table]
+        self.title = title
+        self._array = None
+
+    @classmethod
+    def bake(cls, apply, dimension=3, size=None, title=""):
+        """Sample a transform into a table
+
+        Args:
+            apply (func): takes and returns a list of 3 floats
+            dimension (int): 1 or 3
+            size (int): defaults to `LUT_1D_SIZE` or `LUT_3D_SIZE`
+
+        Returns:
+            LUT:
+        """
+        if size is None:
+            size = LUT_1D_SIZE if dimension == 1 else LUT_3D_SIZE
+        step = 1.0 / (size - 1)
+        if dimension == 1:
+            table = [apply([i * step] * 3) for i in range(size)]
+        else:
+            table = [apply([r * step, g * step, b * step])
+                     for b in range(size)
+                     for g in range(size)
+                     for r in range(size)]
+        return cls(dimension, size, table, title=title)
+
+    @classmethod
+    def read(cls, path):
+        """Read a `.cube` file"""
+        dimension = size = None
+        title = ""
+        table = []
+        with open(path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith("TITLE"):
+                    title = line[len("TITLE"):].strip().strip('"')
+                elif line.startswith("LUT_1D_SIZE"):
+                    dimension, size = 1, int(line.split()[1])
+                elif line.startswith("LUT_3D_SIZE"):
+                    dimension, size = 3, int(line.split()[1])
+                elif line.startswith("DOMAIN_"):
+                    continue
+                else:
+                    table.append([float(i) for i in line.split()])
+        if dimension is None:
+            raise ValueError("Not a cube LUT: " + path)
+        return cls(dimension, size, table, title=title)
+
+    def write(self, path):
+        """Write the table as a `.cube` file"""
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        temp_path = path + ".tmp"
+        with open(temp_path, "w") as f:
+            if self.title:
+                f.write('TITLE "{0}"\n'.format(self.title))
+            f.write("LUT_{0}D_SIZE {1}\n".format(self.dimension, self.size))
+            for sample in self.table:
+                f.write("{0:.8f} {1:.8f} {2:.8f}\n".format(*sample))
+        # Other processes only ever see a complete file
+        if os.path.exists(path):
+            os.remove(path)
+        os.rename(temp_path, path)
+
+    def apply(self, rgbf):
+        """Transform a single color"""
+        if self.dimension == 1:
+            return [self._sample_1d(channel, value) for channel, value in enumerate(rgbf)]
+        return self._sample_3d(rgbf)
+
+    def apply_many(self, colors):
+        """Transform many colors in one call
+
+        Args:
+            colors (list[list[float]]):
+
+        Returns:
+            list[list[float]]:
+        """
+        if not len(colors):
+            return []
+        if numpy is None:
+            return [self.apply(color) for color in colors]
+
+        if self._array is None:
+            self._array = numpy.asarray(self.table, dtype=numpy.float64)
+        values = numpy.clip(numpy.asarray(colors, dtype=numpy.float64), 0.0, 1.0)
+        scaled = values * (self.size - 1)
+        low = numpy.minimum(numpy.floor(scaled).astype(int), self.size - 2)
+        frac = scaled - low
+
+        if self.dimension == 1:
+            channels = numpy.arange(3)
+            start = self._array[low, channels]
+            end = self._array[low + 1, channels]
+            return (start + (end - start) * frac).tolist()
+
+        result = numpy.zeros_like(values)
+        for corner in range(8):
+            offset = numpy.array([corner & 1, (corner >> 1) & 1, (corner >> 2) & 1])
+            index = low + offset
+            weight = numpy.prod(numpy.where(offset, frac, 1.0 - frac), axis=1)
+            flat = index[:, 0] + index[:, 1] * self.size + index[:, 2] * self.size ** 2
+            result += self._array[flat] * weight[:, None]
+        return result.tolist()
+
+    def _position(self, value):
+        value = min(max(value, 0.0), 1.0) * (self.size - 1)
+        low = min(int(value), self.size - 2)
+        return low, value - low
+
+    def _sample_1d(self, channel, value):
+        low, frac = self._position(value)
+        start = self.table[low][channel]
+        end = self.table[low + 1][channel]
+        return start + (end - start) * frac
+
+    def _sample_3d(self, rgbf):
+        (r, fr), (g, fg), (b, fb) = [self._position(value) for value in rgbf]
+        size = self.size
+        result = [0.0, 0.0, 0.0]
+        for corner in range(8):
+            dr, dg, db = corner & 1, (corner >> 1) & 1, (corner >> 2) & 1
+            weight = ((fr if dr else 1.0 - fr)
+                      * (fg if dg else 1.0 - fg)
+                      * (fb if db else 1.0 - fb))
+            if not weight:
+                continue
+            sample = self.table[(r + dr) + (g + dg) * size + (b + db) * size * size]
+            for channel in range(3):
+                result[channel] += sample[channel] * weight
+        return result
+
+
+def ocio_apply_function(config_path, src, dst):
+    """Get a function applying the transform with PyOpenColorIO
+
+    Raises:
+        RuntimeError: PyOpenColorIO is not installed
+    """
+    if PyOpenColorIO is None:
+        raise RuntimeError("PyOpenColorIO is required to bake {src} to {dst}".format(
+                src=src, dst=dst))
+
+    config = PyOpenColorIO.Config.CreateFromFile(config_path)
+    processor = config.getProcessor(src, dst)
+    if hasattr(processor, "getDefaultCPUProcessor"):
+        # OCIO 2
+        cpu = processor.getDefaultCPUProcessor()
+        return lambda rgbf: list(cpu.applyRGB(list(rgbf)))
+    return lambda rgbf: list(processor.applyRGB(list(rgbf)))
+
+
+def bake(config_path, src, dst, dimension=3, size=None, apply=None, directory=None):
+    """Bake the transform of the config and store it in the cache
+
+    Args:
+        config_path (str): path of the config.ocio
+        src (str): source color space
+        dst (str): destination color space
+        dimension (int): 1 for per channel transforms, 3 for any transform
+        size (int): samples per axis
+        apply (func): transform to bake instead of PyOpenColorIO
+        directory (str): defaults to :func:`cache_dir`
+
+    Returns:
+        LUT:
+    """
+    if apply is None:
+        apply = ocio_apply_function(config_path, src, dst)
+    lut = LUT.bake(apply, dimension=dimension, size=size,
+                   title="{src} to {dst}".format(src=src, dst=dst))
+    lut.write(lut_path(config_path, src, dst, dimension, directory))
+    return lut
+
+
+# lut path: (modified time, LUT)
+_LOADED = {}
+# lut path: thread baking it
+_BAKING = {}
+_BAKING_LOCK = threading.Lock()
+
+
+def bake_in_background(config_path, src, dst, dimension=3, size=None, apply=None,
+                       directory=None, callback=None):
+    """Bake the transform in a thread, see :func:`bake`
+
+    Only one thread bakes a table, asking again while it runs returns it.
+
+    Args:
+        callback (func): called without arguments from the thread once
+            the table is in the cache
+
+    Returns:
+        threading.Thread:
+    """
+    path = lut_path(config_path, src, dst, dimension, directory)
+    with _BAKING_LOCK:
+        thread = _BAKING.get(path)
+        if thread is not None:
+            return thread
+
+        def run():
+            try:
+                bake(config_path, src, dst, dimension=dimension, size=size,
+                     apply=apply, directory=directory)
+            except Exception:
+                traceback.print_exc()
+                return
+            finally:
+                with _BAKING_LOCK:
+                    _BAKING.pop(path, None)
+            if callback is not None:
+                callback()
+
+        thread = _BAKING[path] = threading.Thread(target=run, name="dotblox lut " + path)
+        thread.daemon = True
+        thread.start()
+    return thread
+
+
+def is_baking(config_path, src, dst, dimension=3, directory=None):
+    """Check if the table is being baked by :func:`bake_in_background`"""
+    with _BAKING_LOCK:
+        return lut_path(config_path, src, dst, dimension, directory) in _BAKING
+
+
+def get_lut(config_path, src, dst, dimension=3, directory=None, background=False,
+            callback=None):
+    """Get the baked table of the transform
+
+    Baking happens when the table is not in the cache and PyOpenColorIO
+    is installed.
+
+    Args:
+        background (bool): bake in a thread instead and return None
+        callback (func): see :func:`bake_in_background`
+
+    Returns:
+        LUT: or None if the table is not baked and can not be
+    """
+    if not config_path or not os.path.isfile(config_path):
+        return None
+
+    path = lut_path(config_path, src, dst, dimension, directory)
+    if os.path.isfile(path):
+        modified_time = os.path.getmtime(path)
+        loaded = _LOADED.get(path)
+        if loaded is None or loaded[0] != modified_time:
+            loaded = _LOADED[path] = (modified_time, LUT.read(path))
+        return loaded[1]
+
+    if PyOpenColorIO is None:
+        return None
+    if background:
+        bake_in_background(config_path, src, dst, dimension=dimension,
+                           directory=directory, callback=callback)
+        return None
+    return bake(config_path, src, dst, dimension=dimension, directory=directory)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bake an OCIO transform into the LUT cache")
+    parser.add_argument("config", help="path of the config.ocio")
+    parser.add_argument("src", help="source color space")
+    parser.add_argument("dst", help="destination color space")
+    parser.add_argument("-d", "--dimension", type=int, default=3, choices=[1, 3])
+    parser.add_argument("-s", "--size", type=int, default=None)
+    parser.add_argument("-o", "--directory", default=None,
+                        help="cache folder, defaults to DOTBLOX_LUT_CACHE or ~/.dotblox/luts")
+    args = parser.parse_args(argv)
+
+    try:
+        bake(args.config, args.src, args.dst,
+             dimension=args.dimension, size=args.size, directory=args.directory)
+    except RuntimeError as e:
+        print(e)
+        return 1
+    print(lut_path(args.config, args.src, args.dst, args.dimension, args.directory))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
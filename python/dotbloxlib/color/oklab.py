@@ -0,0 +1,64 @@
+"""OKLab perceptual color space
+
+Distances between OKLab colors follow how different the colors look,
+which plain RGB distances do not.
+
+Usage:
+    lab = from_srgb([1.0, 0.5, 0.0])
+    distance_sq(lab, from_srgb([1.0, 0.6, 0.0]))
+"""
+import math
+
+from dotbloxlib.color import transfer
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_LMS = (
+    (0.4122214708, 0.5363325363, 0.0514459929),
+    (0.2119034982, 0.6806995451, 0.1073969566),
+    (0.0883024619, 0.2817188376, 0.6299787005),
+)
+
+_LAB = (
+    (0.2104542553, 0.7936177850, -0.0040720468),
+    (1.9779984951, -2.4285922050, 0.4505937099),
+    (0.0259040371, 0.7827717662, -0.8086757660),
+)
+
+
+def _cbrt(value):
+    return math.copysign(abs(value) ** (1.0 / 3.0), value)
+
+
+def from_linear(rgb):
+    """Convert a linear sRGB color to OKLab"""
+    lms = [_cbrt(row[0] * rgb[0] + row[1] * rgb[1] + row[2] * rgb[2]) for row in _LMS]
+    return [row[0] * lms[0] + row[1] * lms[1] + row[2] * lms[2] for row in _LAB]
+
+
+def from_srgb(rgbf):
+    """Convert a 0-1 sRGB encoded color to OKLab"""
+    return from_linear(transfer.srgb_to_linear_rgb(rgbf))
+
+
+def from_srgb_many(colors):
+    """Convert many 0-1 sRGB encoded colors to OKLab
+
+    Returns:
+        numpy.ndarray|list[list[float]]: an array when NumPy is installed
+    """
+    if numpy is None:
+        return [from_srgb(color) for color in colors]
+    if not len(colors):
+        return numpy.zeros((0, 3))
+    linear = transfer.srgb_to_linear_array(colors)
+    lms = numpy.cbrt(linear.dot(numpy.asarray(_LMS).T))
+    return lms.dot(numpy.asarray(_LAB).T)
+
+
+def distance_sq(a, b):
+    """Squared distance between two OKLab colors"""
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
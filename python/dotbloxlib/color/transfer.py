@@ -0,0 +1,75 @@
+"""sRGB transfer functions for single colors and batches
+
+NumPy is used for batches when it is installed, otherwise each color goes
+through the formula once. 0-255 colors can use the 8-bit lookup table.
+
+Usage:
+    srgb_to_linear(0.5)
+    srgb_to_linear_rgb([1.0, 0.5, 0.0])
+    srgb_to_linear_many([[1.0, 0.5, 0.0], [0.2, 0.4, 0.6]])
+"""
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def srgb_to_linear(value):
+    """Convert a single 0-1 sRGB encoded value to linear"""
+    if value < 0.04045:
+        return value / 12.92
+    return ((value + 0.055) / 1.055) ** 2.4
+
+
+# Linear value of each 8-bit sRGB value
+SRGB8_TO_LINEAR = [srgb_to_linear(i / 255.0) for i in range(256)]
+
+
+def srgb8_to_linear_rgb(rgb):
+    """Convert a 0-255 sRGB color to linear 0-1"""
+    return [SRGB8_TO_LINEAR[i] for i in rgb]
+
+
+def srgb_to_linear_rgb(rgbf):
+    """Convert a 0-1 sRGB color to linear"""
+    return [srgb_to_linear(i) for i in rgbf]
+
+
+def srgb_to_linear_array(colors):
+    """Convert many 0-1 sRGB colors to a linear NumPy array
+
+    Needs NumPy, saves the list round trip of `srgb_to_linear_many`.
+
+    Returns:
+        numpy.ndarray: colors x 3 channels
+    """
+    values = numpy.asarray(colors, dtype=numpy.float64)
+    return numpy.where(values < 0.04045,
+                       values / 12.92,
+                       ((values + 0.055) / 1.055) ** 2.4)
+
+
+def srgb_to_linear_many(colors):
+    """Convert many 0-1 sRGB colors to linear in one call
+
+    Args:
+        colors (list[list[float]]): colors of 3 channels
+
+    Returns:
+        list[list[float]]: the linear colors
+    """
+    if not len(colors):
+        return []
+    if numpy is not None:
+        return srgb_to_linear_array(colors).tolist()
+
+    # Palettes share most of their colors
+    converted = {}
+    result = []
+    for color in colors:
+        key = tuple(color)
+        linear = converted.get(key)
+        if linear is None:
+            linear = converted[key] = srgb_to_linear_rgb(color)
+        result.append(list(linear))
+    return result
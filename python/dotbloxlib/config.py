@@ -1,11 +1,214 @@
+import atexit
+import contextlib
 import copy
+import hashlib
+import io
 import json
+import marshal
+import mmap
 import os
+import struct
 import sys
+import tempfile
+import threading
+import time
+import timeit
+import weakref
+
+from dotbloxlib import filewatch
+from dotbloxlib.filewatch import stat_signature
+
+try:
+    from StringIO import StringIO as _TextBuffer
+except ImportError:
+    from io import StringIO as _TextBuffer
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# ConfigIO with scheduled writes, saved when python exits
+_PENDING = weakref.WeakSet()
+
+
+def flush_all():
+    """Save the scheduled writes of every config"""
+    for config_io in list(_PENDING):
+        config_io.flush()
+
+
+atexit.register(flush_all)
+
+
+def _get_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _get_umask()
+
+
+def atomic_write(path, content):
+    """Write the file through a temporary file renamed over it
+
+    Readers only ever see the previous or the new complete file.
+
+    Args:
+        path (str): file to write
+        content (bytes): the new contents
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    if os.path.exists(path):
+        mode = os.stat(path).st_mode & 0o777
+    else:
+        mode = 0o666 & ~_UMASK
+
+    handle, temp_path = tempfile.mkstemp(prefix="." + os.path.basename(path) + ".",
+                                         suffix=".tmp",
+                                         dir=directory)
+    try:
+        with os.fdopen(handle, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, mode)
+        if hasattr(os, "replace"):
+            os.replace(temp_path, path)
+        else:
+            # python 2 can only rename over an existing file on posix
+            if os.name == "nt" and os.path.exists(path):
+                os.remove(path)
+            os.rename(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+@contextlib.contextmanager
+def file_lock(path, exclusive=True):
+    """Hold an advisory lock for the file
+
+    The config is replaced on every write so the lock is taken on
+    `<path>.lock` next to it. Nothing is locked without `fcntl`.
+
+    Args:
+        path (str): the config file
+        exclusive (bool): exclusive or shared lock
+    """
+    if fcntl is None:
+        yield
+        return
+
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(path + ".lock", "a") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _hash_content(content):
+    """sha1 of bytes or of a memory mapped file"""
+    digest = hashlib.sha1()
+    if isinstance(content, mmap.mmap):
+        # Hashed by chunks, python 2 can not hash the mapping directly
+        for start in range(0, len(content), 1 << 20):
+            digest.update(content[start:start + (1 << 20)])
+    else:
+        digest.update(content)
+    return digest.hexdigest()
+
+
+# Value of a key missing from a config. See `merge`
+_MISSING = object()
+
+
+def merge(base, ours, theirs):
+    """Three way merge of the top level keys of two configs
+
+    A key takes the value of the side that changed it from `base`. When
+    both changed it to different values `ours` is kept.
+
+    Args:
+        base (dict): the data both sides started from
+        ours (dict): the local data
+        theirs (dict): the data on disk
+
+    Returns:
+        tuple: (merged dict, keys changed by both sides)
+    """
+    merged = theirs.snapshot() if hasattr(theirs, "snapshot") else dict(theirs)
+    conflicts = []
+    for key in set(ours) | set(theirs):
+        if _same(ours, base, key):
+            continue
+        if not _same(theirs, base, key) and not _same(theirs, ours, key):
+            conflicts.append(key)
+        mine = ours.get(key, _MISSING)
+        if mine is _MISSING:
+            merged.pop(key, None)
+        else:
+            merged[key] = mine
+    return merged, conflicts
+
+
+def _same(first, second, key):
+    """Check the key has the same value in both dicts
+
+    Values of `IndexedData` still encoded are compared without decoding.
+    """
+    if (key in first) != (key in second):
+        return False
+    if key not in first:
+        return True
+    if hasattr(first, "encoded_value") and hasattr(second, "encoded_value"):
+        if first.codec == second.codec:
+            encoded = first.encoded_value(key)
+            if encoded is not None and encoded == second.encoded_value(key):
+                return True
+    return first[key] == second[key]
+
+
+def changed_keys(old, new):
+    """Get the top level keys whose value differs between the two dicts"""
+    return ([key for key in new if not _same(old, new, key)]
+            + [key for key in old if key not in new])
+
+
+def _snapshot(data):
+    """Copy the data as the base of a later `merge`
+
+    `IndexedData` keeps referring to the encoded values instead of
+    decoding them.
+    """
+    if hasattr(data, "snapshot"):
+        return data.snapshot()
+    return copy.deepcopy(dict(data))
 
 
 class ConfigIO(object):
-    def __init__(self, file_path, read, write, default=None, sync=False):
+    def __init__(self, file_path, read, write, default=None, sync=False, delay=0.0,
+                 binary=False, shared=False, mapped=False):
         """File IO class for contextual reading and writing of a
         configuration file
 
@@ -17,6 +220,15 @@ class ConfigIO(object):
                             doesnt exist.
             sync (bool): when data is read the latest is pulled from the file.
                          when data is written the file is updated on disk.
+            delay (float): seconds to wait before writing, writes made in
+                           the meantime are saved together
+            binary (bool): read and write the file in binary mode
+            shared (bool): the file is written by other sessions. Writes
+                           hold a lock and merge the keys changed on disk
+                           since the last read, see `merge`
+            mapped (bool): `read` is given the file memory mapped instead
+                           of its contents so it can decode only what is
+                           used. Implies binary
 
         Usage:
             io = ConfigIO(file_path, read, write)
@@ -29,29 +241,205 @@ class ConfigIO(object):
         """
         self.file_path = file_path
         self.modified_time = 0
-        self.__context_write = False
-        self._sync = False
+        self.delay = delay
+        self.binary = binary or mapped
+        self.mapped = mapped
+        # Per thread, the with statements entered, True for a write.
+        # See `write`
+        self.__contexts = threading.local()
+        self._sync = sync
         self._io_read = read
         self._io_write = write
 
+        # (size, modified time in ns) and hash of the file when last read
+        # or written, to skip reading and writing what did not change
+        self._stat = None
+        self._hash = None
+
+        self.shared = shared
+        # The data on disk when last read, the base of `merge`
+        self._snapshot = None
+        self._callbacks = []
+
+        # See `start_watch`
+        self._watcher = None
+        self._watch_callback = None
+        self._stale = True
+
+        self._lock = threading.RLock()
+        self._timer = None
+        self._dirty = False
+
         if default is None:
             default = {}
 
         self.cache = {}
         self.default_data = default
 
-    def save_to_disk(self):
-        try:
-            with open(self.file_path, "w") as f:
-                self._io_write(f, self.cache)
-        except:
-            print("Unable to save to " + self.file_path)
+    def serialize(self):
+        """Get the contents of the cache as they are written to disk
+
+        Returns:
+            bytes:
+        """
+        buffer = io.BytesIO() if self.binary else _TextBuffer()
+        self._io_write(buffer, self.cache)
+        content = buffer.getvalue()
+        if not isinstance(content, bytes):
+            content = content.encode("utf-8")
+        return content
+
+    def deserialize(self, content):
+        """Get the data of the file contents
+
+        Args:
+            content (bytes):
+
+        Returns:
+            dict:
+        """
+        if self.mapped:
+            return self._io_read(content)
+        if self.binary:
+            return self._io_read(io.BytesIO(content))
+        return self._io_read(_TextBuffer(content.decode("utf-8")))
+
+    def _read_content(self, size):
+        """Get the contents of the file, memory mapped when `mapped`"""
+        with open(self.file_path, "rb") as f:
+            if not self.mapped or not size:
+                return f.read()
+            # The mapping outlives the file object. Writes rename a new
+            # file over the config so the mapped one is never modified
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def save_to_disk(self, force=False):
+        """Write the cache to disk
+
+        The file is written to a temporary file which then replaces the
+        config so a failed write never leaves a partial file behind.
+        Nothing is written when the file already has the same contents.
+
+        Args:
+            force (bool): write even if the contents did not change
+
+        Returns:
+            bool: True if the file was written
+        """
+        with self._lock:
+            self._cancel_timer()
+            try:
+                if not self.shared:
+                    written = self._write(force)
+                else:
+                    with file_lock(self.file_path):
+                        self._merge_from_disk()
+                        written = self._write(force)
+            except Exception as e:
+                print("Unable to save to {0}: {1}".format(self.file_path, e))
+                # Keep the writes to try again, on exit at the latest
+                if self.delay > 0:
+                    self.schedule_save()
+                else:
+                    self._dirty = True
+                    _PENDING.add(self)
+                return False
+            self._dirty = False
+            _PENDING.discard(self)
+            return written
+
+    def _write(self, force):
+        content = self.serialize()
+        digest = _hash_content(content)
+        if (not force
+                and digest == self._hash
+                and self._stat == stat_signature(self.file_path)):
+            return False
+        if self.mapped and os.name == "nt":
+            # Windows can not replace a file which is still mapped
+            for data in (self.cache, self._snapshot):
+                if hasattr(data, "detach"):
+                    data.detach()
+        atomic_write(self.file_path, content)
+
+        self._hash = digest
+        self._set_stat(stat_signature(self.file_path))
+        _folder_changed(os.path.dirname(self.file_path))
+        if self.shared:
+            self._snapshot = _snapshot(self.cache)
+        return True
+
+    def _merge_from_disk(self):
+        """Merge the changes made on disk into the cache, under the lock"""
+        signature = stat_signature(self.file_path)
+        if signature is None:
+            # Nothing saved yet, every key of the cache is a local change
+            self._snapshot = {}
+            return
+        # The modified time may not have changed within its resolution
+        # so the contents are always compared
+        content = self._read_content(signature[0])
+        self._set_stat(signature)
+
+        digest = _hash_content(content)
+        if digest == self._hash:
+            return
+        self._hash = digest
+        self._update_cache(self.deserialize(content), merge_local=True)
+
+    def _update_cache(self, data, merge_local=False):
+        """Replace the cache with the data read from disk
+
+        Args:
+            data (dict): the data on disk
+            merge_local (bool): keep the local changes, see `merge`
+        """
+        if self.shared:
+            # Taken first, the cache shares the values of the data below
+            snapshot = _snapshot(data)
+        if merge_local and self._snapshot is not None:
+            data, conflicts = merge(self._snapshot, self.cache, data)
+            if conflicts:
+                print("{0} changed on disk, keeping the local {1}".format(
+                        self.file_path, ", ".join(str(key) for key in conflicts)))
+
+        if self.shared:
+            keys = changed_keys(self.cache, data)
+            if not self.cache:
+                self.cache = data
+            else:
+                # Only the changed keys are replaced, the others stay the same objects
+                for key in keys:
+                    if key in data:
+                        self.cache[key] = data[key]
+                    else:
+                        del self.cache[key]
+            self._snapshot = snapshot
+        else:
+            keys = changed_keys(self.cache, data) if self._callbacks else []
+            self.cache = data
+
+        if keys:
+            for callback in list(self._callbacks):
+                callback(keys)
+
+    def add_callback(self, func):
+        """Call the function with the keys changed on disk when read
+
+        Args:
+            func (func): takes the list of changed top level keys
+        """
+        self._callbacks.append(func)
+
+    def remove_callback(self, func):
+        self._callbacks.remove(func)
 
     def read_from_disk(self, force=False):
         """Read the file from disk.
 
-        This checks the modified time of the file as to avoid subsequent
-        reads
+        This checks the size and modified time of the file as to avoid
+        subsequent reads. The data is only decoded again when the contents
+        changed.
 
         Args:
             force (bool): forces a read from disk even if the modified
@@ -60,48 +448,188 @@ class ConfigIO(object):
         Returns:
             dict: data from the configuration
         """
-        if not os.path.exists(self.file_path):
+        signature = stat_signature(self.file_path)
+        if signature is None:
             self.cache = copy.copy(self.default_data)
+            self._stat = self._hash = None
+            if self.shared:
+                self._snapshot = {}
             return
 
-        last_modified = os.path.getmtime(self.file_path)
-        if self.modified_time < last_modified or force:
-            self.modified_time = last_modified
-            with open(self.file_path, "r") as f:
-                self.cache = self._io_read(f)
+        if signature == self._stat and not force:
+            return
+
+        content = self._read_content(signature[0])
+        self._set_stat(signature)
+
+        digest = _hash_content(content)
+        if digest == self._hash and not force:
+            return
+        self._hash = digest
+        # A revert drops the local changes
+        self._update_cache(self.deserialize(content), merge_local=self.shared and not force)
+
+    def _set_stat(self, signature):
+        self._stat = signature
+        if signature is not None:
+            self.modified_time = signature[1] / 1e9
+
+    def schedule_save(self):
+        """Save to disk once `delay` seconds have passed
+
+        Writes made until then are saved together.
+        """
+        with self._lock:
+            self._dirty = True
+            _PENDING.add(self)
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Save the scheduled writes now"""
+        with self._lock:
+            if self._dirty:
+                self.save_to_disk()
+            else:
+                self._cancel_save()
+
+    def is_dirty(self):
+        """Check if writes are waiting to be saved"""
+        return self._dirty
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _cancel_save(self):
+        self._cancel_timer()
+        self._dirty = False
+        _PENDING.discard(self)
+
+    def start_watch(self, callback=None, watcher=None):
+        """Read the file again only once a watcher reports it changed
+
+        Reading the data in sync becomes a memory access instead of a
+        stat of the file.
+
+        Args:
+            callback (func): called with this ConfigIO when the file is
+                             changed by something else. It is called from
+                             the watcher thread
+            watcher (filewatch.PollingWatcher): defaults to
+                                                `filewatch.get_watcher`
+        """
+        self.stop_watch()
+        self._watcher = watcher or filewatch.get_watcher()
+        self._watch_callback = callback
+        self._stale = True
+        self._watcher.watch(self.file_path, self._on_file_changed)
+
+    def stop_watch(self):
+        """Go back to checking the file on every read"""
+        if self._watcher is not None:
+            self._watcher.unwatch(self.file_path, self._on_file_changed)
+        self._watcher = None
+        self._watch_callback = None
+
+    def is_watched(self):
+        return self._watcher is not None
+
+    def _on_file_changed(self, path):
+        # The watcher also reports the writes of this ConfigIO, the lock
+        # waits for a save in progress to record the new file
+        with self._lock:
+            if stat_signature(self.file_path) == self._stat:
+                return
+            self._stale = True
+        if self._watch_callback is not None:
+            self._watch_callback(self)
+
+    def _thread_contexts(self):
+        """Get the write state of the current thread
+
+        Returns:
+            threading.local: `pending` when `write` was called but not
+                             entered yet, `stack` of the with statements
+        """
+        contexts = self.__contexts
+        if not hasattr(contexts, "stack"):
+            contexts.pending = False
+            contexts.stack = []
+        return contexts
 
     def __enter__(self):
-        if self._sync:
-            self.read_from_disk()
+        contexts = self._thread_contexts()
+        is_write = contexts.pending
+        contexts.pending = False
+        contexts.stack.append(is_write)
+        # Unsaved writes are newer than the file
+        if self._sync and not self._dirty and (self._watcher is None or self._stale):
+            # Cleared first so a change made while reading is not missed
+            self._stale = False
+            try:
+                self.read_from_disk()
+            except Exception:
+                contexts.stack.pop()
+                if is_write:
+                    self._lock.release()
+                raise
         return self.cache
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.__context_write and self._sync:
-            self.save_to_disk()
+        if not self._thread_contexts().stack.pop():
+            return
+        try:
+            if self._sync:
+                if self.delay > 0:
+                    self.schedule_save()
+                else:
+                    self.save_to_disk()
+        finally:
+            self._lock.release()
 
     def write(self):
-        """Use in a with statement to auto save the file when sync is on"""
-        self.__context_write = True
+        """Use in a with statement to auto save the file when sync is on
+
+        The cache is locked until the with statement ends so a scheduled
+        save never serializes it while it is changed.
+        """
+        self._lock.acquire()
+        self._thread_contexts().pending = True
         return self
 
     def pause_sync(self):
-        """Pause syncing"""
+        """Pause syncing, scheduled writes are saved first"""
+        self.flush()
+        self.stop_watch()
         self._sync = False
 
-    def start_sync(self, save=False):
+    def start_sync(self, save=False, watch=False):
         """Start sync and save current to file if given
 
         Args:
             save (bool): save the file when stating the syc
+            watch (bool): only read the file again when it changes,
+                          see `start_watch`
 
         """
         self._sync = True
+        if watch:
+            self.start_watch()
         if save:
             self.save_to_disk()
 
 
 class BaseConfig(object):
-    def __init__(self, path, default=None):
+    # Read and write the file in binary mode
+    binary = False
+    # Give `_io_read` the memory mapped file, see `ConfigIO`
+    mapped = False
+
+    def __init__(self, path, default=None, delay=0.0, shared=False):
         """Base class for config files.
 
         _io_read and io_write must be implemented in subsequent classes
@@ -109,8 +637,13 @@ class BaseConfig(object):
         Args:
             path (str): the fie path of the config
             default (dict): default data to fill the file
+            delay (float): seconds writes are held for to save them together
+            shared (bool): merge with the changes other sessions save,
+                           see `ConfigIO`
         """
-        self.io = ConfigIO(path, self._io_read, self._io_write, default=default)
+        self.io = ConfigIO(path, self._io_read, self._io_write,
+                           default=default, delay=delay, shared=shared,
+                           binary=self.binary, mapped=self.mapped)
         self.io.read_from_disk()
 
     def _io_read(self, f):
@@ -140,14 +673,29 @@ class BaseConfig(object):
         """Check is io is syncing with changes"""
         return not self.io._sync
 
-    def start_sync(self, save=False):
+    def start_sync(self, save=False, watch=False):
         """Start syncing with file changes"""
-        self.io.start_sync(save=save)
+        self.io.start_sync(save=save, watch=watch)
 
     def save(self):
         """Save current contents to disk"""
         self.io.save_to_disk()
 
+    def flush(self):
+        """Save the writes held by the delay now"""
+        self.io.flush()
+
+    def add_callback(self, func):
+        """Call the function with the keys other sessions changed
+
+        Args:
+            func (func): takes the list of changed top level keys
+        """
+        self.io.add_callback(func)
+
+    def remove_callback(self, func):
+        self.io.remove_callback(func)
+
     def __eq__(self, other):
         return self.io.file_path == other or self != other
 
@@ -157,7 +705,7 @@ class BaseConfig(object):
 
 
 class ConfigJSON(BaseConfig):
-    def __init__(self, path, default=None):
+    def __init__(self, path, default=None, delay=0.0, shared=False):
         """Base Class for reading and writing a json file
 
         This class is meant to be inherited.
@@ -172,7 +720,7 @@ class ConfigJSON(BaseConfig):
                         data.update(data)
 
         """
-        BaseConfig.__init__(self, path, default)
+        BaseConfig.__init__(self, path, default, delay=delay, shared=shared)
 
     def _io_read(self, f):
         return json.load(f)
@@ -181,48 +729,510 @@ class ConfigJSON(BaseConfig):
         json.dump(data, f, indent=4)
 
 
-def _path_find_generator(name):
-    """Search for a config given the file name along sys.path
+class CODEC():
+    MSGPACK = b"m"
+    MARSHAL = b"a"
 
-    Args:
-        name (str): exact file name to search for
+    @staticmethod
+    def default():
+        """msgpack when it is installed, marshal otherwise"""
+        return CODEC.MSGPACK if msgpack is not None else CODEC.MARSHAL
 
-    Returns:
-        generator: generator object holding the paths
-    """
-    seen = []
-    for path in sys.path:
+    @staticmethod
+    def encode(data, codec):
+        if codec == CODEC.MSGPACK:
+            return msgpack.packb(data, use_bin_type=True)
+        # Version 2 is read the same by python 2 and 3
+        return marshal.dumps(data, 2)
+
+    @staticmethod
+    def decode(content, codec):
+        if codec == CODEC.MSGPACK:
+            if msgpack is None:
+                raise RuntimeError("msgpack is required to read this config")
+            return msgpack.unpackb(content, raw=False)
+        if codec == CODEC.MARSHAL:
+            return marshal.loads(content)
+        raise ValueError("Unknown config codec: {0!r}".format(codec))
+
+
+class ConfigBinary(BaseConfig):
+    MAGIC = b"DBXB"
+    binary = True
+    # CODEC to write with, the best available by default
+    codec = None
+
+    def __init__(self, path, default=None, delay=0.0, shared=False):
+        """Compact binary config encoded with msgpack or marshal
+
+        Reads and writes faster and is smaller than `ConfigJSON` for
+        large configs. The codec is stored in the file, a file written
+        with msgpack can only be read where msgpack is installed.
+        Python 2 `str` is read back as `bytes` by python 3, use unicode.
+        """
+        BaseConfig.__init__(self, path, default, delay=delay, shared=shared)
+
+    def _io_read(self, f):
+        content = f.read()
+        if content[:4] != self.MAGIC:
+            raise ValueError("Not a binary config: " + self.io.file_path)
+        return CODEC.decode(content[5:], content[4:5])
+
+    def _io_write(self, f, data):
+        codec = self.codec or CODEC.default()
+        f.write(self.MAGIC + codec)
+        f.write(CODEC.encode(dict(data), codec))
+
+
+class IndexedData(MutableMapping):
+    def __init__(self, buffer=None, index=None, codec=None, start=0):
+        """Top level keys of an indexed config, decoded when first used
+
+        Args:
+            buffer (mmap.mmap): the file contents
+            index (dict): key: (offset, length) of its encoded value
+            codec (str): CODEC of the values
+            start (int): position of the first value in the buffer
+        """
+        self._buffer = buffer
+        self._index = dict(index or {})
+        self._codec = codec
+        self._start = start
+        # Decoded or set values, the keys are never in both
+        self._values = {}
+
+    @property
+    def codec(self):
+        return self._codec
+
+    def __getitem__(self, key):
+        if key in self._values:
+            return self._values[key]
+        offset, length = self._index.pop(key)
+        start = self._start + offset
+        value = self._values[key] = CODEC.decode(self._buffer[start:start + length],
+                                                 self._codec)
+        return value
+
+    def __setitem__(self, key, value):
+        self._index.pop(key, None)
+        self._values[key] = value
+
+    def __delitem__(self, key):
+        if key in self._values:
+            del self._values[key]
+        else:
+            del self._index[key]
+
+    def __contains__(self, key):
+        return key in self._values or key in self._index
+
+    def __iter__(self):
+        for key in list(self._values):
+            yield key
+        for key in list(self._index):
+            yield key
+
+    def __len__(self):
+        return len(self._values) + len(self._index)
+
+    def __repr__(self):
+        return "<IndexedData keys={0} decoded={1}>".format(len(self), len(self._values))
+
+    def decoded(self):
+        """Get the values which were decoded or set
+
+        Returns:
+            dict:
+        """
+        return self._values
+
+    def encoded(self):
+        """Get the encoded values of the keys which were not used
+
+        Returns:
+            dict: key: bytes
+        """
+        encoded = {}
+        for key, (offset, length) in self._index.items():
+            start = self._start + offset
+            encoded[key] = self._buffer[start:start + length]
+        return encoded
+
+    def encoded_value(self, key):
+        """Get the encoded value of the key
+
+        Returns:
+            bytes: None if the key was used or is missing
+        """
+        if key not in self._index:
+            return None
+        offset, length = self._index[key]
+        start = self._start + offset
+        return self._buffer[start:start + length]
+
+    def snapshot(self):
+        """Get a copy sharing the buffer, only the decoded values are copied
+
+        Returns:
+            IndexedData:
+        """
+        copied = IndexedData(self._buffer, self._index, self._codec, self._start)
+        copied._values = copy.deepcopy(self._values)
+        return copied
+
+    def detach(self):
+        """Copy the values not used yet out of the buffer and release it"""
+        if self._buffer is None:
+            return
+        encoded = self.encoded()
+        buffer = b"".join(encoded[key] for key in encoded)
+        index = {}
+        offset = 0
+        for key in encoded:
+            index[key] = (offset, len(encoded[key]))
+            offset += len(encoded[key])
+        self._buffer, self._index, self._start = buffer, index, 0
+
+
+class ConfigIndexed(BaseConfig):
+    MAGIC = b"DBXI"
+    # magic, codec, length of the index
+    HEADER = struct.Struct("<4scI")
+    mapped = True
+    # CODEC to write with, the best available by default
+    codec = None
+
+    def __init__(self, path, default=None, delay=0.0, shared=False):
+        """Binary config memory mapped and decoded one top level key at a time
+
+        Opening the config only reads the index of the keys, each value
+        is decoded the first time it is used. Saving writes the values
+        which were never used as they are, without decoding them.
+
+        Usage:
+            presets = ConfigIndexed(path)
+            with presets.io as data:
+                edges = data["pCube1"]
+        """
+        BaseConfig.__init__(self, path, default, delay=delay, shared=shared)
+
+    def _io_read(self, f):
+        if not len(f):
+            return IndexedData()
+        magic, codec, index_length = self.HEADER.unpack(f[:self.HEADER.size])
+        if magic != self.MAGIC:
+            raise ValueError("Not an indexed config: " + self.io.file_path)
+        start = self.HEADER.size + index_length
+        index = CODEC.decode(f[self.HEADER.size:start], codec)
+        return IndexedData(f, dict((key, tuple(entry)) for key, entry in index.items()),
+                           codec, start)
+
+    def _io_write(self, f, data):
+        codec = self.codec or CODEC.default()
+        if isinstance(data, IndexedData) and data.codec == codec:
+            values = data.decoded()
+            encoded = data.encoded()
+        else:
+            values = data
+            encoded = {}
+
+        blobs = []
+        index = {}
+        offset = 0
+        for key in values:
+            blob = CODEC.encode(values[key], codec)
+            index[key] = [offset, len(blob)]
+            blobs.append(blob)
+            offset += len(blob)
+        for key, blob in encoded.items():
+            index[key] = [offset, len(blob)]
+            blobs.append(blob)
+            offset += len(blob)
+
+        index = CODEC.encode(index, codec)
+        f.write(self.HEADER.pack(self.MAGIC, codec, len(index)))
+        f.write(index)
+        for blob in blobs:
+            f.write(blob)
+
+
+def _unique_paths(paths):
+    """Get the paths with the same slashes and without duplicates, in order"""
+    seen = set()
+    result = []
+    for path in paths:
         # Sanitize paths just in case
         path = path.replace("\\", '/')
         # In case sys.path has multiples and has different slashes in the path
         if path in seen:
             continue
-        seen.append(path)
+        seen.add(path)
+        result.append(path)
+    return result
+
+
+# A folder modified this close to when it was checked may be modified
+# again without its modified time changing, it is checked until it is older
+RACY_SECONDS = 2.0
+
+# Every PathIndex, told about the configs saved by ConfigIO
+_INDEXES = weakref.WeakSet()
+
+
+def _folder_changed(folder):
+    """Check the folder again on the next search of every `PathIndex`"""
+    folder = folder.replace("\\", "/")
+    for index in list(_INDEXES):
+        index.folder_changed(folder)
 
-        config_path = os.path.join(path, name)
-        config_path = config_path.replace("\\", '/')
-        if not os.path.exists(config_path):
-            continue
 
-        yield config_path
+class PathIndex(object):
+    def __init__(self, paths=None, interval=5.0):
+        """Cached search of configs along the search paths
+
+        A name is searched once and the result is reused while the paths
+        stay the same. Every `interval` seconds the folders the configs
+        would be in are checked for changes, once for all the names, and
+        only the names in changed folders are searched again. Folders a
+        `ConfigIO` saves to are checked on the next search.
+
+        Args:
+            paths (list[str]): paths to search, sys.path by default
+            interval (float): seconds between checks of the folders
+
+        Usage:
+            index = PathIndex()
+            index.find_all("dotblox.json")
+        """
+        self._paths = paths
+        self.interval = interval
+        self._snapshot = None
+        self._search = []
+        # folder: (stat signature, time) at the last check
+        self._folders = {}
+        # name: [(config path, folder, exists)] per search path
+        self._names = {}
+        # Folders to check on the next search, see `folder_changed`
+        self._changed = set()
+        self._checked = timeit.default_timer()
+        _INDEXES.add(self)
+
+    def invalidate(self):
+        """Forget everything found, the next search goes to disk"""
+        self._snapshot = None
+        self._folders.clear()
+        self._names.clear()
+
+    def _search_paths(self):
+        paths = sys.path if self._paths is None else self._paths
+        snapshot = tuple(paths)
+        if snapshot != self._snapshot:
+            self.invalidate()
+            self._snapshot = snapshot
+            self._search = _unique_paths(snapshot)
+        return self._search
+
+    def folder_changed(self, folder):
+        """Check the folder again on the next search
+
+        Args:
+            folder (str): with forward slashes
+        """
+        self._changed.add(folder)
+
+    def _validate(self, folders=None):
+        """Search the names again in the folders which changed
+
+        Args:
+            folders (set[str]): folders known to have changed, all the
+                                folders are checked by default
+        """
+        changed = set()
+        for folder, (signature, checked) in list(self._folders.items()):
+            if folders is not None:
+                if folder in folders:
+                    self._folders[folder] = (stat_signature(folder), time.time())
+                    changed.add(folder)
+                continue
+            current = stat_signature(folder)
+            racy = signature is not None and checked - signature[1] / 1e9 < RACY_SECONDS
+            if current != signature or racy:
+                self._folders[folder] = (current, time.time())
+                changed.add(folder)
+        if folders is None:
+            self._checked = timeit.default_timer()
+
+        if not changed:
+            return
+        for name, candidates in self._names.items():
+            self._names[name] = [
+                (config_path, folder,
+                 self._exists(config_path, folder) if folder in changed else exists)
+                for config_path, folder, exists in candidates]
+
+    def _exists(self, config_path, folder):
+        if folder not in self._folders:
+            self._folders[folder] = (stat_signature(folder), time.time())
+        return self._folders[folder][0] is not None and os.path.exists(config_path)
+
+    def _scan(self, name, search):
+        candidates = []
+        for path in search:
+            config_path = os.path.join(path, name).replace("\\", '/')
+            folder = os.path.dirname(config_path)
+            candidates.append((config_path, folder, self._exists(config_path, folder)))
+        return candidates
+
+    def find_all(self, name):
+        """Find all configs with the given name along the paths
+
+        Args:
+            name (str): Name of file including the extension
+
+        Returns:
+            list[str]:
+        """
+        search = self._search_paths()
+        if timeit.default_timer() - self._checked >= self.interval:
+            self._changed.clear()
+            self._validate()
+        elif self._changed:
+            folders, self._changed = self._changed, set()
+            self._validate(folders)
+
+        candidates = self._names.get(name)
+        if candidates is None:
+            candidates = self._names[name] = self._scan(name, search)
+        return [config_path for config_path, _, exists in candidates if exists]
+
+    def find_one(self, name):
+        """Find the first config with the given name along the paths
+
+        Returns:
+            str: or None if there is none
+        """
+        found = self.find_all(name)
+        return found[0] if found else None
+
+
+_INDEX = PathIndex()
+
+
+def invalidate_index():
+    """Forget the configs found by `find_all` and `find_one`"""
+    _INDEX.invalidate()
 
 
 def find_all(name):
     """Find all configs with the given name along sys.path
 
+    The result is cached, see `PathIndex`
+
     Args:
         name (str): Name of file including the extension
     """
-    return list(_path_find_generator(name))
+    return _INDEX.find_all(name)
 
 
 def find_one(name):
     """Find the first config with the given name along sys.path
 
+    The result is cached, see `PathIndex`
+
     Args:
         name (str): Name of file including the extension
     """
-    try:
-        return next(_path_find_generator(name))
-    except StopIteration:
-        return None
+    return _INDEX.find_one(name)
+
+
+def _merge_values(values):
+    """Merge the values of a key, the first value has priority
+
+    Dicts are merged key by key, anything else is overridden.
+    """
+    if not all(isinstance(value, dict) for value in values):
+        return values[0]
+    merged = {}
+    for key in set().union(*values):
+        merged[key] = _merge_values([value[key] for value in values if key in value])
+    return merged
+
+
+class LayeredConfig(object):
+    def __init__(self, name, config_class=ConfigJSON, index=None):
+        """All the configs with the same name along sys.path as one
+
+        A config found earlier on sys.path overrides the ones after it,
+        with the user path before the show and the studio paths a user
+        value overrides the show and studio values. Dict values are
+        merged key by key.
+
+        The configs are only read when a value is first asked for and the
+        merged value of each key is cached until `reload`.
+
+        Args:
+            name (str): Name of file including the extension
+            config_class (type): BaseConfig used to read every layer
+            index (PathIndex): where to find the configs, the index of
+                               `find_all` by default
+
+        Usage:
+            settings = LayeredConfig("dotblox.json")
+            settings.get("colorizer", {})
+        """
+        self.name = name
+        self.config_class = config_class
+        self._index = _INDEX if index is None else index
+        self._layers = None
+        self._values = {}
+
+    def paths(self):
+        """Get the path of every layer, highest priority first"""
+        return self._index.find_all(self.name)
+
+    def layers(self):
+        """Get the config of every layer, highest priority first
+
+        Returns:
+            list[BaseConfig]:
+        """
+        if self._layers is None:
+            self._layers = [self.config_class(path) for path in self.paths()]
+        return self._layers
+
+    def reload(self):
+        """Find and read the layers again"""
+        self._layers = None
+        self._values.clear()
+
+    def keys(self):
+        keys = set()
+        for layer in self.layers():
+            keys.update(layer.io.cache)
+        return keys
+
+    def get(self, key, default=None):
+        """Get the merged value of the key across the layers"""
+        if key not in self._values:
+            values = [layer.io.cache[key] for layer in self.layers() if key in layer.io.cache]
+            if not values:
+                return default
+            self._values[key] = _merge_values(values)
+        return self._values[key]
+
+    def data(self):
+        """Get the merged contents of all the layers
+
+        Returns:
+            dict:
+        """
+        return dict((key, self.get(key)) for key in self.keys())
+
+    def __contains__(self, key):
+        return any(key in layer.io.cache for layer in self.layers())
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return self.get(key)
@@ -0,0 +1,329 @@
+"""Watch files for changes without polling them on every use
+
+inotify is used on Linux, other platforms poll the files from a thread.
+The folder of each file is watched so a file replaced by a rename, like
+the configs written by `dotbloxlib.config`, is still seen.
+
+Callbacks are called from the watcher thread with the path that changed.
+
+Usage:
+    watcher = create_watcher()
+    watcher.watch("/path/config.json", lambda path: print(path))
+    ...
+    watcher.stop()
+"""
+import atexit
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import traceback
+
+
+def stat_signature(path):
+    """Get the (size, modified time in ns, inode) of the file
+
+    Every write renames a new file over the config so the inode changes
+    even when the modified time is too coarse to tell two writes apart.
+
+    Returns:
+        tuple: or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    modified_time = getattr(stat, "st_mtime_ns", None)
+    if modified_time is None:
+        modified_time = int(stat.st_mtime * 1e9)
+    return stat.st_size, modified_time, stat.st_ino
+
+
+class PollingWatcher(object):
+    def __init__(self, interval=1.0):
+        """Watch files by checking their stat signature every `interval` seconds
+
+        Args:
+            interval (float): seconds between checks
+        """
+        self.interval = interval
+        self._lock = threading.Lock()
+        # path: [callbacks]
+        self._callbacks = {}
+        # path: stat signature at the last check
+        self._signatures = {}
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def watch(self, path, callback):
+        """Call the callback with the path whenever the file changes
+
+        Args:
+            path (str): file to watch, it does not have to exist
+            callback (func): takes the path
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            if path not in self._callbacks:
+                self._callbacks[path] = []
+                self._signatures[path] = stat_signature(path)
+                self._add(path)
+            self._callbacks[path].append(callback)
+            self._start()
+
+    def unwatch(self, path, callback=None):
+        """Stop calling the callback, or all the callbacks, of the path"""
+        path = os.path.abspath(path)
+        with self._lock:
+            callbacks = self._callbacks.get(path)
+            if callbacks is None:
+                return
+            if callback is not None and callback in callbacks:
+                callbacks.remove(callback)
+            if callback is None or not callbacks:
+                del self._callbacks[path]
+                del self._signatures[path]
+                self._remove(path)
+
+    def paths(self):
+        with self._lock:
+            return list(self._callbacks)
+
+    def is_alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def stop(self, timeout=5.0):
+        """Stop the thread and wait for it to finish"""
+        self._stop_event.set()
+        self._wake()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._close()
+
+    def _start(self):
+        if self._thread is not None or self._stop_event.is_set():
+            return
+        self._thread = threading.Thread(target=self._run, name=self.__class__.__name__)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _notify(self, path):
+        with self._lock:
+            callbacks = list(self._callbacks.get(path, []))
+        for callback in callbacks:
+            try:
+                callback(path)
+            except Exception:
+                traceback.print_exc()
+
+    def _check(self, paths):
+        """Notify the paths whose stat signature changed"""
+        for path in paths:
+            signature = stat_signature(path)
+            with self._lock:
+                if path not in self._signatures or self._signatures[path] == signature:
+                    continue
+                self._signatures[path] = signature
+            self._notify(path)
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self._check(self.paths())
+
+    def _add(self, path):
+        pass
+
+    def _remove(self, path):
+        pass
+
+    def _wake(self):
+        pass
+
+    def _close(self):
+        pass
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+_LIBC = _load_libc()
+
+
+class InotifyWatcher(PollingWatcher):
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    MASK = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self, interval=1.0):
+        """Watch files with inotify
+
+        The folders of the files are watched. Files whose folder does not
+        exist yet are checked every `interval` seconds until it does.
+
+        Raises:
+            OSError: inotify is not available
+        """
+        PollingWatcher.__init__(self, interval=interval)
+        if _LIBC is None:
+            raise OSError("inotify is not available")
+        self._fd = _LIBC.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._wake_read, self._wake_write = os.pipe()
+        # watch descriptor: folder, folder: watch descriptor
+        self._folders = {}
+        self._descriptors = {}
+
+    def _add_folder(self, folder):
+        """Watch the folder, must be called with the lock held
+
+        Returns:
+            bool: False if the folder can not be watched yet
+        """
+        if folder in self._descriptors:
+            return True
+        encoded = folder if isinstance(folder, bytes) else folder.encode(
+                sys.getfilesystemencoding() or "utf-8")
+        descriptor = _LIBC.inotify_add_watch(self._fd, encoded, self.MASK)
+        if descriptor < 0:
+            return False
+        self._descriptors[folder] = descriptor
+        self._folders[descriptor] = folder
+        return True
+
+    def _add(self, path):
+        self._add_folder(os.path.dirname(path))
+        # The thread may be waiting without a timeout, wake it to retry
+        # the folders which do not exist yet
+        self._wake()
+
+    def _remove(self, path):
+        folder = os.path.dirname(path)
+        if any(os.path.dirname(other) == folder for other in self._callbacks):
+            return
+        descriptor = self._descriptors.pop(folder, None)
+        if descriptor is not None:
+            self._folders.pop(descriptor, None)
+            _LIBC.inotify_rm_watch(self._fd, descriptor)
+
+    def _wake(self):
+        try:
+            os.write(self._wake_write, b"x")
+        except OSError:
+            pass
+
+    def _close(self):
+        for fd in (self._fd, self._wake_read, self._wake_write):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fd = self._wake_read = self._wake_write = -1
+
+    def _unwatched(self):
+        """Get the paths whose folder is not watched, retrying to watch it"""
+        with self._lock:
+            return [path for path in self._callbacks
+                    if not self._add_folder(os.path.dirname(path))]
+
+    def _read_events(self):
+        """Get the paths the pending events are about"""
+        try:
+            data = os.read(self._fd, 65536)
+        except OSError:
+            return []
+        paths = set()
+        offset = 0
+        while offset + self.EVENT.size <= len(data):
+            descriptor, mask, _, length = self.EVENT.unpack_from(data, offset)
+            name = data[offset + self.EVENT.size:offset + self.EVENT.size + length]
+            offset += self.EVENT.size + length
+
+            with self._lock:
+                if mask & self.IN_Q_OVERFLOW:
+                    # Events were dropped, everything may have changed
+                    paths.update(self._callbacks)
+                    continue
+                folder = self._folders.get(descriptor)
+                if mask & self.IN_IGNORED:
+                    # The folder was removed, watch it again once it exists
+                    self._folders.pop(descriptor, None)
+                    self._descriptors.pop(folder, None)
+                    paths.update(path for path in self._callbacks
+                                 if os.path.dirname(path) == folder)
+                    continue
+            if folder is None:
+                continue
+            name = name.rstrip(b"\0").decode(sys.getfilesystemencoding() or "utf-8")
+            paths.add(os.path.join(folder, name))
+        return paths
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            unwatched = self._unwatched()
+            try:
+                readable, _, _ = select.select([self._fd, self._wake_read], [], [],
+                                               self.interval if unwatched else None)
+            except (OSError, select.error, ValueError):
+                return
+            if self._stop_event.is_set():
+                return
+            if self._wake_read in readable:
+                os.read(self._wake_read, 1024)
+
+            paths = set(unwatched)
+            if self._fd in readable:
+                paths.update(self._read_events())
+            # Only report the files which really changed
+            self._check([path for path in self.paths() if path in paths])
+
+
+def create_watcher(interval=1.0):
+    """Get an inotify watcher, or a polling one where inotify is not available"""
+    try:
+        return InotifyWatcher(interval=interval)
+    except OSError:
+        return PollingWatcher(interval=interval)
+
+
+_WATCHER = []
+
+
+def get_watcher():
+    """Get the watcher shared by the process, stopped when python exits"""
+    if not _WATCHER:
+        _WATCHER.append(create_watcher())
+    return _WATCHER[0]
+
+
+def stop_watcher():
+    """Stop the watcher of `get_watcher`"""
+    if _WATCHER:
+        _WATCHER.pop().stop()
+
+
+atexit.register(stop_watcher)
@@ -1,18 +1,148 @@
+"""Find the dotblox icons and share their Qt icons and pixmaps
+
+The icons directory is listed once, or read from the manifest written by
+`write_manifest`, and every lookup, found or not, is cached so finding an
+icon never touches the disk again. `get_qicon` and `get_pixmap` share one
+`QIcon` per icon and the pixmaps through `QPixmapCache` across widgets.
+Qt is only imported by those, the paths work without it.
+
+Usage:
+    path = get_icon("dblx_pivot")
+    btn = FlatToolButton(icon=get_qicon("dblx_pivot"))
+
+    # From a shell when icons are added, optional
+    python -m dotbloxlib.icon
+"""
+import json
 import os
-import glob
 
-__ICON_CACHE = {}
+ICON_DIRECTORY = os.path.join(os.path.abspath(__file__).rsplit(os.sep, 3)[0], "icons")
+MANIFEST = os.path.join(ICON_DIRECTORY, "manifest.json")
+EXTENSIONS = (".png", ".svg")
+
+# file names of the icons directory, sorted
+_INDEX = []
+# name: path or None when no icon starts with the name
+_LOOKUPS = {}
+# path: QtGui.QIcon
+_QICONS = {}
+
+
+def _list_icons(directory=ICON_DIRECTORY):
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    return sorted(name for name in names if os.path.splitext(name)[1].lower() in EXTENSIONS)
+
+
+def _read_manifest():
+    """Get the file names of the manifest, None if it is missing or stale"""
+    try:
+        if os.path.getmtime(MANIFEST) < os.path.getmtime(ICON_DIRECTORY):
+            return None
+        with open(MANIFEST) as f:
+            return sorted(json.load(f))
+    except (OSError, IOError, ValueError):
+        return None
+
+
+def write_manifest():
+    """Write the file names of the icons directory to the manifest
+
+    This saves listing the directory on import when it is on a slow share.
+
+    Returns:
+        str: path of the manifest
+    """
+    with open(MANIFEST, "w") as f:
+        json.dump(_list_icons(), f, indent=4)
+    build_index()
+    return MANIFEST
+
+
+def build_index():
+    """(Re)build the index of the icons and forget the cached lookups"""
+    names = _read_manifest()
+    if names is None:
+        names = _list_icons()
+    _INDEX[:] = names
+    _LOOKUPS.clear()
+    _QICONS.clear()
+
+
+def names():
+    """Get the names of the dotblox icons, without their extension
+
+    Returns:
+        list[str]:
+    """
+    return [os.path.splitext(file_name)[0] for file_name in _INDEX]
+
+
 def get_icon(name):
-    """Get icon path of a dotblox icon"""
-    cache = __ICON_CACHE.get(name)
-    if cache:
-        return cache
+    """Get icon path of a dotblox icon
+
+    The first icon, by name, starting with the name is used.
+
+    Returns:
+        str: or None if there is no such icon
+    """
+    try:
+        return _LOOKUPS[name]
+    except KeyError:
+        pass
+
+    path = None
+    for file_name in _INDEX:
+        if file_name.startswith(name):
+            path = os.path.join(ICON_DIRECTORY, file_name)
+            break
+    _LOOKUPS[name] = path
+    return path
+
+
+def get_qicon(name):
+    """Get the QIcon of a dotblox icon, shared by every widget using it
+
+    Args:
+        name (str): name of the icon or path of any image
+
+    Returns:
+        QtGui.QIcon: a null icon if there is no such icon or image
+    """
+    from PySide2 import QtGui
+
+    path = get_icon(name) or name
+    icon = _QICONS.get(path)
+    if icon is None:
+        icon = _QICONS[path] = QtGui.QIcon(path)
+    return icon
+
+
+def get_pixmap(name, size):
+    """Get the pixmap of a dotblox icon at the given size through `QPixmapCache`
+
+    Args:
+        name (str): name of the icon or path of any image
+        size (int): width and height in pixels
+
+    Returns:
+        QtGui.QPixmap: a null pixmap if there is no such icon
+    """
+    from PySide2 import QtGui
+
+    path = get_icon(name) or name
+    key = "dotblox:{0}:{1}".format(path, size)
+    pixmap = QtGui.QPixmap()
+    if not QtGui.QPixmapCache.find(key, pixmap):
+        pixmap = get_qicon(path).pixmap(size, size)
+        QtGui.QPixmapCache.insert(key, pixmap)
+    return pixmap
+
 
-    directory = __file__.rsplit(os.sep, 3)[0]
-    icon_directory = os.path.join(directory, "icons")
+build_index()
 
-    files = glob.glob(os.path.join(icon_directory,  "%s*" % name))
-    if files:
-        __ICON_CACHE[name] = files[0]
-        return files[0]
 
+if __name__ == "__main__":
+    print(write_manifest())
@@ -0,0 +1,129 @@
+"""Sets of integers stored as sorted inclusive intervals
+
+A set is a flat list `[start, end, start, end, ...]`, the same ranges as
+maya components `e[3:6]`, so 10000 neighbouring edges take two integers.
+
+Usage:
+    edges = from_indices([0, 1, 2, 7])        # [0, 2, 7, 7]
+    to_components(edges, "e")                 # ["e[0:2]", "e[7]"]
+    union(edges, from_components(["e[3]"]))   # [0, 3, 7, 7]
+"""
+import re
+
+_COMPONENT_RE = re.compile(r"\[(\d+)(?::(\d+))?\]$")
+
+
+def _pairs(intervals):
+    return zip(intervals[0::2], intervals[1::2])
+
+
+def _merge(pairs):
+    """Merge sorted (start, end) pairs which overlap or touch"""
+    result = []
+    for start, end in pairs:
+        if result and start <= result[-1] + 1:
+            if end > result[-1]:
+                result[-1] = end
+        else:
+            result.extend((start, end))
+    return result
+
+
+def from_indices(indices):
+    """Get the intervals of the indices
+
+    Args:
+        indices (iterable[int]): in any order, duplicates allowed
+
+    Returns:
+        list[int]:
+    """
+    return _merge((index, index) for index in sorted(set(indices)))
+
+
+def to_indices(intervals):
+    """Get every index of the intervals
+
+    Returns:
+        list[int]: sorted
+    """
+    indices = []
+    for start, end in _pairs(intervals):
+        indices.extend(range(start, end + 1))
+    return indices
+
+
+def from_components(components):
+    """Get the intervals of maya components like `e[3:6]` or `node.e[9]`
+
+    Components using `*` or missing an index are ignored.
+
+    Returns:
+        list[int]:
+    """
+    pairs = []
+    for component in components:
+        match = _COMPONENT_RE.search(component)
+        if match is None:
+            continue
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) is not None else start
+        pairs.append((min(start, end), max(start, end)))
+    return _merge(sorted(pairs))
+
+
+def to_components(intervals, kind="e", node=None):
+    """Get maya components of the intervals
+
+    Args:
+        intervals (list[int]):
+        kind (str): component kind, e, vtx, f
+        node (str): prefix the components with the node
+
+    Returns:
+        list[str]:
+    """
+    prefix = kind if node is None else node + "." + kind
+    components = []
+    for start, end in _pairs(intervals):
+        if start == end:
+            components.append("{0}[{1}]".format(prefix, start))
+        else:
+            components.append("{0}[{1}:{2}]".format(prefix, start, end))
+    return components
+
+
+def count(intervals):
+    """Get the number of indices in the intervals"""
+    return sum(end - start + 1 for start, end in _pairs(intervals))
+
+
+def contains(intervals, index):
+    """Get whether the index is in the intervals"""
+    return any(start <= index <= end for start, end in _pairs(intervals))
+
+
+def union(first, second):
+    """Get the intervals of the indices in either"""
+    return _merge(sorted(list(_pairs(first)) + list(_pairs(second))))
+
+
+def difference(first, second):
+    """Get the intervals of the indices of `first` which are not in `second`"""
+    result = []
+    removed = list(_pairs(second))
+    i = 0
+    for start, end in _pairs(first):
+        # Skip the removed intervals before this one
+        while i < len(removed) and removed[i][1] < start:
+            i += 1
+        j = i
+        while start <= end:
+            if j >= len(removed) or removed[j][0] > end:
+                result.extend((start, end))
+                break
+            if removed[j][0] > start:
+                result.extend((start, removed[j][0] - 1))
+            start = max(start, removed[j][1] + 1)
+            j += 1
+    return result
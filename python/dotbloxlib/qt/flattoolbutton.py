@@ -1,80 +1,250 @@
+"""Flat tool button matching the maya shelf buttons
+
+The hover and disabled variants of the icons are made the first time a
+button is hovered or disabled and shared by every button with the same
+icon, the least recently used past `MAX_VARIANTS` are dropped. They can
+also be written once as png sprites, which are then loaded instead of
+being made.
+
+Buttons with a dotblox icon can paint it from the `iconatlas` instead,
+which is faster for shelves with many buttons.
+
+Usage:
+    btn = FlatToolButton(icon="dblx_pivot")
+    btn = FlatToolButton(icon="dblx_pivot", atlas=True)
+
+    # From a shell, optional
+    python -m dotbloxlib.qt.flattoolbutton
+"""
+import collections
+import os
+import sys
+
 from PySide2 import QtCore, QtGui, QtWidgets
 
+from dotbloxlib import icon as iconlib
+
 __author__ = "Ryan Robinson"
 
+HOVER_FACTOR = .2
+DISABLED_FACTOR = -.2
+ICON_SIZE = 32
+
+# Next to the icons directory, a folder created in it would make the
+# icons manifest stale
+VARIANT_DIRECTORY = os.path.join(os.path.dirname(iconlib.ICON_DIRECTORY), "icon_variants")
+VARIANT_NAMES = {HOVER_FACTOR: "hover", DISABLED_FACTOR: "disabled"}
+# Variants kept, the least recently used are dropped past it
+MAX_VARIANTS = 256
+
+# (icon cache key, factor, (width, height)): QtGui.QIcon, oldest use first
+_VARIANTS = collections.OrderedDict()
+_SPRITES = {"loaded": False}
+
+
+def make_variant(icon, factor, size):
+    """Lightens or darkens an icon based on the factor
+
+    Args:
+        icon (QtGui.QIcon):
+        factor (float): ideal range is (0-1 for lighter) (-1 - 0 for darker) and  but can be pushed further
+        size (QtCore.QSize): size of the pixmap adjusted when the icon has
+            no fixed sizes, like svg icons
+
+    Returns:
+        QtGui.QIcon: the adjusted icon, None for a null icon
+    """
+    if factor == 0:
+        return icon
+
+    if icon.isNull():
+        return
+
+    sizes = icon.availableSizes()
+    if sizes:
+        # The largest pixmap stays sharp on high dpi screens
+        size = max(sizes, key=lambda s: s.width() * s.height())
+    px = icon.pixmap(size)
+
+    painter = QtGui.QPainter(px)
+    if factor > 0:
+        color = QtGui.QColor(255, 255, 255, 255 * factor)
+    else:
+        color = QtGui.QColor(0, 0, 0, 255 * abs(factor))
+
+    painter.setCompositionMode(painter.CompositionMode_SourceAtop)
+    painter.fillRect(px.rect(), color)
+    painter.end()
+    return QtGui.QIcon(px)
+
+
+def get_variant(icon, factor, size):
+    """Get the variant of the icon shared by the process, made when first asked
+
+    Args:
+        icon (QtGui.QIcon):
+        factor (float): see `make_variant`
+        size (QtCore.QSize):
+
+    Returns:
+        QtGui.QIcon: None for a null icon
+    """
+    if not _SPRITES["loaded"]:
+        load_variants()
+
+    key = (icon.cacheKey(), factor, (size.width(), size.height()))
+    try:
+        variant = _VARIANTS.pop(key)
+    except KeyError:
+        variant = make_variant(icon, factor, size)
+    _add_variant(key, variant)
+    return variant
+
+
+def _add_variant(key, variant):
+    _VARIANTS[key] = variant
+    while len(_VARIANTS) > MAX_VARIANTS:
+        _VARIANTS.popitem(last=False)
+
+
+def clear_variants():
+    """Forget the variants, the sprites are loaded again when next needed"""
+    _VARIANTS.clear()
+    _SPRITES["loaded"] = False
+
+
+def _sprite_name(name, factor, size):
+    return "{0}_{1}_{2}.png".format(name, VARIANT_NAMES[factor], size)
+
+
+def save_variants(directory=VARIANT_DIRECTORY, size=ICON_SIZE):
+    """Write the variants of every dotblox icon as png sprites
+
+    Needs a QApplication.
+
+    Returns:
+        list[str]: paths of the sprites
+    """
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    q_size = QtCore.QSize(size, size)
+    paths = []
+    for name in iconlib.names():
+        icon = iconlib.get_qicon(name)
+        for factor in VARIANT_NAMES:
+            variant = make_variant(icon, factor, q_size)
+            if variant is None:
+                continue
+            path = os.path.join(directory, _sprite_name(name, factor, size))
+            variant.pixmap(q_size).save(path, "PNG")
+            paths.append(path)
+    return paths
+
+
+def load_variants(directory=VARIANT_DIRECTORY, size=ICON_SIZE):
+    """Use the sprites written by `save_variants` for the dotblox icons
+
+    Only the dotblox icons shared through `dotbloxlib.icon.get_qicon` use
+    them. The folder is listed once, missing sprites are made when needed.
+    """
+    _SPRITES["loaded"] = True
+    try:
+        sprites = set(os.listdir(directory))
+    except OSError:
+        return
+
+    for name in iconlib.names():
+        for factor in VARIANT_NAMES:
+            file_name = _sprite_name(name, factor, size)
+            if file_name not in sprites:
+                continue
+            key = (iconlib.get_qicon(name).cacheKey(), factor, (size, size))
+            _add_variant(key, QtGui.QIcon(QtGui.QPixmap(os.path.join(directory, file_name))))
+
 
 class FlatToolButton(QtWidgets.QToolButton):
-    def __init__(self, icon=None, parent=None):
+    def __init__(self, icon=None, parent=None, atlas=False):
         """ToolButton to match mayas style
 
         Args:
-            icon (str): path of icon to be set
+            icon (str): path or dotblox name of icon to be set, the
+                QIcon is shared with the other buttons using it
+            atlas (bool): paint a dotblox icon from the `iconatlas`
         """
         QtWidgets.QToolButton.__init__(self, parent=parent)
-        self.setIconSize(QtCore.QSize(32, 32))
-        if not isinstance(icon, QtGui.QIcon):
-            icon = QtGui.QIcon(icon)
+        self.setIconSize(QtCore.QSize(ICON_SIZE, ICON_SIZE))
+        atlas_name = None
+        if icon is None:
+            icon = QtGui.QIcon()
+        elif not isinstance(icon, QtGui.QIcon):
+            path = iconlib.get_icon(icon) or icon
+            if atlas and os.path.dirname(path) == iconlib.ICON_DIRECTORY:
+                atlas_name = os.path.splitext(os.path.basename(path))[0]
+            icon = iconlib.get_qicon(path)
         self.setIcon(icon)
+        self._atlas_name = atlas_name
 
     def setIcon(self, icon):
         QtWidgets.QToolButton.setIcon(self, icon)
-        self.__hover_icon = self._make_icon(.2)
-        self.__disabled_icon = self._make_icon(-.2)
+        self._atlas_name = None
 
     def enterEvent(self, event):
         QtWidgets.QToolButton.enterEvent(self, event)
-        # Maya does repaint for some reason
-        self.repaint()
+        # Maya does not update the hover state on its own
+        self.update()
 
     def leaveEvent(self, event):
         QtWidgets.QToolButton.leaveEvent(self, event)
-        # Maya does repaint for some reason
-        self.repaint()
+        # Maya does not update the hover state on its own
+        self.update()
 
     def paintEvent(self, event):
         painter = QtGui.QPainter(self)
+        self.drawButton(painter, event.rect())
+        painter.end()
+
+    def drawButton(self, painter, rect):
+        """Paint the button, override to paint over it with the same painter
+
+        Args:
+            painter (QtGui.QPainter):
+            rect (QtCore.QRect): rect to paint
+        """
         style = QtWidgets.QStyleOptionToolButton()
         style.initFrom(self)
 
-        icon = self.icon()
-        if style.state & QtWidgets.QStyle.State_MouseOver:
-            icon = self.__hover_icon
+        factor = 0
         if not (style.state & QtWidgets.QStyle.State_Enabled):
-            icon = self.__disabled_icon
+            factor = DISABLED_FACTOR
+        elif style.state & QtWidgets.QStyle.State_MouseOver:
+            factor = HOVER_FACTOR
 
-        margin = round(event.rect().width() * 0.125)
-        rect = event.rect().adjusted(margin, -margin, -margin, margin)
-        icon.paint(painter, rect)
-        painter.end()
+        margin = round(rect.width() * 0.125)
+        rect = rect.adjusted(margin, -margin, -margin, margin)
+
+        if self._atlas_name is not None:
+            from dotbloxlib.qt import iconatlas
+            atlas = iconatlas.get_atlas(self.iconSize().width(), self.devicePixelRatioF())
+            if atlas.paint(painter, self._atlas_name, rect, factor):
+                return
+
+        icon = self._make_icon(factor) if factor else self.icon()
+        if icon is not None:
+            icon.paint(painter, rect)
 
     def _make_icon(self, factor=0):
-        """Lightens or darkens an icon based on the factor
+        """Get the shared variant of the icon lightened or darkened by the factor
 
         Args:
-            icon (QtQui.QIcon):
-            factor (float): ideal range is (0-1 for lighter) (-1 - 0 for darker) and  but can be pushed further
+            factor (float): see `make_variant`
 
         Returns:
-            QtQui.QIcon: the adjusted icon
-
+            QtGui.QIcon: the adjusted icon
         """
-        icon = self.icon()
-
-        if factor == 0:
-            return icon
-
-        if icon.isNull():
-            return
+        return get_variant(self.icon(), factor, self.iconSize())
 
-        px = icon.pixmap(icon.availableSizes()[-1])
 
-        painter = QtGui.QPainter(px)
-        if factor > 0:
-            color = QtGui.QColor(255, 255, 255, 255 * factor)
-        elif factor < 0:
-            color = QtGui.QColor(0, 0, 0, 255 * abs(factor))
-
-        painter.setCompositionMode(painter.CompositionMode_SourceAtop)
-        painter.fillRect(px.rect(), color)
-        painter.end()
-        return QtGui.QIcon(px)
+if __name__ == "__main__":
+    app = QtWidgets.QApplication(sys.argv)
+    for path in save_variants():
+        print(path)
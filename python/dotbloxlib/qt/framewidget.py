@@ -13,8 +13,12 @@ class FrameWidget(QtWidgets.QWidget):
         This background color will be set from the current themes
         button color.
 
+    Signals:
+        onCollapse: the collapsed state changed
     """
 
+    onCollapse = QtCore.Signal(bool)
+
     def __init__(self, text="", collapsible=False, parent=None):
         QtWidgets.QWidget.__init__(self, parent)
 
@@ -39,6 +43,7 @@ class FrameWidget(QtWidgets.QWidget):
 
     def _on_title_pressed(self, collapse):
         self._content_widget.setVisible(not collapse)
+        self.onCollapse.emit(collapse)
 
     def setText(self, text):
         """Set the text diplayed in the title"""
@@ -123,6 +128,176 @@ class FrameWidget(QtWidgets.QWidget):
         return self._content_layout.children()
 
 
+class LazyFrameWidget(FrameWidget):
+    """A :class:`FrameWidget` building its widgets when first expanded
+
+    `addWidget` also takes a function returning the widget, which is only
+    called once the frame is shown expanded, so collapsed frames cost
+    nothing to create or lay out.
+
+    Usage:
+        frame = LazyFrameWidget("Pivoting", collapsible=True)
+        frame.setCollapsed(True)
+        frame.addWidget(PivotingWidget)
+
+    Args:
+        placeholder_height (int): height of the contents until they are built
+    """
+
+    # Whether the frame waits for `build` instead of building on show
+    _deferred = False
+
+    def __init__(self, text="", collapsible=False, parent=None, placeholder_height=0):
+        FrameWidget.__init__(self, text=text, collapsible=collapsible, parent=parent)
+        # (factory, args, kwargs) of the widgets to build
+        self._factories = []
+        self._placeholder_height = placeholder_height
+
+    def addWidget(self, widget, *args, **kwargs):
+        """Add the widget, or the function building it on first expand
+
+        Args:
+            widget (QtWidgets.QWidget or func): the widget, or a function
+                taking no arguments returning the widget
+            args: passed to `QBoxLayout.addWidget`
+        """
+        if isinstance(widget, QtWidgets.QWidget) or not callable(widget):
+            FrameWidget.addWidget(self, widget, *args, **kwargs)
+            return
+        self._factories.append((widget, args, kwargs))
+        if self._placeholder_height:
+            self._content_widget.setMinimumHeight(self._placeholder_height)
+        if self.isVisible() and not self.collapsed() and not self._deferred:
+            self.build()
+
+    def isBuilt(self):
+        """Get whether every widget added by a function was built"""
+        return not self._factories
+
+    def build(self):
+        """Build the widgets added by a function now"""
+        factories, self._factories = self._factories, []
+        for factory, args, kwargs in factories:
+            FrameWidget.addWidget(self, factory(), *args, **kwargs)
+        if factories and self._placeholder_height:
+            self._content_widget.setMinimumHeight(0)
+
+    def setDeferred(self, value):
+        """Set whether the frame waits for `build` instead of building on show
+
+        Used by :class:`FrameScrollArea` to only build the frames in view.
+        """
+        self._deferred = value
+
+    def deferred(self):
+        return self._deferred
+
+    def _on_title_pressed(self, collapse):
+        if not collapse and not self._deferred and self.isVisible():
+            self.build()
+        FrameWidget._on_title_pressed(self, collapse)
+
+    def showEvent(self, event):
+        if not self.collapsed() and not self._deferred:
+            self.build()
+        FrameWidget.showEvent(self, event)
+
+
+class FrameScrollArea(QtWidgets.QScrollArea):
+    """Scroll area of stacked frames only building the frames in view
+
+    The :class:`LazyFrameWidget` added are deferred and built once they
+    are expanded and scrolled into view. Until then they only hold their
+    title, so a panel with many frames lays out quickly.
+
+    Usage:
+        area = FrameScrollArea()
+        for name, factory in tools:
+            frame = LazyFrameWidget(name, collapsible=True)
+            frame.addWidget(factory)
+            area.addFrame(frame)
+    """
+
+    def __init__(self, parent=None):
+        QtWidgets.QScrollArea.__init__(self, parent)
+        self.setWidgetResizable(True)
+        self.setFrameShape(QtWidgets.QFrame.NoFrame)
+
+        self._frames = []
+        self._build_scheduled = False
+
+        widget = QtWidgets.QWidget()
+        self._frame_layout = QtWidgets.QVBoxLayout()
+        self._frame_layout.setContentsMargins(0, 0, 0, 0)
+        self._frame_layout.setSpacing(0)
+        self._frame_layout.addStretch()
+        widget.setLayout(self._frame_layout)
+        self.setWidget(widget)
+
+        self.verticalScrollBar().valueChanged.connect(self._schedule_build)
+
+    def addFrame(self, frame):
+        """Add the frame below the others
+
+        Args:
+            frame (FrameWidget):
+        """
+        if isinstance(frame, LazyFrameWidget):
+            frame.setDeferred(True)
+            frame.onCollapse.connect(self._schedule_build)
+        self._frames.append(frame)
+        self._frame_layout.insertWidget(self._frame_layout.count() - 1, frame)
+        self._schedule_build()
+
+    def frames(self):
+        """Get the frames in order
+
+        Returns:
+            list[FrameWidget]:
+        """
+        return list(self._frames)
+
+    def visibleFrames(self):
+        """Get the frames intersecting the viewport
+
+        Returns:
+            list[FrameWidget]:
+        """
+        top = self.verticalScrollBar().value()
+        view = QtCore.QRect(0, top, self.viewport().width(), self.viewport().height())
+        return [frame for frame in self._frames if frame.geometry().intersects(view)]
+
+    def _schedule_build(self, *args):
+        if not self._build_scheduled:
+            self._build_scheduled = True
+            QtCore.QTimer.singleShot(0, self.buildVisible)
+
+    def buildVisible(self):
+        """Build the expanded frames in view"""
+        self._build_scheduled = False
+        if not self.isVisible():
+            return
+        # Building a frame moves the frames after it, until nothing changes
+        while True:
+            self.widget().layout().activate()
+            frames = [frame for frame in self.visibleFrames()
+                      if isinstance(frame, LazyFrameWidget)
+                      and not frame.collapsed() and not frame.isBuilt()]
+            if not frames:
+                return
+            for frame in frames:
+                frame.build()
+
+    def showEvent(self, event):
+        QtWidgets.QScrollArea.showEvent(self, event)
+        # The frames in view are built before the first paint
+        self.buildVisible()
+
+    def resizeEvent(self, event):
+        QtWidgets.QScrollArea.resizeEvent(self, event)
+        self._schedule_build()
+
+
 class _FrameTitle(QtWidgets.QWidget):
     """The widget that handles the display of the title and the
     collapsed state of the :class:`FrameWidget`
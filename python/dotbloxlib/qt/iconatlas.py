@@ -0,0 +1,126 @@
+"""All the dotblox icons in one pixmap per icon size and screen scale
+
+Every icon is scaled once into a cell of the atlas, with its hover and
+disabled variants from `flattoolbutton.get_variant` next to it, and
+painted by copying the cell. This is cheaper than `QIcon.paint` which
+looks up and scales a pixmap per paint, and lets a widget paint many
+icons with a single painter.
+
+Usage:
+    atlas = get_atlas(32, widget.devicePixelRatioF())
+    atlas.paint(painter, "dblx_pivot", rect)
+"""
+import math
+
+from PySide2 import QtCore, QtGui
+
+from dotbloxlib import icon as iconlib
+from dotbloxlib.qt.flattoolbutton import DISABLED_FACTOR, HOVER_FACTOR, get_variant
+
+__author__ = "Ryan Robinson"
+
+# (size, ratio): IconAtlas
+_ATLASES = {}
+
+
+class IconAtlas(object):
+    FACTORS = (0, HOVER_FACTOR, DISABLED_FACTOR)
+
+    def __init__(self, size=32, ratio=1.0):
+        """Render the dotblox icons into one pixmap
+
+        Args:
+            size (int): size of the icons in device independent pixels
+            ratio (float): device pixel ratio of the screen
+        """
+        self.size = size
+        self.ratio = ratio
+        self.cell = int(math.ceil(size * ratio))
+        self.names = iconlib.names()
+        # (name, factor): source rect of the cell
+        self._rects = {}
+
+        columns = max(1, int(math.ceil(math.sqrt(len(self.names)))))
+        rows = max(1, int(math.ceil(len(self.names) / float(columns))))
+        self.pixmap = QtGui.QPixmap(columns * len(self.FACTORS) * self.cell, rows * self.cell)
+        self.pixmap.fill(QtCore.Qt.transparent)
+        self._render(columns)
+
+    def _render(self, columns):
+        painter = QtGui.QPainter(self.pixmap)
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+        cell_size = QtCore.QSize(self.cell, self.cell)
+        for i, name in enumerate(self.names):
+            icon = iconlib.get_qicon(name)
+            if icon.isNull():
+                continue
+            row, column = divmod(i, columns)
+            for j, factor in enumerate(self.FACTORS):
+                # The variants shared with the buttons, see `flattoolbutton`
+                variant = get_variant(icon, factor, cell_size) if factor else icon
+                pixmap = variant.pixmap(cell_size)
+                if pixmap.isNull():
+                    continue
+                pixmap = pixmap.scaled(cell_size, QtCore.Qt.KeepAspectRatio,
+                                       QtCore.Qt.SmoothTransformation)
+                # The cells are in device pixels
+                pixmap.setDevicePixelRatio(1.0)
+                rect = QtCore.QRect((column * len(self.FACTORS) + j) * self.cell,
+                                    row * self.cell,
+                                    pixmap.width(),
+                                    pixmap.height())
+                painter.drawPixmap(rect.topLeft(), pixmap)
+                self._rects[(name, factor)] = rect
+        painter.end()
+
+    def __contains__(self, name):
+        return (name, 0) in self._rects
+
+    def rect(self, name, factor=0):
+        """Get the source rect of the icon in `pixmap`
+
+        Returns:
+            QtCore.QRect: None if the icon is not in the atlas
+        """
+        return self._rects.get((name, factor))
+
+    def paint(self, painter, name, rect, factor=0):
+        """Paint the icon centered in the rect
+
+        Args:
+            painter (QtGui.QPainter):
+            name (str): dotblox icon name
+            rect (QtCore.QRect): target rect
+            factor (float): 0, or the hover or disabled factor
+
+        Returns:
+            bool: False if the icon is not in the atlas
+        """
+        source = self._rects.get((name, factor))
+        if source is None:
+            return False
+        # Keep the aspect ratio of the icon within the rect
+        size = QtCore.QSizeF(source.size()).scaled(QtCore.QSizeF(rect.size()),
+                                                   QtCore.Qt.KeepAspectRatio)
+        target = QtCore.QRectF(QtCore.QPointF(0, 0), size)
+        target.moveCenter(QtCore.QRectF(rect).center())
+        painter.drawPixmap(target, self.pixmap, QtCore.QRectF(source))
+        return True
+
+
+def get_atlas(size=32, ratio=1.0):
+    """Get the atlas of the icon size and screen scale, built on first use
+
+    Returns:
+        IconAtlas:
+    """
+    key = (size, ratio)
+    atlas = _ATLASES.get(key)
+    if atlas is None:
+        atlas = _ATLASES[key] = IconAtlas(size, ratio)
+    return atlas
+
+
+def clear_atlases():
+    """Forget the atlases, for example after `dotbloxlib.icon.build_index`"""
+    _ATLASES.clear()
@@ -1,10 +1,31 @@
 from PySide2 import QtCore, QtWidgets
+import os
 import sys
 
 __author__ = "Ryan Robinson"
 
+OFFSCREEN_PLATFORM = "offscreen"
 
-def run(func):
+
+def get_app(offscreen=False):
+    """Get the QApplication, instancing it if needed
+
+    Args:
+        offscreen (bool): use the offscreen platform when instancing it,
+            nothing is shown and no display is needed
+
+    Returns:
+        QtWidgets.QApplication:
+    """
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        if offscreen:
+            os.environ["QT_QPA_PLATFORM"] = OFFSCREEN_PLATFORM
+        app = QtWidgets.QApplication(sys.argv)
+    return app
+
+
+def run(func, exit=True):
     """
     Instantiates a QApplication
 
@@ -12,41 +33,60 @@ def run(func):
     app is passed into func
 
     func must return the window
+
+    Args:
+        exit (bool): exit python with the exit code of the app
+                     instead of returning it
     """
     try:
         if QtWidgets.QApplication.instance() is not None:
             raise RuntimeError("QApplication already instanced")
 
-        app = QtWidgets.QApplication(sys.argv)
+        app = get_app()
 
         # Keep an instance of the window
         win = func(app)
 
-        sys.exit(app.exec_())
+        code = app.exec_()
+        if exit:
+            sys.exit(code)
+        return code
     except KeyboardInterrupt:
         pass
     except Exception as e:
         raise
 
 
-def run_as_window(func):
-    """Instantiates a QWidget as a window
+def make_window(app, func):
+    """Instantiates a QWidget as a window without showing it
 
     app, win and layout are passed into func
+
+    Returns:
+        QtWidgets.QWidget: the window
     """
+    win = QtWidgets.QWidget()
+    win.setWindowFlags(QtCore.Qt.Window | QtCore.Qt.WindowStaysOnTopHint)
+    win.resize(640 // 2, 480 // 2)
 
-    def wrap(app):
-        win = QtWidgets.QWidget()
-        win.setWindowFlags(QtCore.Qt.Window | QtCore.Qt.WindowStaysOnTopHint)
-        win.resize(640 / 2, 480 / 2)
+    layout = QtWidgets.QVBoxLayout()
+    layout.setContentsMargins(0, 0, 0, 0)
+
+    func(app, win, layout)
 
-        layout = QtWidgets.QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
+    win.setLayout(layout)
+    return win
 
-        func(app, win, layout)
 
-        win.setLayout(layout)
+def run_as_window(func, exit=True):
+    """Instantiates a QWidget as a window
+
+    app, win and layout are passed into func
+    """
+
+    def wrap(app):
+        win = make_window(app, func)
         win.show()
         return win
 
-    run(wrap)
+    return run(wrap, exit=exit)
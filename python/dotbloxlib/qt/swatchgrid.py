@@ -0,0 +1,165 @@
+from PySide2 import QtCore, QtGui, QtWidgets
+
+from dotbloxlib.qt import theme
+
+__author__ = "Ryan Robinson"
+
+
+class SwatchGrid(QtWidgets.QWidget):
+    """Grid of color swatches drawn by a single widget
+
+    Replaces a grid of buttons, changing the swatches only stores the
+    colors and schedules a repaint.
+
+    Usage:
+        grid = SwatchGrid()
+        grid.setSwatches([[("#F44336", "Red 500"), None], [("#2196F3", "Blue 500")]])
+        grid.swatchPressed.connect(lambda hex_value: print(hex_value))
+    """
+    swatchPressed = QtCore.Signal(str)
+
+    def __init__(self, swatch_height=20, parent=None):
+        """
+        Args:
+            swatch_height (int): height of each row
+        """
+        QtWidgets.QWidget.__init__(self, parent=parent)
+        self.setMouseTracking(True)
+        self.setSizePolicy(QtWidgets.QSizePolicy.Preferred,
+                           QtWidgets.QSizePolicy.Fixed)
+
+        self._swatch_height = swatch_height
+        self._columns = []
+        self._rows = 0
+        self._hover = None
+        self._pressed = None
+
+    def setSwatches(self, columns):
+        """Set the swatches to draw
+
+        Args:
+            columns (list[list[tuple]]): per column the (hex value, tooltip)
+                                         of each row. None leaves a gap
+        """
+        self._columns = [list(column) for column in columns]
+        self._rows = max([len(column) for column in self._columns] or [0])
+        self._hover = None
+        self._pressed = None
+        self.updateGeometry()
+        self.update()
+
+    def swatches(self):
+        return self._columns
+
+    def columnCount(self):
+        return len(self._columns)
+
+    def rowCount(self):
+        return self._rows
+
+    def sizeHint(self):
+        return QtCore.QSize(self.columnCount() * 20, self._rows * self._swatch_height)
+
+    def minimumSizeHint(self):
+        return QtCore.QSize(self.columnCount() * 8, self._rows * self._swatch_height)
+
+    def swatchRect(self, row, column):
+        """Get the rect of the swatch in widget coordinates"""
+        width = self.width()
+        count = self.columnCount() or 1
+        left = column * width // count
+        right = (column + 1) * width // count
+        top = row * self._swatch_height
+        return QtCore.QRect(left, top, right - left, self._swatch_height)
+
+    def swatchAt(self, pos):
+        """Get the (row, column) of the swatch at the given position
+
+        Returns:
+            tuple: or None if there is no swatch at the position
+        """
+        if not self._columns or not self.rect().contains(pos):
+            return None
+        column = pos.x() * self.columnCount() // max(self.width(), 1)
+        row = pos.y() // self._swatch_height
+        if column >= self.columnCount() or row >= len(self._columns[column]):
+            return None
+        if self._columns[column][row] is None:
+            return None
+        return row, column
+
+    def swatch(self, index):
+        """Get the (hex value, tooltip) of the swatch at the (row, column)"""
+        row, column = index
+        return self._columns[column][row]
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        painter.setPen(QtGui.QPen(QtCore.Qt.black, 1))
+        clip = event.rect()
+
+        for column, swatches in enumerate(self._columns):
+            for row, swatch in enumerate(swatches):
+                if swatch is None:
+                    continue
+                rect = self.swatchRect(row, column)
+                if not clip.intersects(rect):
+                    continue
+
+                color = swatch[0]
+                if (row, column) == self._pressed:
+                    color = theme.darker(color)
+                elif (row, column) == self._hover:
+                    color = theme.lighter(color)
+
+                painter.setBrush(QtGui.QColor(color))
+                painter.drawRect(rect.adjusted(0, 0, -1, -1))
+        painter.end()
+
+    def _update_swatch(self, index):
+        if index is not None:
+            self.update(self.swatchRect(*index))
+
+    def _set_hover(self, index):
+        if index == self._hover:
+            return
+        self._update_swatch(self._hover)
+        self._hover = index
+        self._update_swatch(index)
+
+    def mouseMoveEvent(self, event):
+        self._set_hover(self.swatchAt(event.pos()))
+        QtWidgets.QWidget.mouseMoveEvent(self, event)
+
+    def leaveEvent(self, event):
+        self._set_hover(None)
+        QtWidgets.QWidget.leaveEvent(self, event)
+
+    def mousePressEvent(self, event):
+        index = self.swatchAt(event.pos())
+        if event.button() != QtCore.Qt.LeftButton or index is None:
+            QtWidgets.QWidget.mousePressEvent(self, event)
+            return
+        self._pressed = index
+        self._update_swatch(index)
+        # Same as the buttons this replaces the color applies on press
+        self.swatchPressed.emit(self.swatch(index)[0])
+
+    def mouseReleaseEvent(self, event):
+        self._update_swatch(self._pressed)
+        self._pressed = None
+        QtWidgets.QWidget.mouseReleaseEvent(self, event)
+
+    def event(self, event):
+        if event.type() == QtCore.QEvent.ToolTip:
+            index = self.swatchAt(event.pos())
+            if index is None:
+                QtWidgets.QToolTip.hideText()
+                event.ignore()
+            else:
+                QtWidgets.QToolTip.showText(event.globalPos(),
+                                            self.swatch(index)[1],
+                                            self,
+                                            self.swatchRect(*index))
+            return True
+        return QtWidgets.QWidget.event(self, event)
@@ -0,0 +1,57 @@
+"""Paint 500 FlatToolButtons with and without the icon atlas
+
+Prints the average time to paint all the buttons and quits.
+"""
+import timeit
+
+from PySide2 import QtCore, QtWidgets
+from dotbloxlib import icon
+from dotbloxlib.qt import standaloneqt
+from dotbloxlib.qt.flattoolbutton import FlatToolButton
+
+COUNT = 500
+REPEAT = 20
+
+
+def make_shelf(atlas):
+    shelf = QtWidgets.QWidget()
+    layout = QtWidgets.QGridLayout()
+    layout.setSpacing(0)
+    layout.setContentsMargins(0, 0, 0, 0)
+    names = icon.names()
+    for i in range(COUNT):
+        btn = FlatToolButton(icon=names[i % len(names)], atlas=atlas)
+        layout.addWidget(btn, i // 25, i % 25)
+    shelf.setLayout(layout)
+    return shelf
+
+
+def measure(app, shelves):
+    for name, shelf in shelves:
+        for other_name, other in shelves:
+            other.setVisible(other is shelf)
+        app.processEvents()
+
+        # The first paint builds the caches
+        shelf.repaint()
+        start = timeit.default_timer()
+        for _ in range(REPEAT):
+            shelf.repaint()
+        seconds = (timeit.default_timer() - start) / REPEAT
+        print("{0}: {1} buttons painted in {2:.2f}ms".format(name, COUNT, seconds * 1000))
+    app.quit()
+
+
+def test(app, win, layout):
+    win.setWindowTitle("Icon Atlas Benchmark")
+    win.resize(25 * 40, 20 * 40)
+
+    shelves = [("icon", make_shelf(False)), ("atlas", make_shelf(True))]
+    for name, shelf in shelves:
+        layout.addWidget(shelf)
+
+    QtCore.QTimer.singleShot(0, lambda: measure(app, shelves))
+
+
+if __name__ == '__main__':
+    standaloneqt.run_as_window(test)
@@ -2,6 +2,10 @@ from PySide2 import QtCore, QtWidgets
 from dotbloxlib.qt import framewidget, standaloneqt
 
 
+def test_collapse(collapsed):
+    print("Collapsed: {0}".format(collapsed))
+
+
 def test(app, win, layout):
     win.setWindowTitle("FrameWidget Test")
     layout.setContentsMargins(0, 0, 0, 0)
@@ -24,8 +28,15 @@ def test(app, win, layout):
 
     layout.addWidget(frame)
 
+    frame = framewidget.LazyFrameWidget("lazyFrameWidget collapsed", collapsible=True)
+    frame.setCollapsed(True)
+    frame.addWidget(lambda: QtWidgets.QPushButton("Built on expand"))
+    frame.onCollapse.connect(test_collapse)
+    layout.addWidget(frame)
+
     item = QtWidgets.QSpacerItem(0, 0, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
     layout.addSpacerItem(item)
 
 
-standaloneqt.run_as_window(test)
+if __name__ == '__main__':
+    standaloneqt.run_as_window(test)
@@ -0,0 +1,27 @@
+from dotbloxlib.qt import standaloneqt
+from dotbloxlib.qt.swatchgrid import SwatchGrid
+from dotbloxlib.color import mdc
+
+
+def test_action(hex_value):
+    print("Pressed " + hex_value)
+
+
+def test(app, win, layout):
+    win.setWindowTitle("SwatchGrid Test")
+    win.resize(400, 64)
+    layout.setContentsMargins(0, 0, 0, 0)
+
+    columns = []
+    for color in mdc.get_colors():
+        columns.append([(mdc.get_color(color, weight), "{0} {1}".format(color, weight))
+                        for weight in sorted(mdc.get_weights(color))])
+
+    grid = SwatchGrid()
+    grid.setSwatches(columns)
+    grid.swatchPressed.connect(test_action)
+    layout.addWidget(grid)
+
+
+if __name__ == '__main__':
+    standaloneqt.run_as_window(test)
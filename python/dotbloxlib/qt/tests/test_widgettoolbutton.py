@@ -28,4 +28,5 @@ def test(app, win, layout):
     layout.addWidget(btn)
 
 
-standaloneqt.run_as_window(test)
+if __name__ == '__main__':
+    standaloneqt.run_as_window(test)
@@ -0,0 +1,92 @@
+"""Shared colors and stylesheets for colored widgets
+
+Color variants are computed once per process and the widgets are styled
+through a single stylesheet on their parent matching a dynamic property,
+instead of a stylesheet per widget which Qt has to polish independently.
+
+Usage:
+    parent.setStyleSheet(color_stylesheet({"+X": "#c83539"}))
+    btn = QtWidgets.QPushButton("+X", parent)
+    set_color(btn, "+X")
+"""
+from PySide2 import QtCore, QtGui
+
+__author__ = "Ryan Robinson"
+
+COLOR_PROPERTY = "dotbloxColor"
+
+# (hex value, factor, lighter): hex value
+_VARIANTS = {}
+
+# (colors, widget type, extra, states): stylesheet
+_STYLESHEETS = {}
+
+
+def lighter(hex_value, factor=110):
+    """Cached `QColor.lighter` of the hex value"""
+    return _variant(hex_value, factor, True)
+
+
+def darker(hex_value, factor=125):
+    """Cached `QColor.darker` of the hex value"""
+    return _variant(hex_value, factor, False)
+
+
+def _variant(hex_value, factor, is_lighter):
+    key = (hex_value, factor, is_lighter)
+    variant = _VARIANTS.get(key)
+    if variant is None:
+        color = QtGui.QColor(hex_value)
+        color = color.lighter(factor) if is_lighter else color.darker(factor)
+        variant = _VARIANTS[key] = color.name()
+    return variant
+
+
+def color_stylesheet(colors, widget_type="QPushButton", extra="", states=False):
+    """Stylesheet coloring the widgets by their color property
+
+    Args:
+        colors (dict): property value: hex value
+        widget_type (str): widget class the rules apply to
+        extra (str): declarations added to every color
+        states (bool): add lighter hover and darker pressed colors
+
+    Returns:
+        str: the stylesheet to set on the parent of the widgets
+    """
+    key = (tuple(sorted(colors.items())), widget_type, extra, states)
+    stylesheet = _STYLESHEETS.get(key)
+    if stylesheet is not None:
+        return stylesheet
+
+    rules = []
+    for name, hex_value in sorted(colors.items()):
+        selector = '{widget_type}[{prop}="{name}"]'.format(
+                widget_type=widget_type,
+                prop=COLOR_PROPERTY,
+                name=name)
+        rules.append("{selector}{{background-color:{color};{extra}}}".format(
+                selector=selector, color=hex_value, extra=extra))
+        if states:
+            rules.append("{selector}:hover{{background-color:{color};}}".format(
+                    selector=selector, color=lighter(hex_value)))
+            rules.append("{selector}:pressed{{background-color:{color};}}".format(
+                    selector=selector, color=darker(hex_value)))
+
+    stylesheet = _STYLESHEETS[key] = "\n".join(rules)
+    return stylesheet
+
+
+def set_color(widget, name):
+    """Set the color property matched by :func:`color_stylesheet`
+
+    Args:
+        widget (QtWidgets.QWidget):
+        name (str): key of the color
+    """
+    widget.setProperty(COLOR_PROPERTY, name)
+    # Only a widget that was already styled has to be polished again
+    if widget.testAttribute(QtCore.Qt.WA_WState_Polished):
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
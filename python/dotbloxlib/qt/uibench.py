@@ -0,0 +1,184 @@
+"""Benchmarks of the dotblox widgets without a display
+
+The widgets are built at different scales on the offscreen Qt platform
+and the construction, layout, show and paint of each is timed as its own
+case, so no window is shown and no event loop is entered. The results and
+budgets work like `dotbloxlib.benchmark`.
+
+Usage:
+    python -m dotbloxlib.qt.uibench
+    python -m dotbloxlib.qt.uibench -k "FrameWidget.*" -b ui_budgets.json
+
+    # From python, for example in a CI job
+    results = SUITE.run("SwatchGrid.*")
+"""
+import itertools
+import sys
+
+from PySide2 import QtWidgets
+
+from dotbloxlib import benchmark, icon
+from dotbloxlib.color import mdc
+from dotbloxlib.qt import standaloneqt
+from dotbloxlib.qt.flattoolbutton import FlatToolButton
+from dotbloxlib.qt.framewidget import FrameScrollArea, FrameWidget, LazyFrameWidget
+from dotbloxlib.qt.swatchgrid import SwatchGrid
+from dotbloxlib.qt.widgettoolbutton import WidgetToolButton
+
+__author__ = "Ryan Robinson"
+
+SCALES = (10, 100, 1000)
+PHASES = ("construct", "layout", "show", "paint")
+
+SUITE = benchmark.Suite()
+
+
+def _buttons(layout, count, make):
+    """Add `count` widgets made by `make` to the layout, 10 per row"""
+    row = None
+    for i in range(count):
+        if i % 10 == 0:
+            row = QtWidgets.QHBoxLayout()
+            layout.addLayout(row)
+        row.addWidget(make(i))
+
+
+def build_frames(app, win, layout, count):
+    """`count` frames holding a button each"""
+    for i in range(count):
+        frame = FrameWidget("Frame {0}".format(i), collapsible=True)
+        frame.addWidget(QtWidgets.QPushButton("Button {0}".format(i)))
+        layout.addWidget(frame)
+
+
+def build_flat_tool_buttons(app, win, layout, count):
+    """`count` FlatToolButtons sharing the dotblox icons"""
+    names = icon.names()
+    _buttons(layout, count, lambda i: FlatToolButton(icon=names[i % len(names)]))
+
+
+def build_widget_tool_buttons(app, win, layout, count):
+    """`count` WidgetToolButtons with a small popup widget each"""
+    names = icon.names()
+
+    def make(i):
+        popup = QtWidgets.QWidget()
+        popup_layout = QtWidgets.QVBoxLayout()
+        for j in range(3):
+            popup_layout.addWidget(QtWidgets.QPushButton("Option {0}".format(j)))
+        popup.setLayout(popup_layout)
+        return WidgetToolButton(popup, icon=names[i % len(names)])
+    _buttons(layout, count, make)
+
+
+def build_swatch_grids(app, win, layout, count):
+    """`count` swatches of the material design palette over grids of 100"""
+    entries = itertools.cycle(mdc.get_index().entries)
+    while count > 0:
+        swatches = [(mdc.get_color(color, weight), "{0} {1}".format(color, weight))
+                    for color, weight in itertools.islice(entries, min(count, 100))]
+        grid = SwatchGrid()
+        grid.setSwatches([swatches[i:i + 10] for i in range(0, len(swatches), 10)])
+        layout.addWidget(grid)
+        count -= 100
+
+
+def _tool_widget():
+    """A widget like the dotblox tools, 20 buttons in a grid"""
+    widget = QtWidgets.QWidget()
+    grid = QtWidgets.QGridLayout()
+    for i in range(20):
+        grid.addWidget(QtWidgets.QPushButton("Option {0}".format(i)), i // 4, i % 4)
+    widget.setLayout(grid)
+    return widget
+
+
+def build_frame_panel(app, win, layout, mode):
+    """100 tool frames in a scroll area, every third one collapsed
+
+    eager builds every FrameWidget and its tool, lazy only builds the
+    LazyFrameWidgets in view of a FrameScrollArea.
+    """
+    win.resize(320, 600)
+    if mode == "eager":
+        area = QtWidgets.QScrollArea()
+        area.setWidgetResizable(True)
+        panel = QtWidgets.QWidget()
+        panel_layout = QtWidgets.QVBoxLayout()
+        panel.setLayout(panel_layout)
+        area.setWidget(panel)
+    else:
+        area = FrameScrollArea()
+
+    for i in range(100):
+        if mode == "eager":
+            frame = FrameWidget("Tool {0}".format(i), collapsible=True)
+            frame.addWidget(_tool_widget())
+            panel_layout.addWidget(frame)
+        else:
+            frame = LazyFrameWidget("Tool {0}".format(i), collapsible=True)
+            frame.addWidget(_tool_widget)
+            area.addFrame(frame)
+        frame.setCollapsed(i % 3 == 0)
+    layout.addWidget(area)
+
+
+def phase_cases(name, build, params=SCALES):
+    """Register a case per phase of building the window with `build`
+
+    Each case does the phases before its own in the setup so only its
+    phase is timed.
+
+    Args:
+        name (str): name prefix of the cases
+        build (func): takes the app, window, layout and param
+        params (list): params passed to build
+    """
+    for phase in PHASES:
+        SUITE.case("{0}.{1}".format(name, phase), params=params)(_phase_case(build, phase))
+
+
+def _phase_case(build, phase):
+    def case(param):
+        app = standaloneqt.get_app(offscreen=True)
+        window = []
+
+        def construct():
+            window.append(standaloneqt.make_window(
+                    app, lambda app, win, layout: build(app, win, layout, param)))
+
+        def layout():
+            window[0].layout().activate()
+            window[0].adjustSize()
+
+        def show():
+            window[0].show()
+            # Polish and show the children without painting them
+            app.sendPostedEvents()
+
+        def paint():
+            window[0].grab()
+
+        steps = [construct, layout, show, paint]
+        timed = steps[PHASES.index(phase)]
+        for step in steps[:PHASES.index(phase)]:
+            step()
+
+        def cleanup():
+            if window:
+                window[0].close()
+                window[0].deleteLater()
+            app.processEvents()
+        return timed, cleanup
+    return case
+
+
+phase_cases("FrameWidget", build_frames)
+phase_cases("FlatToolButton", build_flat_tool_buttons)
+phase_cases("WidgetToolButton", build_widget_tool_buttons)
+phase_cases("SwatchGrid", build_swatch_grids)
+phase_cases("FramePanel", build_frame_panel, params=["eager", "lazy"])
+
+
+if __name__ == "__main__":
+    sys.exit(benchmark.main(SUITE))
@@ -9,31 +9,70 @@ class WidgetToolButton(FlatToolButton):
     """QToolButton overrides to place the given widget as the
     popup menu
 
+    The popup is created on the first press, building the widget then
+    when a function is given, and reused by every later press. Pressing
+    the button while the popup is torn off raises it instead.
+
     Notes:
         Do not alter the instance by means of the built-in
          QToolButton methods that handle the menu and button state
 
     Args:
-        widget (QtWidgets.QWidget): widget to be used for the popup
+        widget (QtWidgets.QWidget or func): widget to be used for the popup,
+            or a function taking no arguments returning it
         icon (str): path of icon to be set
     """
 
     def __init__(self, widget, icon=None):
         FlatToolButton.__init__(self, icon=icon, parent=None)
 
-        self.tool_popup = _WidgetToolButtonPopup(widget, self)
-        self.tool_popup.aboutToHide.connect(self._on_popup_state_change)
-        self.tool_popup.aboutToTear.connect(self._on_popup_state_change)
-        self.tool_popup.hide()
+        self._popup = None
+        self._widget_factory = widget
+
+    @property
+    def tool_popup(self):
+        """The popup, created when first used
+
+        Returns:
+            _WidgetToolButtonPopup:
+        """
+        if self._popup is None:
+            widget = self._widget_factory
+            if widget is not None and not isinstance(widget, QtWidgets.QWidget):
+                widget = widget()
+            self._widget_factory = None
+
+            self._popup = _WidgetToolButtonPopup(widget, self)
+            self._popup.aboutToHide.connect(self._on_popup_state_change)
+            self._popup.aboutToTear.connect(self._on_popup_state_change)
+            self._popup.hide()
+        return self._popup
 
     def setWidget(self, widget=None):
         """Set the current widget of the popup"""
-        self.tool_popup.setWidget(widget)
+        if self._popup is None:
+            self._widget_factory = widget
+        else:
+            self._popup.setWidget(widget)
 
     def widget(self):
         """Get the current widget of the popup"""
         return self.tool_popup.widget()
 
+    def isPopupCreated(self):
+        """Get whether the popup was created, see `tool_popup`"""
+        return self._popup is not None
+
+    def showPopup(self):
+        """Show the popup under the button, or raise it when torn off"""
+        popup = self.tool_popup
+        if popup.is_floating and popup.isVisible():
+            popup.raise_()
+            popup.activateWindow()
+            return
+        popup.show()
+        popup.move(self._get_menu_pos())
+
     def mousePressEvent(self, event):
         """Override to show widget popup
 
@@ -41,8 +80,7 @@ class WidgetToolButton(FlatToolButton):
             event(QtGui.QMouseEvent):
         """
         if not self.isDown():
-            self.tool_popup.show()
-            self.tool_popup.move(self._get_menu_pos())
+            self.showPopup()
 
         FlatToolButton.mousePressEvent(self, event)
 
@@ -58,7 +96,7 @@ class WidgetToolButton(FlatToolButton):
         horizontal = True
 
         rect = self.rect()
-        desktop = QtWidgets.QDesktopWidget()
+        desktop = QtWidgets.QApplication.desktop()
         screen = desktop.availableGeometry(self.mapToGlobal(rect.center()))
         sh = self.tool_popup.sizeHint()
         if horizontal:
@@ -114,6 +152,10 @@ class _WidgetToolButtonPopup(QtWidgets.QWidget):
         QtWidgets.QWidget.__init__(self, parent=parent)
         self.is_floating = False
         self._widget = None
+        # Window flags last set by `show`
+        self._flags = None
+        # Cached until the contents change
+        self._size_hint = None
 
         self._init_ui()
         self.setWidget(widget)
@@ -128,13 +170,27 @@ class _WidgetToolButtonPopup(QtWidgets.QWidget):
 
     def setWidget(self, widget=None):
         """Set the current widget"""
+        if self._widget is not None and self._widget is not widget:
+            self.layout().removeWidget(self._widget)
+            self._widget.hide()
+
         if widget is not None:
             self.layout().addWidget(widget)
             self.setWindowTitle(widget.windowTitle())
-
-        if self._widget:
-            self.layout().remove(self._widget)
         self._widget = widget
+        self._size_hint = None
+
+    def sizeHint(self):
+        """Cached size hint, recomputed when the contents change"""
+        if self._size_hint is None:
+            self._size_hint = QtWidgets.QWidget.sizeHint(self)
+        return self._size_hint
+
+    def event(self, event):
+        """Override to forget the size hint when the contents change"""
+        if event.type() == QtCore.QEvent.LayoutRequest:
+            self._size_hint = None
+        return QtWidgets.QWidget.event(self, event)
 
     def widget(self):
         """Get the current widget
@@ -187,8 +243,14 @@ class _WidgetToolButtonPopup(QtWidgets.QWidget):
         self.hide()
         self.is_floating = floating
         flags = QtCore.Qt.Window | QtCore.Qt.Tool if floating else QtCore.Qt.Popup
-        self._tear_off_btn.setVisible(not self.is_floating)
-        self.setWindowFlags(flags)
+        if self._tear_off_btn.isHidden() != self.is_floating:
+            self._tear_off_btn.setVisible(not self.is_floating)
+            self._size_hint = None
+        # Changing the flags recreates the native window, only do it
+        # when switching between popup and torn off
+        if flags != self._flags:
+            self.setWindowFlags(flags)
+            self._flags = flags
         QtWidgets.QWidget.show(self)
 
 
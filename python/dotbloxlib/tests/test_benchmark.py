@@ -0,0 +1,50 @@
+from dotbloxlib import benchmark
+
+
+def _make_suite():
+    suite = benchmark.Suite()
+
+    @suite.case("ok", params=[1])
+    def ok(param):
+        return lambda: None
+
+    @suite.case("skip_setup", params=[1])
+    def skip_setup(param):
+        raise benchmark.SkipCase("no data")
+
+    @suite.case("skip_timed", params=[1])
+    def skip_timed(param):
+        def run():
+            raise benchmark.SkipCase("too slow")
+        return run
+
+    cleaned = []
+
+    @suite.case("error", params=[1])
+    def error(param):
+        def run():
+            raise ValueError("boom")
+        return run, lambda: cleaned.append(param)
+
+    return suite, cleaned
+
+
+def test_errors_do_not_abort_the_suite():
+    suite, cleaned = _make_suite()
+    results = dict((result.name, result) for result in suite.run())
+    assert sorted(results) == ["error", "ok", "skip_setup", "skip_timed"]
+    assert results["ok"].error is None and results["ok"].calls == 0
+    assert results["skip_setup"].skipped == "no data"
+    assert results["skip_timed"].skipped == "too slow"
+    assert "ValueError: boom" in results["error"].error
+    assert cleaned == [1]
+
+    failures = benchmark.check_budgets(list(results.values()), {})
+    assert failures == ["error[1]: failed"]
+    assert sorted(benchmark.make_budgets(list(results.values()))) == ["ok[1]"]
+
+
+def test_main_exit_code():
+    suite, _ = _make_suite()
+    assert benchmark.main(suite, ["-k", "ok"]) == 0
+    assert benchmark.main(suite, ["-k", "error"]) == 1
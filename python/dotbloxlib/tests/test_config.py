@@ -0,0 +1,439 @@
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from dotbloxlib import config
+
+
+def _counting_writes(monkeypatch):
+    writes = []
+    atomic_write = config.atomic_write
+
+    def write(path, content):
+        writes.append(path)
+        atomic_write(path, content)
+    monkeypatch.setattr(config, "atomic_write", write)
+    return writes
+
+
+def test_save_skips_unchanged(monkeypatch):
+    directory = tempfile.mkdtemp()
+    try:
+        writes = _counting_writes(monkeypatch)
+        cfg = config.ConfigJSON(os.path.join(directory, "config.json"))
+        cfg.io.cache = {"key": 1}
+        assert cfg.io.save_to_disk()
+        assert not cfg.io.save_to_disk()
+        cfg.io.cache["key"] = 2
+        assert cfg.io.save_to_disk()
+        assert len(writes) == 2
+        assert not [name for name in os.listdir(directory) if name.endswith(".tmp")]
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_read_skips_unchanged():
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "config.json")
+        with open(path, "w") as f:
+            json.dump({"key": 1}, f)
+
+        cfg = config.ConfigJSON(path)
+        cfg.io.cache["key"] = "not from disk"
+        cfg.io.read_from_disk()
+        assert cfg.io.cache["key"] == "not from disk"
+
+        with open(path, "w") as f:
+            json.dump({"key": 22}, f)
+        cfg.io.read_from_disk()
+        assert cfg.io.cache["key"] == 22
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_delayed_writes_coalesce(monkeypatch):
+    directory = tempfile.mkdtemp()
+    try:
+        writes = _counting_writes(monkeypatch)
+        path = os.path.join(directory, "config.json")
+        cfg = config.ConfigJSON(path, delay=60)
+        cfg.start_sync()
+        for i in range(100):
+            with cfg.io.write() as data:
+                data["key"] = i
+        assert not writes
+        assert cfg.io.is_dirty()
+
+        config.flush_all()
+        assert len(writes) == 1
+        assert not cfg.io.is_dirty()
+        with open(path) as f:
+            assert json.load(f) == {"key": 99}
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_failed_save_keeps_writes(monkeypatch):
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "config.json")
+        cfg = config.ConfigJSON(path, delay=60)
+        cfg.start_sync()
+        atomic_write = config.atomic_write
+
+        def fail(path, content):
+            raise IOError("disk full")
+        monkeypatch.setattr(config, "atomic_write", fail)
+        with cfg.io.write() as data:
+            data["key"] = 1
+        assert not cfg.io.save_to_disk()
+        assert cfg.io.is_dirty()
+
+        monkeypatch.setattr(config, "atomic_write", atomic_write)
+        config.flush_all()
+        assert not cfg.io.is_dirty()
+        with open(path) as f:
+            assert json.load(f) == {"key": 1}
+    finally:
+        shutil.rmtree(directory)
+
+
+def _write_many(path, writer, count):
+    cfg = config.ConfigJSON(path, delay=0.001)
+    cfg.start_sync()
+    for i in range(count):
+        with cfg.io.write() as data:
+            data.clear()
+            data.update({"writer": writer, "index": i, "payload": [writer] * 200})
+    cfg.flush()
+
+
+def test_many_writers():
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "config.json")
+        count = 50
+        workers = [multiprocessing.Process(target=_write_many, args=(path, i, count))
+                   for i in range(4)]
+        workers.extend(threading.Thread(target=_write_many, args=(path, i, count))
+                       for i in range(4, 8))
+        for worker in workers:
+            worker.start()
+
+        # Readers must never see a partially written file
+        reads = 0
+        while any(worker.is_alive() for worker in workers):
+            if os.path.exists(path):
+                with open(path) as f:
+                    data = json.load(f)
+                assert data["payload"] == [data["writer"]] * 200
+                reads += 1
+            time.sleep(0.001)
+
+        for worker in workers:
+            worker.join()
+            if isinstance(worker, multiprocessing.Process):
+                assert worker.exitcode == 0
+
+        with open(path) as f:
+            assert json.load(f)["index"] == count - 1
+        assert not [name for name in os.listdir(directory) if name.endswith(".tmp")]
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_read_while_writing():
+    directory = tempfile.mkdtemp()
+    try:
+        cfg = config.ConfigJSON(os.path.join(directory, "config.json"))
+        entered = threading.Event()
+        done = threading.Event()
+
+        def write():
+            with cfg.io.write() as data:
+                entered.set()
+                done.wait(5)
+                data["key"] = 1
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        assert entered.wait(5)
+
+        # A read of another thread leaves the lock of the writer alone
+        with cfg.io as data:
+            pass
+        locked = []
+        checker = threading.Thread(target=lambda: locked.append(not cfg.io._lock.acquire(False)))
+        checker.start()
+        checker.join()
+        assert locked == [True]
+
+        done.set()
+        writer.join()
+        with cfg.io as data:
+            assert data["key"] == 1
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_merge():
+    base = {"a": 1, "b": 1, "c": 1, "d": 1}
+    ours = {"a": 2, "b": 1, "c": 3, "e": 1}
+    theirs = {"a": 1, "b": 2, "c": 4, "d": 1, "f": 1}
+    merged, conflicts = config.merge(base, ours, theirs)
+    assert merged == {"a": 2, "b": 2, "c": 3, "e": 1, "f": 1}
+    assert conflicts == ["c"]
+
+
+def test_shared_merges_and_notifies():
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "config.json")
+        first = config.ConfigJSON(path, shared=True)
+        first.io.cache.update({"a": 1, "b": 1, "c": {"value": 1}})
+        first.save()
+
+        second = config.ConfigJSON(path, shared=True)
+        changes = []
+        second.add_callback(changes.append)
+        unchanged = second.io.cache["c"]
+
+        first.io.cache["a"] = 2
+        first.save()
+        second.io.cache["b"] = 3
+        second.save()
+
+        with open(path) as f:
+            assert json.load(f) == {"a": 2, "b": 3, "c": {"value": 1}}
+        assert changes == [["a"]]
+        assert second.io.cache["c"] is unchanged
+
+        first.start_sync()
+        with first.io as data:
+            assert data["b"] == 3
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_shared_merges_new_file():
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "config.json")
+        first = config.ConfigJSON(path, shared=True)
+        second = config.ConfigJSON(path, shared=True)
+        first.io.cache["a"] = 1
+        second.io.cache["b"] = 2
+        first.save()
+        second.save()
+
+        with open(path) as f:
+            assert json.load(f) == {"a": 1, "b": 2}
+    finally:
+        shutil.rmtree(directory)
+
+
+def _write_keys(path, writer, count):
+    cfg = config.ConfigJSON(path, shared=True)
+    cfg.start_sync()
+    for i in range(count):
+        with cfg.io.write() as data:
+            data["writer%d" % writer] = i
+
+
+def test_shared_processes_keep_every_key():
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "config.json")
+        count = 30
+        workers = [multiprocessing.Process(target=_write_keys, args=(path, i, count))
+                   for i in range(6)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+            assert worker.exitcode == 0
+
+        with open(path) as f:
+            data = json.load(f)
+        assert data == dict(("writer%d" % i, count - 1) for i in range(6))
+    finally:
+        shutil.rmtree(directory)
+
+
+def _make_paths(directory, count):
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, "path%d" % i)
+        os.makedirs(path)
+        paths.append(path)
+    return paths
+
+
+def test_path_index_caches(monkeypatch):
+    directory = tempfile.mkdtemp()
+    try:
+        paths = _make_paths(directory, 5)
+        open(os.path.join(paths[1], "tool.json"), "w").close()
+        index = config.PathIndex(paths + [paths[1].replace("/", "\\")], interval=3600)
+        assert index.find_all("tool.json") == [paths[1].replace("\\", "/") + "/tool.json"]
+
+        stats = []
+        stat = os.stat
+        monkeypatch.setattr(os, "stat", lambda path: stats.append(path) or stat(path))
+        index.find_all("tool.json")
+        index.find_one("tool.json")
+        assert not stats
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_path_index_sees_new_configs():
+    directory = tempfile.mkdtemp()
+    try:
+        paths = _make_paths(directory, 3)
+        index = config.PathIndex(paths, interval=0)
+        assert index.find_one("tool.json") is None
+
+        open(os.path.join(paths[2], "tool.json"), "w").close()
+        assert index.find_all("tool.json") == [paths[2] + "/tool.json"]
+
+        os.remove(os.path.join(paths[2], "tool.json"))
+        open(os.path.join(paths[0], "tool.json"), "w").close()
+        assert index.find_all("tool.json") == [paths[0] + "/tool.json"]
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_path_index_sees_saved_configs():
+    directory = tempfile.mkdtemp()
+    try:
+        paths = _make_paths(directory, 3)
+        index = config.PathIndex(paths, interval=3600)
+        assert index.find_one("tool.json") is None
+
+        config.ConfigJSON(os.path.join(paths[1], "tool.json"), default={"a": 1}).save()
+        assert index.find_all("tool.json") == [paths[1] + "/tool.json"]
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_layered_config():
+    directory = tempfile.mkdtemp()
+    try:
+        user, show, studio = _make_paths(directory, 3)
+        layers = [
+            (studio, {"color": "red", "bevel": {"segments": 1, "offset": 0.5}, "studio": 1}),
+            (show, {"color": "blue", "bevel": {"segments": 2}}),
+            (user, {"bevel": {"segments": 3}}),
+        ]
+        for path, data in layers:
+            with open(os.path.join(path, "tool.json"), "w") as f:
+                json.dump(data, f)
+
+        settings = config.LayeredConfig("tool.json", index=config.PathIndex([user, show, studio]))
+        assert settings.get("color") == "blue"
+        assert settings["bevel"] == {"segments": 3, "offset": 0.5}
+        assert settings.get("missing", 1) == 1
+        assert settings.data() == {"color": "blue",
+                                   "bevel": {"segments": 3, "offset": 0.5},
+                                   "studio": 1}
+    finally:
+        shutil.rmtree(directory)
+
+
+def _preset_data(count):
+    return dict(("asset%d" % i, {"edges": list(range(i, i + 100)), "name": "asset%d" % i})
+                for i in range(count))
+
+
+def test_binary_config():
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "presets.bin")
+        cfg = config.ConfigBinary(path)
+        cfg.io.cache.update(_preset_data(20))
+        cfg.save()
+        assert config.ConfigBinary(path).io.cache == _preset_data(20)
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_binary_config_marshal(monkeypatch):
+    monkeypatch.setattr(config, "msgpack", None)
+    test_binary_config()
+
+
+def test_indexed_config_decodes_on_demand():
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "presets.idx")
+        cfg = config.ConfigIndexed(path)
+        cfg.io.cache.update(_preset_data(20))
+        cfg.save()
+
+        cfg = config.ConfigIndexed(path)
+        data = cfg.io.cache
+        assert len(data) == 20
+        assert not data.decoded()
+        assert data["asset3"]["edges"][0] == 3
+        assert list(data.decoded()) == ["asset3"]
+
+        data["asset3"]["name"] = "changed"
+        data["new"] = [1, 2]
+        del data["asset4"]
+        cfg.save()
+        # Saving copies the unused values without decoding them
+        assert sorted(data.decoded()) == ["asset3", "new"]
+
+        expected = _preset_data(20)
+        expected["asset3"]["name"] = "changed"
+        expected["new"] = [1, 2]
+        del expected["asset4"]
+        assert dict(config.ConfigIndexed(path).io.cache) == expected
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_indexed_config_shared_decodes_on_demand():
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "presets.idx")
+        cfg = config.ConfigIndexed(path)
+        cfg.io.cache.update(_preset_data(20))
+        cfg.save()
+
+        first = config.ConfigIndexed(path, shared=True)
+        second = config.ConfigIndexed(path, shared=True)
+        first.io.cache["asset1"] = 1
+        first.save()
+        second.io.cache["asset2"] = 2
+        second.save()
+        # Only the changed values are decoded to merge them
+        assert sorted(second.io.cache.decoded()) == ["asset1", "asset2"]
+
+        expected = _preset_data(20)
+        expected.update({"asset1": 1, "asset2": 2})
+        assert dict(config.ConfigIndexed(path).io.cache) == expected
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_indexed_config_detach():
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "presets.idx")
+        cfg = config.ConfigIndexed(path)
+        cfg.io.cache.update(_preset_data(5))
+        cfg.save()
+
+        data = config.ConfigIndexed(path).io.cache
+        data["asset0"]
+        data.detach()
+        assert dict(data) == _preset_data(5)
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,34 @@
+from dotbloxlib.color import distinct, mdc, oklab
+
+
+def test_farthest_point_order():
+    points = [[0.0, 0.0, 0.0], [0.1, 0.0, 0.0], [1.0, 0.0, 0.0], [0.5, 0.0, 0.0]]
+    assert distinct.farthest_point_order(points) == [0, 2, 3, 1]
+    assert distinct.farthest_point_order(points, count=2, start=2) == [2, 0]
+    assert distinct.farthest_point_order([]) == []
+
+
+def test_distinct_colors_are_unique():
+    colors = distinct.distinct_colors(20)
+    assert len(set(colors)) == 20
+    hex_values = [mdc.get_color(color, weight) for color, weight in colors]
+    assert len(set(hex_values)) == 20
+
+
+def test_distinct_colors_weights():
+    colors = distinct.distinct_colors(5, weights=[mdc.Weight500])
+    assert all(weight == mdc.Weight500 for _, weight in colors)
+
+
+def test_distinct_colors_repeat():
+    order = distinct.palette_order([mdc.Weight500])
+    colors = distinct.distinct_colors(len(order) + 2, weights=[mdc.Weight500])
+    assert colors[len(order):] == order[:2]
+
+
+def test_farthest_point_order_without_numpy(monkeypatch):
+    points = [list(point) for point in mdc.get_index().lab]
+    expected = distinct.farthest_point_order(points, count=40, start=3)
+    monkeypatch.setattr(oklab, "numpy", None)
+    assert distinct.farthest_point_order(points, count=40, start=3) == expected
+    assert len(set(expected)) == 40
@@ -0,0 +1,128 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+import pytest
+
+from dotbloxlib import config, filewatch
+
+WATCHERS = [filewatch.PollingWatcher]
+if filewatch._LIBC is not None:
+    WATCHERS.append(filewatch.InotifyWatcher)
+
+
+def _changes():
+    changed = []
+    event = threading.Event()
+
+    def callback(path):
+        changed.append(path)
+        event.set()
+    return changed, event, callback
+
+
+@pytest.mark.parametrize("watcher_class", WATCHERS)
+def test_watcher_reports_changes(watcher_class):
+    directory = tempfile.mkdtemp()
+    watcher = watcher_class(interval=0.01)
+    try:
+        path = os.path.join(directory, "sub", "config.json")
+        changed, event, callback = _changes()
+        watcher.watch(path, callback)
+        watcher.watch(os.path.join(directory, "other.json"), lambda path: None)
+
+        # The folder does not exist yet
+        config.atomic_write(path, b"1")
+        assert event.wait(5)
+        assert changed == [path]
+
+        event.clear()
+        with open(path, "w") as f:
+            f.write("22")
+        assert event.wait(5)
+
+        event.clear()
+        os.remove(path)
+        assert event.wait(5)
+        assert set(changed) == {path}
+    finally:
+        watcher.stop()
+        shutil.rmtree(directory)
+    assert not watcher.is_alive()
+
+
+@pytest.mark.parametrize("watcher_class", WATCHERS)
+def test_watcher_missing_folder_added_later(watcher_class):
+    directory = tempfile.mkdtemp()
+    watcher = watcher_class(interval=0.01)
+    try:
+        os.makedirs(os.path.join(directory, "watched"))
+        watcher.watch(os.path.join(directory, "watched", "a.json"), lambda path: None)
+        # Let the thread wait on the watched folder
+        threading.Event().wait(0.1)
+
+        # No event of a watched folder tells the folder was created
+        path = os.path.join(directory, "missing", "b.json")
+        changed, event, callback = _changes()
+        watcher.watch(path, callback)
+        config.atomic_write(path, b"1")
+        assert event.wait(5)
+        assert changed == [path]
+    finally:
+        watcher.stop()
+        shutil.rmtree(directory)
+
+
+@pytest.mark.parametrize("watcher_class", WATCHERS)
+def test_watcher_stop(watcher_class):
+    watcher = watcher_class(interval=60)
+    watcher.watch(os.path.join(tempfile.gettempdir(), "dotblox_missing.json"), lambda path: None)
+    assert watcher.is_alive()
+    watcher.stop(timeout=5)
+    assert not watcher.is_alive()
+
+
+def test_config_watch(monkeypatch):
+    directory = tempfile.mkdtemp()
+    watcher = filewatch.create_watcher(interval=0.01)
+    try:
+        path = os.path.join(directory, "config.json")
+        cfg = config.ConfigJSON(path)
+        cfg.io.cache["key"] = 1
+        cfg.save()
+
+        changed, event, callback = _changes()
+        cfg.start_sync()
+        cfg.io.start_watch(callback=lambda io: callback(io.file_path), watcher=watcher)
+        with cfg.io.write() as data:
+            data["key"] = 2
+
+        # Reads do not touch the file until it changes
+        stats = []
+        stat = os.stat
+        reader = threading.current_thread()
+
+        def counting_stat(stat_path, *args, **kwargs):
+            if stat_path == path and threading.current_thread() is reader:
+                stats.append(stat_path)
+            return stat(stat_path, *args, **kwargs)
+        monkeypatch.setattr(os, "stat", counting_stat)
+        for _ in range(10):
+            with cfg.io as data:
+                assert data["key"] == 2
+        assert not stats
+        monkeypatch.undo()
+
+        config.atomic_write(path, json.dumps({"key": 3}).encode("utf-8"))
+        assert event.wait(5)
+        assert changed == [path]
+        with cfg.io as data:
+            assert data["key"] == 3
+
+        cfg.pause_sync()
+        assert not cfg.io.is_watched()
+    finally:
+        watcher.stop()
+        shutil.rmtree(directory)
@@ -0,0 +1,31 @@
+import os
+
+from dotbloxlib import icon
+
+
+def test_get_icon_uses_the_index(monkeypatch):
+    icon.build_index()
+    path = icon.get_icon("dblx_poly")
+    assert path == os.path.join(icon.ICON_DIRECTORY, "dblx_polyCube.png")
+    assert icon.get_icon("dblx_missing") is None
+
+    # Hits and misses never look at the disk again
+    monkeypatch.setattr(os, "listdir", lambda path: 1 / 0)
+    monkeypatch.setattr(icon, "_INDEX", [])
+    assert icon.get_icon("dblx_poly") == path
+    assert icon.get_icon("dblx_missing") is None
+
+
+def test_build_index_sees_new_icons(monkeypatch):
+    names = ["dblx_a.png", "notes.txt"]
+    monkeypatch.setattr(os, "listdir", lambda path: list(names))
+    monkeypatch.setattr(icon, "_read_manifest", lambda: None)
+    icon.build_index()
+    assert icon.get_icon("dblx_b") is None
+
+    names.append("dblx_b.png")
+    icon.build_index()
+    assert icon.get_icon("dblx_b") == os.path.join(icon.ICON_DIRECTORY, "dblx_b.png")
+    assert icon.get_icon("notes") is None
+    monkeypatch.undo()
+    icon.build_index()
@@ -0,0 +1,30 @@
+import random
+
+from dotbloxlib import intervals
+
+
+def test_indices_round_trip():
+    assert intervals.from_indices([7, 0, 2, 1, 1]) == [0, 2, 7, 7]
+    assert intervals.to_indices([0, 2, 7, 7]) == [0, 1, 2, 7]
+    assert intervals.from_indices([]) == []
+    assert intervals.count([0, 2, 7, 7]) == 4
+    assert intervals.contains([0, 2, 7, 7], 7)
+    assert not intervals.contains([0, 2, 7, 7], 5)
+
+
+def test_components():
+    edges = intervals.from_components(["e[3:6]", "|grid|gridShape.e[9]", "e[7]", "e[*]"])
+    assert edges == [3, 7, 9, 9]
+    assert intervals.to_components(edges) == ["e[3:7]", "e[9]"]
+    assert intervals.to_components(edges, node="grid") == ["grid.e[3:7]", "grid.e[9]"]
+
+
+def test_union_and_difference():
+    rng = random.Random(1)
+    for _ in range(200):
+        first = set(rng.sample(range(60), rng.randint(0, 40)))
+        second = set(rng.sample(range(60), rng.randint(0, 40)))
+        a = intervals.from_indices(first)
+        b = intervals.from_indices(second)
+        assert intervals.to_indices(intervals.union(a, b)) == sorted(first | second)
+        assert intervals.to_indices(intervals.difference(a, b)) == sorted(first - second)
@@ -0,0 +1,60 @@
+import random
+
+from dotbloxlib.color import color_hex_to_rgbf, mdc, oklab, transfer
+
+
+def test_sorted_weights():
+    weights = mdc.get_sorted_weights(mdc.Blue)
+    assert weights[0] == mdc.Weight50
+    assert weights[-1] == mdc.WeightA700
+    assert set(weights) == set(mdc.get_weights(mdc.Blue))
+    assert mdc.WeightA100 not in mdc.get_sorted_weights(mdc.Brown)
+
+
+def test_find_color():
+    assert mdc.find_color(mdc.get_color(mdc.Blue, mdc.WeightA200)) == (mdc.Blue, mdc.WeightA200)
+    assert mdc.find_color(mdc.get_color(mdc.Blue).upper()) == (mdc.Blue, mdc.Weight500)
+    assert mdc.find_color("#123456") is None
+
+
+def test_index_is_packed():
+    index = mdc.get_index()
+    assert len(index.rgb) == 3 * len(index.entries)
+    assert len(index.hex_values) == len(index.entries)
+    assert list(index.rgb[:3]) == [int(index.hex_values[0][i: i + 2], 16) for i in (1, 3, 5)]
+
+
+def test_nearest_color():
+    blue = color_hex_to_rgbf(mdc.get_color(mdc.Blue))
+    assert mdc.nearest_color(blue) == (mdc.Blue, mdc.Weight500)
+    nudged = [min(channel + 0.01, 1.0) for channel in blue]
+    assert mdc.nearest_color(nudged) == (mdc.Blue, mdc.Weight500)
+
+
+def test_nearest_colors_matches_palette():
+    index = mdc.get_index()
+    colors = [color_hex_to_rgbf(hex_value) for hex_value in index.hex_values]
+    for entry, hex_value in zip(mdc.nearest_colors(colors), index.hex_values):
+        assert mdc.get_color(*entry).lower() == hex_value
+
+
+def _brute_nearest(index, color):
+    lab = oklab.from_srgb(color)
+    distances = [oklab.distance_sq(lab, oklab.from_srgb(rgbf)) for rgbf in index.rgbf]
+    return index.entries[distances.index(min(distances))]
+
+
+def test_nearest_colors_without_numpy(monkeypatch):
+    rng = random.Random(3)
+    colors = [[rng.randint(0, 255) / 255.0 for _ in range(3)] for _ in range(50)]
+    colors += colors[:10]
+    expected = [_brute_nearest(mdc.get_index(), color) for color in colors]
+
+    assert mdc.nearest_colors(colors) == expected
+    monkeypatch.setattr(oklab, "numpy", None)
+    monkeypatch.setattr(transfer, "numpy", None)
+    index = mdc.PaletteIndex()
+    assert index.nearest(colors) == expected
+    # Looked up again from the cache
+    assert index.nearest(colors[::-1]) == expected[::-1]
+    assert len(index._nearest) == 50
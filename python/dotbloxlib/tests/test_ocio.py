@@ -0,0 +1,88 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from dotbloxlib.color import ocio, transfer
+
+SAMPLE_CONFIG = os.path.join(os.path.dirname(__file__), "data", "sample_config.ocio")
+
+
+def srgb_to_linear(rgbf):
+    """Stands in for PyOpenColorIO with the transform of the sample config"""
+    return transfer.srgb_to_linear_rgb(rgbf)
+
+
+def _close(a, b, tolerance=1e-3):
+    return all(abs(i - j) < tolerance for i, j in zip(a, b))
+
+
+def test_bake_and_load_without_ocio():
+    directory = tempfile.mkdtemp()
+    try:
+        if ocio.PyOpenColorIO is None:
+            assert ocio.get_lut(SAMPLE_CONFIG, "sRGB", "linear", directory=directory) is None
+
+        ocio.bake(SAMPLE_CONFIG, "sRGB", "linear", apply=srgb_to_linear, directory=directory)
+        path = ocio.lut_path(SAMPLE_CONFIG, "sRGB", "linear", directory=directory)
+        assert os.path.isfile(path)
+
+        lut = ocio.get_lut(SAMPLE_CONFIG, "sRGB", "linear", directory=directory)
+        for color in ([0.0, 0.0, 0.0], [1.0, 0.5, 0.0], [0.2, 0.4, 0.6]):
+            assert _close(lut.apply(color), srgb_to_linear(color))
+        colors = [[0.1, 0.2, 0.3], [0.9, 0.8, 0.7]]
+        for result, color in zip(lut.apply_many(colors), colors):
+            assert _close(result, srgb_to_linear(color))
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_1d_lut():
+    directory = tempfile.mkdtemp()
+    try:
+        ocio.bake(SAMPLE_CONFIG, "sRGB", "linear", dimension=1, size=1024,
+                  apply=srgb_to_linear, directory=directory)
+        lut = ocio.get_lut(SAMPLE_CONFIG, "sRGB", "linear", dimension=1, directory=directory)
+        assert lut.dimension == 1
+        assert _close(lut.apply([0.5, 0.25, 1.0]), srgb_to_linear([0.5, 0.25, 1.0]), 1e-4)
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_config_change_invalidates_lut():
+    directory = tempfile.mkdtemp()
+    try:
+        config = os.path.join(directory, "config.ocio")
+        shutil.copy(SAMPLE_CONFIG, config)
+        before = ocio.lut_path(config, "sRGB", "linear", directory=directory)
+        with open(config, "a") as f:
+            f.write("\n# changed\n")
+        assert ocio.lut_path(config, "sRGB", "linear", directory=directory) != before
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_bake_in_background():
+    directory = tempfile.mkdtemp()
+    try:
+        baked = []
+        thread = ocio.bake_in_background(SAMPLE_CONFIG, "sRGB", "linear", size=9,
+                                         apply=srgb_to_linear, directory=directory,
+                                         callback=lambda: baked.append(True))
+        thread.join()
+        assert baked
+        assert not ocio.is_baking(SAMPLE_CONFIG, "sRGB", "linear", directory=directory)
+        assert ocio.get_lut(SAMPLE_CONFIG, "sRGB", "linear", directory=directory).size == 9
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_ocio_matches_baked_lut():
+    pytest.importorskip("PyOpenColorIO")
+    directory = tempfile.mkdtemp()
+    try:
+        lut = ocio.bake(SAMPLE_CONFIG, "sRGB", "linear", directory=directory)
+        assert _close(lut.apply([1.0, 0.5, 0.0]), srgb_to_linear([1.0, 0.5, 0.0]))
+    finally:
+        shutil.rmtree(directory)
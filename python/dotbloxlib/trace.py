@@ -0,0 +1,75 @@
+"""Record events in the Chrome trace format
+
+The written file can be opened with chrome://tracing, perfetto or
+speedscope.
+
+Usage:
+    recorder = TraceRecorder("/tmp/trace.json")
+    start = recorder.now()
+    do_work()
+    recorder.add_event("do_work", start, recorder.now() - start, args={"items": 3})
+    recorder.flush()
+"""
+import collections
+import json
+import os
+import threading
+import timeit
+
+from dotbloxlib.config import atomic_write
+
+
+class TraceRecorder(object):
+    def __init__(self, path, max_events=10000):
+        """Keeps the last `max_events` events and writes them to `path`
+
+        Args:
+            path (str): file path of the trace
+            max_events (int): number of events to keep before the oldest
+                              are dropped
+        """
+        self.path = path
+        self.events = collections.deque(maxlen=max_events)
+        self.pid = os.getpid()
+        self._start = timeit.default_timer()
+        self._lock = threading.Lock()
+
+    def now(self):
+        """Current time in microseconds since the recorder was created"""
+        return (timeit.default_timer() - self._start) * 1000000.0
+
+    def add_event(self, name, start, duration, args=None, category="dotblox"):
+        """Add a complete event
+
+        Args:
+            name (str): name displayed for the event
+            start (float): microseconds from :meth:`now`
+            duration (float): microseconds
+            args (dict): extra data displayed with the event
+            category (str): category of the event
+        """
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start,
+            "dur": duration,
+            "pid": self.pid,
+            "tid": threading.current_thread().ident,
+            "args": args or {},
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def flush(self):
+        """Write the kept events to disk, readers never see a partial file"""
+        with self._lock:
+            data = {
+                "traceEvents": list(self.events),
+                "displayTimeUnit": "ms",
+            }
+        atomic_write(self.path, json.dumps(data).encode("utf-8"))
+
+    def clear(self):
+        with self._lock:
+            self.events.clear()